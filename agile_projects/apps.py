@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class AgileProjectsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "agile_projects"
+
+    def ready(self):
+        # Подключаем настройку каждого нового соединения с SQLite (PRAGMA)
+        from agile_projects import db  # noqa: F401
+        # Проверка настроек кэша ответов (manage.py check)
+        from agile_projects import checks  # noqa: F401
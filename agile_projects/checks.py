@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from agile_projects.response_cache import is_enabled
+
+
+@register()
+def check_response_cache(app_configs, **kwargs):
+    # Кэш ответов на бэкенде в памяти процесса отключается (см. response_cache.is_enabled)
+    if settings.RESPONSE_CACHE_ALIAS and not is_enabled():
+        return [
+            Warning(
+                'The response cache is disabled: RESPONSE_CACHE_ALIAS uses a per-process cache backend.',
+                hint='Use a cache shared by all workers (DatabaseCache, Redis or Memcached).',
+                id='agile_projects.W001',
+            ),
+        ]
+    return []
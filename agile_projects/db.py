@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.management import call_command
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+
+
+def apply_sqlite_pragmas(connection, pragmas: dict):
+    """
+    Выполняет PRAGMA на соединении SQLite. Порядок важен: busy_timeout - первым,
+    чтобы переключение в WAL не упало сразу с "database is locked".
+    """
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+
+
+@receiver(connection_created, dispatch_uid='sqlite_pragmas')
+def configure_sqlite_connection(sender, connection, **kwargs):
+    # Профиль SQLITE_PRAGMAS (settings.py) применяется к каждому новому соединению
+    if connection.vendor == 'sqlite' and settings.SQLITE_PRAGMAS:
+        apply_sqlite_pragmas(connection, settings.SQLITE_PRAGMAS)
+
+
+@receiver(post_migrate, dispatch_uid='create_cache_tables')
+def create_cache_tables(sender, using, **kwargs):
+    # Таблица DatabaseCache (кэш ответов) не создается миграциями - создаем ее после migrate,
+    # иначе первая же запись упала бы на сбросе поколения. Повторные вызовы ничего не делают.
+    call_command('createcachetable', database=using, verbosity=0)
@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+
+from django.http import StreamingHttpResponse
+
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+def to_primitive(value):
+    # datetime/date -> ISO 8601, остальные значения без изменений
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def iter_ndjson(rows, fields):
+    """
+    Генератор строк NDJSON: один JSON объект на строку.
+    """
+    for row in rows:
+        yield json.dumps(
+            {field: to_primitive(value) for field, value in zip(fields, row)},
+            ensure_ascii=False,
+        ) + '\n'
+
+
+def iter_csv(rows, fields):
+    """
+    Генератор строк CSV с заголовком. Списки (например, теги) склеиваются через ';'.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value
+
+    writer.writerow(fields)
+    yield flush()
+
+    for row in rows:
+        writer.writerow([
+            ';'.join(value) if isinstance(value, list) else to_primitive(value)
+            for value in row
+        ])
+        yield flush()
+
+
+def iter_export(rows, fields, export_format):
+    if export_format == 'csv':
+        return iter_csv(rows, fields)
+    return iter_ndjson(rows, fields)
+
+
+def streaming_export_response(rows, fields, export_format, filename):
+    """
+    Потоковый ответ: строки формируются по мере чтения из базы,
+    поэтому память не зависит от размера таблицы.
+    """
+    response = StreamingHttpResponse(
+        iter_export(rows, fields, export_format),
+        content_type=EXPORT_FORMATS[export_format],
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{export_format}"'
+
+    return response
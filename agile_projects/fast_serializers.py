@@ -0,0 +1,87 @@
+from functools import lru_cache
+
+from django.utils import timezone
+from rest_framework import serializers
+
+
+def datetime_to_representation(value, current_timezone):
+    # То же, что DateTimeField.to_representation в DRF (ISO 8601, UTC -> 'Z')
+    if not value:
+        return None
+
+    value = value.astimezone(current_timezone).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+@lru_cache(maxsize=128)
+def compile_row(spec):
+    """
+    Компилирует функцию "строка values() -> dict ответа" под конкретный набор полей.
+    spec - кортеж (имя в ответе, ключ values(), конвертер или None).
+    Вместо цикла по полям на каждой строке получается один литерал dict.
+    Конвертер вызывается как converter(value, current_timezone).
+    """
+    namespace = {}
+    items = []
+
+    for index, (name, lookup, converter) in enumerate(spec):
+        value = f'row[{lookup!r}]'
+        if converter is not None:
+            namespace[f'convert_{index}'] = converter
+            value = f'convert_{index}({value}, current_timezone)'
+        items.append(f'{name!r}: {value}')
+
+    exec(f"def row_to_dict(row, current_timezone):\n    return {{{', '.join(items)}}}\n", namespace)
+    return namespace['row_to_dict']
+
+
+class ValuesSerializer:
+    """
+    Быстрая сериализация только для чтения на основе QuerySet.values().
+    Нет объектов моделей и поле-за-полем to_representation: каждая строка
+    превращается в dict одной заранее скомпилированной функцией.
+    Вывод должен совпадать с соответствующим ModelSerializer (см. benchmark_serializers).
+
+    fields - {имя в ответе: (ключ values(), конвертер или None)} в порядке ответа.
+    """
+    fields = {}
+
+    def __init__(self, fields=None, exclude=None):
+        errors = {}
+        for option, names in (('fields', fields), ('exclude', exclude)):
+            unknown = sorted(set(names or []) - set(self.fields))
+            if unknown:
+                errors[option] = [f'Unknown field: {name}' for name in unknown]
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        self.selected = [
+            name for name in self.fields
+            if (not fields or name in fields) and name not in (exclude or [])
+        ]
+        self.row_to_dict = compile_row(
+            tuple((name, *self.fields[name]) for name in self.selected)
+        )
+
+    def get_lookups(self, queryset):
+        lookups = [self.fields[name][0] for name in self.selected]
+
+        # Поля сортировки и id нужны keyset пагинации для курсора следующей страницы
+        lookups.extend(
+            field.lstrip('-') for field in (queryset.query.order_by or queryset.model._meta.ordering)
+            if isinstance(field, str) and '__' not in field
+        )
+        lookups.append('id')
+
+        return list(dict.fromkeys(lookups))
+
+    def values(self, queryset):
+        return queryset.values(*self.get_lookups(queryset))
+
+    def serialize(self, rows):
+        row_to_dict = self.row_to_dict
+        # Текущий часовой пояс берем один раз: get_current_timezone() дорогой на каждой строке
+        current_timezone = timezone.get_current_timezone()
+        return [row_to_dict(row, current_timezone) for row in rows]
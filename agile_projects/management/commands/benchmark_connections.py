@@ -0,0 +1,127 @@
+import io
+import statistics
+import threading
+import time
+from wsgiref.util import setup_testing_defaults
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+
+def get_profiles(database: dict) -> dict:
+    """
+    Профили сравнения: новое соединение на каждый запрос (CONN_MAX_AGE=0),
+    постоянные соединения с проверкой перед запросом и, для PostgreSQL
+    с DB_POOL, пул psycopg.
+    """
+    persistent_age = database.get('CONN_MAX_AGE') or 60
+    options = {key: value for key, value in database.get('OPTIONS', {}).items() if key != 'pool'}
+
+    profiles = {
+        'per-request': {**database, 'CONN_MAX_AGE': 0, 'OPTIONS': options},
+        'persistent': {**database, 'CONN_MAX_AGE': persistent_age, 'CONN_HEALTH_CHECKS': True, 'OPTIONS': options},
+    }
+    if database.get('OPTIONS', {}).get('pool'):
+        profiles['pooled'] = {**database, 'CONN_MAX_AGE': 0}
+
+    return profiles
+
+
+class Command(BaseCommand):
+    help = (
+        'Нагрузка на список задач через WSGI обработчик (полный цикл запроса, '
+        'включая открытие/закрытие соединений): p50/p99 без постоянных соединений, '
+        'с CONN_MAX_AGE + CONN_HEALTH_CHECKS и с пулом (PostgreSQL, DB_POOL).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=4, help='Параллельных воркеров')
+        parser.add_argument('--requests', type=int, default=250, help='Запросов на воркер')
+        parser.add_argument('--path', default='/api/v1/tasks/?page_size=20', help='Адрес запроса')
+
+    def handle(self, *args, **options):
+        handler = WSGIHandler()
+        database = connections.settings['default']
+
+        opened = [0]
+        lock = threading.Lock()
+
+        def count_connection(sender, connection, **kwargs):
+            if connection.alias == 'default':
+                with lock:
+                    opened[0] += 1
+
+        connection_created.connect(count_connection)
+
+        try:
+            for profile, profile_settings in get_profiles(database).items():
+                connections.close_all()
+                connections.settings['default'] = profile_settings
+                opened[0] = 0
+
+                timings = self.run(handler, options)
+                self.report(profile, timings, opened[0])
+        finally:
+            connection_created.disconnect(count_connection)
+            connections.close_all()
+            connections.settings['default'] = database
+
+    def request(self, handler, path: str) -> float:
+        path, _, query = path.partition('?')
+        environ = {'PATH_INFO': path, 'QUERY_STRING': query, 'REQUEST_METHOD': 'GET'}
+        setup_testing_defaults(environ)
+        environ['wsgi.input'] = io.BytesIO()
+        environ['wsgi.errors'] = io.StringIO()
+
+        statuses = []
+        started = time.perf_counter()
+        response = handler(environ, lambda status, headers, exc_info=None: statuses.append(status))
+        try:
+            b''.join(response)
+        finally:
+            response.close() # request_finished: здесь Django закрывает просроченные соединения
+        elapsed = time.perf_counter() - started
+
+        if not statuses[0].startswith('200'):
+            raise CommandError(f'GET {path} returned {statuses[0]}')
+        return elapsed
+
+    def run(self, handler, options):
+        timings = []
+        errors = []
+        lock = threading.Lock()
+
+        def worker():
+            # Каждый поток - отдельный воркер со своими соединениями
+            local = []
+            try:
+                for _ in range(options['requests']):
+                    local.append(self.request(handler, options['path']))
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connections.close_all()
+            with lock:
+                timings.extend(local)
+
+        threads = [threading.Thread(target=worker) for _ in range(options['threads'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+        return timings
+
+    def report(self, profile, timings, opened):
+        timings.sort()
+        p50 = statistics.median(timings) * 1000
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000
+
+        self.stdout.write(
+            f'{profile:>12}: p50 {p50:.2f} ms, p99 {p99:.2f} ms, '
+            f'{len(timings)} requests, {opened} connections opened'
+        )
@@ -0,0 +1,151 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+import django
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+BENCHMARK_ALIAS = 'benchmark'
+
+# Профили сравнения: SQLite по умолчанию (rollback journal, DEFERRED транзакции,
+# ожидание блокировки 5 с) и рабочий профиль из settings.py
+PROFILES = ('baseline', 'tuned')
+
+
+def get_database_settings(path: str, profile: str) -> dict:
+    database = {**settings.DATABASES['default'], 'NAME': path}
+    if profile == 'baseline':
+        database['OPTIONS'] = {}
+    return database
+
+
+def run_benchmark_worker(role: str, path: str, profile: str, duration: float, results):
+    """
+    Процесс-воркер (как отдельный воркер gunicorn): в течение duration секунд
+    пишет задачи или читает список задач. Вся работа идет с временной базой:
+    она подставляется вместо 'default', чтобы туда же писали и обработчики сигналов.
+    """
+    django.setup()
+
+    from django.db import OperationalError, transaction
+    from apps.tasks.models import Task
+
+    if profile == 'baseline':
+        settings.SQLITE_PRAGMAS = {}
+    connections['default'].close()
+    connections.settings['default'] = get_database_settings(path, profile)
+    del connections['default']
+
+    project_id = 1
+    operations = errors = 0
+    deadline = time.perf_counter() + duration
+    number = 0
+
+    while time.perf_counter() < deadline:
+        try:
+            if role == 'writer':
+                number += 1
+                with transaction.atomic():
+                    Task.objects.create(
+                        name=f'Task {os.getpid()}-{number}',
+                        description='Benchmark task',
+                        project_id=project_id,
+                    )
+            else:
+                # Чтение без transaction.atomic(), как в списочных отображениях:
+                # с transaction_mode=IMMEDIATE atomic() взял бы блокировку записи
+                list(Task.objects.for_list()[:50])
+                Task.objects.count()
+            operations += 1
+        except OperationalError: # database is locked
+            errors += 1
+
+    connections.close_all()
+    results.put((role, operations, errors))
+
+
+class Command(BaseCommand):
+    help = (
+        'Параллельная нагрузка чтения/записи на временную SQLite базу несколькими '
+        'процессами: SQLite по умолчанию против профиля SQLITE_PRAGMAS + BEGIN IMMEDIATE.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=4, help='Читающих процессов')
+        parser.add_argument('--writers', type=int, default=4, help='Пишущих процессов')
+        parser.add_argument('--duration', type=float, default=5.0, help='Длительность замера, сек.')
+
+    def handle(self, *args, **options):
+        directory = tempfile.mkdtemp()
+        template = os.path.join(directory, 'template.sqlite3')
+
+        # Шаблон базы создаем без профиля (в режиме rollback journal),
+        # чтобы каждый прогон начинал с одинакового файла
+        pragmas = settings.SQLITE_PRAGMAS
+        settings.SQLITE_PRAGMAS = {}
+        connections.settings[BENCHMARK_ALIAS] = get_database_settings(template, 'baseline')
+
+        try:
+            call_command('migrate', database=BENCHMARK_ALIAS, verbosity=0)
+            self.seed()
+        finally:
+            connections[BENCHMARK_ALIAS].close()
+            del connections.settings[BENCHMARK_ALIAS]
+            settings.SQLITE_PRAGMAS = pragmas
+
+        try:
+            for profile in PROFILES:
+                path = os.path.join(directory, f'{profile}.sqlite3')
+                shutil.copy(template, path)
+                self.report(profile, self.run(path, profile, options), options['duration'])
+        finally:
+            shutil.rmtree(directory)
+
+    def seed(self):
+        from apps.projects.models import Project
+        from apps.tasks.models import Task
+
+        # bulk_create - без сигналов, которые писали бы в рабочую базу
+        Project.objects.using(BENCHMARK_ALIAS).bulk_create([
+            Project(id=1, name='Benchmark project', description='Benchmark project'),
+        ])
+        Task.objects.using(BENCHMARK_ALIAS).bulk_create(
+            [Task(name=f'Seed task {i}', description='Benchmark task', project_id=1) for i in range(10_000)],
+            batch_size=1000,
+        )
+
+    def run(self, path, profile, options):
+        context = multiprocessing.get_context('spawn') # Чистые процессы, как воркеры gunicorn
+        results = context.Queue()
+        roles = ['reader'] * options['readers'] + ['writer'] * options['writers']
+
+        processes = [
+            context.Process(
+                target=run_benchmark_worker,
+                args=(role, path, profile, options['duration'], results),
+            )
+            for role in roles
+        ]
+        for process in processes:
+            process.start()
+
+        collected = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+        return collected
+
+    def report(self, profile, results, duration):
+        self.stdout.write(self.style.MIGRATE_HEADING(profile))
+        for role in ('reader', 'writer'):
+            operations = sum(ops for name, ops, _ in results if name == role)
+            errors = sum(errs for name, _, errs in results if name == role)
+            self.stdout.write(
+                f'  {role}s: {operations / duration:.0f} ops/s, {errors} "database is locked" errors'
+            )
@@ -0,0 +1,37 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = (
+        'Копирует primary SQLite базу в файлы реплик из DATABASE_REPLICAS '
+        '(локальная замена репликации для проверки ReplicaRouter).'
+    )
+
+    def handle(self, *args, **options):
+        primary = connections['default']
+        if primary.vendor != 'sqlite':
+            raise CommandError('The primary database is not SQLite')
+
+        if not settings.DATABASE_REPLICAS:
+            raise CommandError('DATABASE_REPLICAS is empty')
+
+        for alias in settings.DATABASE_REPLICAS:
+            replica = connections[alias]
+            if replica.vendor != 'sqlite':
+                raise CommandError(f'Replica "{alias}" is not SQLite')
+
+            replica.close()
+            # Online backup API: согласованная копия даже при идущей записи в primary
+            source = sqlite3.connect(primary.settings_dict['NAME'])
+            target = sqlite3.connect(replica.settings_dict['NAME'])
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+                source.close()
+
+            self.stdout.write(self.style.SUCCESS(f'{alias}: copied from {primary.settings_dict["NAME"]}'))
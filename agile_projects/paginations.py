@@ -1,7 +1,166 @@
+import base64
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    Keyset (cursor) пагинация: вместо OFFSET и COUNT(*) страница ищется
+    по значениям полей сортировки последней записи предыдущей страницы.
+    Время ответа не зависит от того, насколько глубоко листает клиент.
+    """
+    page_size = 5
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        # Берем сортировку из queryset (или из Meta.ordering модели) и
+        # добавляем в конец id, чтобы ключ был уникальным
+        ordering = [
+            field for field in (queryset.query.order_by or queryset.model._meta.ordering)
+            if isinstance(field, str)
+        ]
+
+        if not any(field.lstrip('-') == 'id' for field in ordering):
+            descending = bool(ordering) and ordering[-1].startswith('-')
+            ordering.append('-id' if descending else 'id')
+
+        return ordering
+
+    def encode_cursor(self, values) -> str:
+        # isoformat() без усечения микросекунд (в отличие от DjangoJSONEncoder),
+        # иначе записи с близкими дедлайнами терялись бы между страницами
+        raw = json.dumps(
+            [value.isoformat() if hasattr(value, 'isoformat') else value for value in values]
+        ).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    def decode_cursor(self, cursor: str, model, ordering):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if not isinstance(values, list) or len(values) != len(ordering):
+                raise ValueError
+
+            # Приводим значения из JSON обратно к типам полей модели (например, datetime)
+            return [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(ordering, values)
+            ]
+        except (ValueError, TypeError, FieldDoesNotExist, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def build_seek_filter(self, ordering, values) -> Q:
+        # (f1 < v1) OR (f1 = v1 AND f2 < v2) OR ... — с учетом направления каждого поля
+        seek = Q()
+        equal = Q()
+
+        for field, value in zip(ordering, values):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            seek |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+
+        return seek
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = self.get_ordering(queryset)
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.decode_cursor(cursor, queryset.model, self.ordering)
+            queryset = queryset.filter(self.build_seek_filter(self.ordering, values))
+
+        # Запрашиваем на одну запись больше, чтобы узнать, есть ли следующая страница
+        rows = list(queryset[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        # Строка страницы - объект модели или dict из values() (быстрые сериализаторы)
+        last = self.page[-1]
+        if isinstance(last, dict):
+            values = [last[field.lstrip('-')] for field in self.ordering]
+        else:
+            values = [getattr(last, field.lstrip('-')) for field in self.ordering]
+
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.encode_cursor(values),
+        )
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
 
 
 class TasksPagination(pagination.PageNumberPagination):
     page_size = 5
     page_size_query_param = 'page_size'
     max_page_size = 100
+    # Если в запросе есть ?cursor= — переключаемся на keyset пагинацию,
+    # иначе работает обычная постраничная (для старых клиентов)
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+
+        if self.keyset_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            self.keyset.page_size = self.page_size
+            self.keyset.max_page_size = self.max_page_size
+            return self.keyset.paginate_queryset(queryset, request, view)
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+
+        return super().get_paginated_response(data)
+
+
+class ListPagination(KeysetPagination):
+    # Пагинация списков проектов, файлов и тегов (раньше они отдавались целиком)
+    page_size = 50
+    max_page_size = 500
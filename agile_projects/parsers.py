@@ -0,0 +1,48 @@
+import json
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    Парсер NDJSON (один JSON объект на строку). Тело запроса читается
+    построчно из потока и возвращается списком объектов.
+    Ограничения берутся из отображения (view.max_rows, view.max_body_bytes) и
+    проверяются во время чтения: лишние строки и байты не попадают в память.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        view = (parser_context or {}).get('view')
+        max_rows = getattr(view, 'max_rows', None)
+        max_bytes = getattr(view, 'max_body_bytes', None)
+
+        rows = []
+        read = 0
+        number = 0
+
+        while True:
+            # Не больше оставшегося лимита + 1 байт: одна огромная строка тоже не читается целиком
+            line = stream.readline() if max_bytes is None else stream.readline(max_bytes - read + 1)
+            if not line:
+                break
+
+            number += 1
+            read += len(line)
+            if max_bytes is not None and read > max_bytes:
+                raise ParseError(f'NDJSON body exceeds {max_bytes} bytes.')
+
+            line = line.strip()
+            if not line:
+                continue
+
+            if max_rows is not None and len(rows) >= max_rows:
+                raise ParseError(f'At most {max_rows} rows per request.')
+
+            try:
+                rows.append(json.loads(line))
+            except ValueError as exc:
+                raise ParseError(f'NDJSON parse error on line {number}: {exc}')
+
+        return rows
@@ -0,0 +1,36 @@
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson # Необязательная зависимость: в несколько раз быстрее json
+except ImportError:
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON рендерер на orjson (если установлен), иначе - стандартный JSONRenderer DRF.
+    Вывод совпадает с JSONRenderer: компактный JSON в UTF-8.
+    Типы, которых orjson не знает (Decimal, lazy строки и т.п.), отдаются JSONEncoder DRF.
+    """
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Отступы (?indent / Accept: application/json; indent=4) - через стандартный путь
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(
+            data,
+            default=self.encoder.default,
+            # Даты - как в DRF, через JSONEncoder; нестроковые ключи - как в json
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+# renderer_classes списков с быстрыми сериализаторами (ValuesSerializer);
+# остальные отображения используют рендереры DRF по умолчанию
+FAST_RENDERER_CLASSES = [FastJSONRenderer, BrowsableAPIRenderer]
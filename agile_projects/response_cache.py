@@ -0,0 +1,140 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework import status
+from rest_framework.response import Response
+
+from agile_projects.routers import primary_reads
+
+
+# Версионированный (generation) кэш ответов списочных эндпоинтов.
+# Ключ ответа содержит номер поколения каждого пространства имен ('projects', 'tags', ...).
+# Сигналы при изменении данных увеличивают номер поколения, и старые ключи
+# просто перестают использоваться (удалять их не нужно - истекут по таймауту).
+
+KEY_PREFIX = 'response'
+
+# Бэкенды, которые хранят данные в памяти процесса: сброс поколения в одном воркере
+# не виден остальным, и они отдавали бы устаревшие списки. На них кэш не включается.
+PER_PROCESS_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def is_enabled() -> bool:
+    alias = settings.RESPONSE_CACHE_ALIAS
+    return bool(alias) and settings.CACHES[alias]['BACKEND'] not in PER_PROCESS_BACKENDS
+
+
+def get_cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def generation_key(namespace: str) -> str:
+    return f'{KEY_PREFIX}:generation:{namespace}'
+
+
+def get_generations(namespaces) -> dict:
+    """
+    Номера поколений нескольких namespace одним обращением к кэшу (get_many).
+    """
+    cache = get_cache()
+    keys = {generation_key(namespace): namespace for namespace in namespaces}
+    found = cache.get_many(list(keys))
+
+    for key in keys.keys() - found.keys():
+        # Начальное значение по времени: если счетчик был вытеснен из кэша,
+        # новый номер не совпадет ни с одним из старых
+        cache.add(key, time.time_ns(), timeout=None)
+        found[key] = cache.get(key)
+
+    return {namespace: found[key] for key, namespace in keys.items()}
+
+
+def get_generation(namespace: str) -> int:
+    return get_generations([namespace])[namespace]
+
+
+def bump_generation(*namespaces: str):
+    if not is_enabled():
+        return
+
+    def bump():
+        cache = get_cache()
+
+        for namespace in namespaces:
+            try:
+                cache.incr(generation_key(namespace))
+            except ValueError: # Счетчика еще нет в кэше
+                cache.set(generation_key(namespace), time.time_ns(), timeout=None)
+
+    # После фиксации транзакции: иначе параллельный запрос мог бы увидеть новое
+    # поколение раньше новых данных и закэшировать под ним старый ответ
+    transaction.on_commit(bump)
+
+
+def build_cache_key(request, namespaces) -> str:
+    # Параметры запроса нормализуем: порядок параметров и значений не важен
+    params = sorted(
+        (name, sorted(values)) for name, values in request.query_params.lists()
+    )
+    generations = list(get_generations(namespaces).values())
+    # Схема и хост - часть ключа: в ответе абсолютные ссылки (next)
+    raw = json.dumps([request.scheme, request.get_host(), request.path, params, generations])
+
+    return f'{KEY_PREFIX}:{":".join(namespaces)}:{hashlib.sha1(raw.encode()).hexdigest()}'
+
+
+def get_etag(data) -> str:
+    raw = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True, ensure_ascii=False)
+    return f'"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def etag_matches(request, etag: str) -> bool:
+    if_none_match = request.headers.get('If-None-Match', '')
+    return etag in [value.strip() for value in if_none_match.split(',')] or if_none_match.strip() == '*'
+
+
+def cached_response(request, namespaces, build_response) -> Response:
+    """
+    Read-through кэш: при попадании в кэш ответ отдается без запросов к БД,
+    при промахе вызывается build_response() и результат сохраняется.
+    Ответ 200 получает ETag; при совпадении If-None-Match возвращается 304.
+    Без общего для всех воркеров бэкенда (см. is_enabled) ответ не кэшируется.
+    """
+    if not is_enabled():
+        return build_response()
+
+    cache = get_cache()
+    key = build_cache_key(request, namespaces)
+    cached = cache.get(key)
+
+    if cached is None:
+        # Промах собираем из primary: ответ с отставшей реплики остался бы
+        # в кэше под текущим поколением до RESPONSE_CACHE_TIMEOUT
+        with primary_reads():
+            response = build_response()
+        if response.status_code not in (status.HTTP_200_OK, status.HTTP_204_NO_CONTENT):
+            return response # Ошибки не кэшируем
+
+        etag = get_etag(response.data) if response.status_code == status.HTTP_200_OK else None
+        cached = (response.status_code, response.data, etag)
+        cache.set(key, cached, timeout=settings.RESPONSE_CACHE_TIMEOUT)
+
+    status_code, data, etag = cached
+
+    if etag and etag_matches(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data, status=status_code)
+
+    if etag:
+        response['ETag'] = etag
+
+    return response
@@ -0,0 +1,120 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+
+# Состояние текущего запроса: None - чтение с реплик запрещено (по умолчанию),
+# dict - разрешено, пока в запросе не было записи ('pinned' - прикреплен к primary);
+# 'replica' - реплика, выбранная для запроса (COUNT и страница из одного снимка)
+_replica_state = ContextVar('replica_state', default=None)
+
+# Служебные таблицы, которые всегда читаются из primary: счетчики поколений
+# и ответы DatabaseCache не должны отставать от данных (agile_projects/response_cache.py)
+PRIMARY_ONLY_APP_LABELS = {'django_cache'}
+
+
+@contextmanager
+def replica_reads():
+    """
+    Разрешает чтение с реплик внутри блока (см. ReplicaReadMixin).
+    После первой записи все дальнейшие чтения блока идут в primary,
+    чтобы запрос видел собственные изменения (read-after-write).
+    """
+    token = _replica_state.set({'pinned': False, 'replica': None})
+    try:
+        yield
+    finally:
+        _replica_state.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """
+    Чтение из primary внутри блока, даже если запрос читает с реплик.
+    Используется там, где результат переживет запрос (кэш ответов): отставшая
+    реплика не должна попасть в кэш под новым поколением.
+    """
+    state = _replica_state.get()
+    if state is None or state['pinned']:
+        yield
+        return
+
+    state['pinned'] = True
+    try:
+        yield
+    finally:
+        state['pinned'] = False
+
+
+class WeightedRoundRobin:
+    """
+    Плавный взвешенный round-robin (как в nginx): при весах {a: 2, b: 1}
+    последовательность a, b, a, a, b, a... без серий подряд для тяжелого веса.
+    """
+
+    def __init__(self, weights: dict):
+        self.weights = dict(weights)
+        self.current = dict.fromkeys(self.weights, 0)
+        self.total = sum(self.weights.values())
+        self.lock = threading.Lock()
+
+    def next(self) -> str:
+        with self.lock:
+            for alias, weight in self.weights.items():
+                self.current[alias] += weight
+
+            alias = max(self.current, key=self.current.get)
+            self.current[alias] -= self.total
+            return alias
+
+
+class ReplicaRouter:
+    """
+    Роутер primary/реплики. Реплики и их веса - settings.DATABASE_REPLICAS.
+    Чтение уходит на реплику только внутри replica_reads() (GET списков),
+    все остальное, включая любые записи, - в 'default'.
+    """
+
+    def __init__(self):
+        self.balancers = {}
+
+    def get_balancer(self):
+        replicas = {alias: weight for alias, weight in settings.DATABASE_REPLICAS.items() if weight > 0}
+        if not replicas:
+            return None
+
+        key = tuple(sorted(replicas.items()))
+        if key not in self.balancers:
+            self.balancers[key] = WeightedRoundRobin(replicas)
+        return self.balancers[key]
+
+    def db_for_read(self, model, **hints):
+        state = _replica_state.get()
+        if state is None or state['pinned'] or model._meta.app_label in PRIMARY_ONLY_APP_LABELS:
+            return None # Решение по умолчанию - 'default'
+
+        if state['replica'] is None:
+            balancer = self.get_balancer()
+            if balancer is None:
+                return None
+            state['replica'] = balancer.next()
+
+        return state['replica']
+
+    def db_for_write(self, model, **hints):
+        state = _replica_state.get()
+        if state is not None:
+            state['pinned'] = True # Дальше в этом запросе читаем только из primary
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Реплики содержат те же данные, что и primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Схему реплик обновляет репликация (или sync_sqlite_replicas), не migrate
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
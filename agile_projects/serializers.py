@@ -0,0 +1,111 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+class FieldSelectionMixin:
+    """
+    Выбор полей ответа через context['fields'] / context['exclude']
+    (см. ?fields=id,name и ?exclude=description в FieldSelectionViewMixin).
+    Неизвестные поля - ошибка 400, чтобы опечатка не превращалась в пустой ответ.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        selected = self.context.get('fields')
+        excluded = self.context.get('exclude')
+        if not selected and not excluded:
+            return
+
+        errors = {}
+        for option, names in (('fields', selected), ('exclude', excluded)):
+            unknown = sorted(set(names or []) - set(self.fields))
+            if unknown:
+                errors[option] = [f'Unknown field: {name}' for name in unknown]
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        keep = set(selected) if selected else set(self.fields)
+        keep -= set(excluded or [])
+
+        for name in set(self.fields) - keep:
+            self.fields.pop(name)
+
+
+def get_related_columns(field):
+    """
+    Колонки связанной модели, которые нужны полю сериализатора для FK/OneToOne.
+    None - JOIN не нужен (достаточно самого внешнего ключа),
+    [] - нужна вся связанная строка (например, StringRelatedField -> __str__).
+    """
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        return None
+
+    if isinstance(field, serializers.SlugRelatedField):
+        return ['id', field.slug_field]
+
+    if isinstance(field, serializers.ModelSerializer):
+        columns = []
+        for nested in field.fields.values():
+            try:
+                field.Meta.model._meta.get_field(nested.source.split('.')[0])
+            except FieldDoesNotExist:
+                return [] # Метод или свойство - заранее неизвестно, какие колонки нужны
+            columns.append(nested.source.split('.')[0])
+        return columns
+
+    return []
+
+
+def narrow_queryset(queryset, serializer):
+    """
+    Строит план запроса под оставшиеся поля сериализатора: only() по нужным
+    колонкам, select_related только для выбранных FK, prefetch_related только
+    для выбранных M2M. Неиспользуемые большие колонки (description) не читаются.
+    Meta.field_columns позволяет явно указать колонки для поля, если их нельзя вывести
+    (например, {'project': ['project__name']} для StringRelatedField).
+    """
+    model = queryset.model
+    explicit = getattr(getattr(serializer, 'Meta', None), 'field_columns', {})
+
+    only = {model._meta.pk.name}
+    # Поля сортировки нужны и keyset пагинации (курсор следующей страницы)
+    only.update(
+        field.lstrip('-') for field in (queryset.query.order_by or model._meta.ordering)
+        if isinstance(field, str) and '__' not in field and field.lstrip('-') != 'pk'
+    )
+    select_related = []
+    prefetch_related = []
+
+    for name, field in serializer.fields.items():
+        if field.source == '*':
+            return queryset # Поле использует весь объект - сужать нельзя
+
+        source = field.source.split('.')[0]
+        child = getattr(field, 'child_relation', getattr(field, 'child', field))
+
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            continue # Метод модели, свойство или аннотация
+
+        if model_field.many_to_many or model_field.one_to_many:
+            prefetch_related.append(source)
+            continue
+
+        only.add(source)
+
+        if model_field.is_relation:
+            columns = explicit.get(name)
+            if columns is None:
+                columns = get_related_columns(child)
+                columns = None if columns is None else [f'{source}__{column}' for column in columns]
+
+            if columns is not None:
+                select_related.append(source)
+                only.update(columns)
+
+    queryset = queryset.select_related(None).prefetch_related(None)
+    if select_related: # select_related() без аргументов подтянул бы все FK
+        queryset = queryset.select_related(*select_related)
+
+    return queryset.prefetch_related(*prefetch_related).only(*only)
@@ -0,0 +1,110 @@
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from agile_projects.paginations import ListPagination
+from agile_projects.routers import replica_reads
+from agile_projects.serializers import narrow_queryset
+
+
+class ReplicaReadMixin:
+    """
+    Чтение в обработчиках replica_methods идет с реплик (ReplicaRouter),
+    запись и чтение после записи в том же запросе - в primary.
+    """
+    replica_methods = ('GET', 'HEAD')
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in self.replica_methods:
+            return super().dispatch(request, *args, **kwargs)
+
+        with replica_reads():
+            return super().dispatch(request, *args, **kwargs)
+
+
+class FieldSelectionViewMixin:
+    """
+    Разреженные наборы полей: ?fields=id,status или ?exclude=description.
+    Сокращает и ответ сериализатора (FieldSelectionMixin), и SQL (only/defer, JOIN'ы).
+    """
+    fields_query_param = 'fields'
+    exclude_query_param = 'exclude'
+
+    def get_field_selection(self) -> dict:
+        selection = {}
+
+        for option, param in (('fields', self.fields_query_param), ('exclude', self.exclude_query_param)):
+            value = self.request.query_params.get(param, '')
+            names = [name.strip() for name in value.split(',') if name.strip()]
+            if names:
+                selection[option] = names
+
+        return selection
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context.update(self.get_field_selection())
+        return context
+
+    def select_fields(self, queryset, serializer_class):
+        # Без ?fields= / ?exclude= остается заранее подобранный план запроса
+        selection = self.get_field_selection()
+        if not selection:
+            return queryset
+
+        return narrow_queryset(queryset, serializer_class(context=selection))
+
+
+class MaterializedListAPIView(FieldSelectionViewMixin, APIView):
+    """
+    Базовое отображение списка: queryset вычисляется ровно один раз (одна страница),
+    а 204 или 200 решается по уже полученным строкам - без отдельного exists().
+    Поддерживает пагинацию (?cursor=, ?page_size=) и выбор полей (?fields=, ?exclude=).
+    """
+    serializer_class = None
+    # Быстрый путь (ValuesSerializer): values() вместо объектов моделей и ModelSerializer
+    fast_serializer_class = None
+    pagination_class = ListPagination
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def get_serializer_class(self):
+        return self.serializer_class
+
+    def get_fast_serializer_class(self):
+        return self.fast_serializer_class
+
+    def get_serializer_context(self):
+        return {'request': self.request, 'view': self, **self.get_field_selection()}
+
+    def list(self, request: Request) -> Response:
+        serializer_class = self.get_serializer_class()
+        fast_serializer_class = self.get_fast_serializer_class()
+
+        if fast_serializer_class is not None:
+            fast_serializer = fast_serializer_class(**self.get_field_selection())
+            queryset = fast_serializer.values(self.get_queryset())
+        else:
+            fast_serializer = None
+            queryset = self.select_fields(self.get_queryset(), serializer_class)
+
+        paginator = self.pagination_class() if self.pagination_class else None
+        if paginator is not None:
+            rows = paginator.paginate_queryset(queryset, request, view=self)
+        else:
+            rows = list(queryset)
+
+        if not rows: # Пусто - 204 No Content, как и раньше
+            return Response(data=[], status=status.HTTP_204_NO_CONTENT)
+
+        if fast_serializer is not None:
+            data = fast_serializer.serialize(rows)
+        else:
+            data = serializer_class(rows, many=True, context=self.get_serializer_context()).data
+
+        if paginator is not None:
+            return paginator.get_paginated_response(data)
+
+        return Response(data, status=status.HTTP_200_OK)
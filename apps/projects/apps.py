@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ProjectsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.projects"
+
+    def ready(self):
+        # Подключаем обработчики сигналов: очередь обработки новых файлов, сброс кэша
+        # ответов списка проектов и инкрементальные счетчики ProjectStats
+        from apps.projects import receivers  # noqa: F401
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.projects.utils.project_stats import check_project_stats, rebuild_project_stats
+
+
+class Command(BaseCommand):
+    help = (
+        'Сверяет ProjectStats с фактическими данными задач и файлов. '
+        'Завершается с ошибкой при расхождениях; --fix пересчитывает такие проекты.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--project', type=int, action='append', dest='projects',
+            help='Проверить только указанный проект (можно повторять)',
+        )
+        parser.add_argument('--fix', action='store_true', help='Пересчитать проекты с расхождениями')
+
+    def handle(self, *args, **options):
+        mismatches = check_project_stats(options['projects'])
+
+        for project_id, field, stored, actual in mismatches:
+            if field is None:
+                self.stdout.write(f'project {project_id}: stats row is missing')
+            else:
+                self.stdout.write(f'project {project_id}: {field} = {stored}, expected {actual}')
+
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS('Project stats are consistent'))
+            return
+
+        project_ids = {project_id for project_id, *_ in mismatches}
+        if options['fix']:
+            rebuild_project_stats(project_ids)
+            self.stdout.write(self.style.SUCCESS(f'Rebuilt stats for {len(project_ids)} projects'))
+            return
+
+        raise CommandError(f'{len(project_ids)} projects have inconsistent stats')
@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.projects.models import UploadSession
+from apps.projects.utils.chunked_upload import UPLOAD_SESSION_TTL, collect_orphan_temp_files, delete_temp_file
+
+
+class Command(BaseCommand):
+    help = 'Удаляет брошенные (незавершенные) сессии загрузки по частям и их временные файлы.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-age-hours', type=float, default=UPLOAD_SESSION_TTL.total_seconds() / 3600,
+            help='Возраст незавершенной сессии, после которого она считается брошенной, ч.',
+        )
+
+    def handle(self, *args, **options):
+        max_age = timedelta(hours=options['max_age_hours'])
+        abandoned = UploadSession.objects.exclude(status=UploadSession.STATUS_COMPLETED).filter(
+            created_at__lt=timezone.now() - max_age,
+        )
+
+        sessions = 0
+        for session_id in abandoned.values_list('id', flat=True).iterator():
+            # Условие повторяем: сессия могла завершиться, пока шла очистка
+            if abandoned.filter(pk=session_id).delete()[0]:
+                delete_temp_file(session_id)
+                sessions += 1
+
+        live = UploadSession.objects.exclude(status=UploadSession.STATUS_COMPLETED).values_list('id', flat=True)
+        orphans = collect_orphan_temp_files(list(live), max_age)
+
+        self.stdout.write(self.style.SUCCESS(f'Removed {sessions} upload sessions and {orphans} orphan temp files'))
@@ -0,0 +1,39 @@
+import os
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.projects.models import FileBlob
+from apps.projects.utils.blob_storage import collect_orphan_files
+
+
+class Command(BaseCommand):
+    help = 'Удаляет из хранилища blob файлы, на которые больше не ссылается ни один ProjectFile.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Только показать, что будет удалено')
+
+    def handle(self, *args, **options):
+        removed = freed = 0
+
+        for blob_id in FileBlob.objects.filter(files__isnull=True).values_list('id', flat=True).iterator():
+            with transaction.atomic():
+                # Повторная проверка под блокировкой: blob мог снова получить ссылку
+                # (blob_reference держит ту же блокировку до создания ProjectFile)
+                blob = FileBlob.objects.select_for_update().filter(pk=blob_id).first()
+                if blob is None or blob.files.exists():
+                    continue
+
+                if not options['dry_run']:
+                    blob.delete()
+                    if os.path.exists(blob.path):
+                        os.remove(blob.path)
+
+            removed += 1
+            freed += blob.size
+
+        orphans, orphans_size = collect_orphan_files(dry_run=options['dry_run'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Removed {removed} blobs ({freed} bytes) and {orphans} orphan files ({orphans_size} bytes)'
+        ))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.projects.utils.project_stats import rebuild_project_stats
+
+
+class Command(BaseCommand):
+    help = 'Полностью пересчитывает материализованные счетчики ProjectStats.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--project', type=int, action='append', dest='projects',
+            help='Пересчитать только указанный проект (можно повторять)',
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = rebuild_project_stats(options['projects'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt stats for {rebuilt} projects'))
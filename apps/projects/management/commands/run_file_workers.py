@@ -0,0 +1,44 @@
+import multiprocessing
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from apps.projects.utils.file_jobs import run_worker
+
+
+class Command(BaseCommand):
+    help = 'Запускает пул процессов, выполняющих фоновую обработку загруженных файлов (очередь FileJob).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=2, help='Количество процессов')
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Пауза при пустой очереди, сек.')
+        parser.add_argument('--once', action='store_true', help='Завершиться, когда очередь опустеет')
+
+    def handle(self, *args, **options):
+        if options['workers'] <= 1:
+            processed = run_worker('worker-1', options['poll_interval'], options['once'])
+            self.stdout.write(self.style.SUCCESS(f'Processed {processed} jobs'))
+            return
+
+        connections.close_all()  # Дочерние процессы откроют собственные соединения
+
+        processes = [
+            multiprocessing.Process(
+                target=run_worker,
+                args=(f'worker-{number}', options['poll_interval'], options['once']),
+                name=f'file-worker-{number}',
+            )
+            for number in range(1, options['workers'] + 1)
+        ]
+
+        for process in processes:
+            process.start()
+
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
+
+        self.stdout.write(self.style.SUCCESS(f'{len(processes)} workers stopped'))
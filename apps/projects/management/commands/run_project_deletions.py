@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.projects.models import ProjectDeletion
+from apps.projects.utils.project_delete import claim_project_deletion, run_project_deletion
+
+
+class Command(BaseCommand):
+    help = 'Выполняет фоновые удаления больших проектов (очередь ProjectDeletion) пачками.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None, help='Строк в одной транзакции')
+        parser.add_argument('--sleep', type=float, default=None, help='Пауза между пачками, сек.')
+        parser.add_argument('--poll-interval', type=float, default=5.0, help='Пауза при пустой очереди, сек.')
+        parser.add_argument('--once', action='store_true', help='Завершиться, когда очередь опустеет')
+
+    def handle(self, *args, **options):
+        while True:
+            deletion = claim_project_deletion()
+
+            if deletion is None:
+                if options['once']:
+                    return
+                time.sleep(options['poll_interval'])
+                continue
+
+            self.stdout.write(f'Deleting project {deletion.project_id} ({deletion.total_tasks} tasks)')
+            run_project_deletion(deletion, options['batch_size'], options['sleep'])
+
+            deletion.refresh_from_db()
+            style = self.style.SUCCESS if deletion.status == ProjectDeletion.STATUS_DONE else self.style.ERROR
+            self.stdout.write(style(
+                f'Project {deletion.project_id}: {deletion.status}, '
+                f'{deletion.deleted_tasks} tasks and {deletion.deleted_file_links} file links deleted'
+            ))
@@ -0,0 +1,106 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def enqueue_existing_files(apps, schema_editor):
+    # Уже загруженные файлы тоже ставим в очередь обработки
+    ProjectFile = apps.get_model("projects", "ProjectFile")
+    FileJob = apps.get_model("projects", "FileJob")
+    db_alias = schema_editor.connection.alias
+
+    FileJob.objects.using(db_alias).bulk_create(
+        FileJob(project_file_id=file_id)
+        for file_id in ProjectFile.objects.using(db_alias).values_list("id", flat=True)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0005_file_blobs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectFileMetadata",
+            fields=[
+                (
+                    "project_file",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="metadata",
+                        serialize=False,
+                        to="projects.projectfile",
+                    ),
+                ),
+                ("sha256", models.CharField(max_length=64)),
+                ("row_count", models.PositiveIntegerField(blank=True, null=True)),
+                ("text", models.TextField(blank=True)),
+                ("processed_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="projectfile",
+            name="processing_status",
+            field=models.CharField(
+                choices=[
+                    ("PENDING", "Pending"),
+                    ("DONE", "Done"),
+                    ("FAILED", "Failed"),
+                ],
+                default="PENDING",
+                max_length=10,
+            ),
+        ),
+        migrations.CreateModel(
+            name="FileJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("QUEUED", "Queued"),
+                            ("RUNNING", "Running"),
+                            ("DONE", "Done"),
+                            ("FAILED", "Failed"),
+                        ],
+                        default="QUEUED",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("locked_by", models.CharField(blank=True, max_length=100)),
+                ("locked_at", models.DateTimeField(blank=True, null=True)),
+                ("error", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "project_file",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="jobs",
+                        to="projects.projectfile",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(fields=["status", "id"], name="file_job_status_idx")
+                ],
+            },
+        ),
+        migrations.RunPython(enqueue_existing_files, migrations.RunPython.noop),
+    ]
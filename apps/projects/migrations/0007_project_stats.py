@@ -0,0 +1,43 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0006_file_jobs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectStats",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="projects.project",
+                    ),
+                ),
+                ("tasks_count", models.IntegerField(default=0)),
+                ("files_count", models.IntegerField(default=0)),
+                ("new_count", models.IntegerField(default=0)),
+                ("in_progress_count", models.IntegerField(default=0)),
+                ("pending_count", models.IntegerField(default=0)),
+                ("blocked_count", models.IntegerField(default=0)),
+                ("testing_count", models.IntegerField(default=0)),
+                ("closed_count", models.IntegerField(default=0)),
+                ("very_low_priority_count", models.IntegerField(default=0)),
+                ("low_priority_count", models.IntegerField(default=0)),
+                ("medium_priority_count", models.IntegerField(default=0)),
+                ("high_priority_count", models.IntegerField(default=0)),
+                ("critical_priority_count", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
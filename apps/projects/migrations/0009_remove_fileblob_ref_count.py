@@ -0,0 +1,17 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:29
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0008_project_deletion"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="fileblob",
+            name="ref_count",
+        ),
+    ]
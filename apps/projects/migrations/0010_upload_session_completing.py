@@ -0,0 +1,26 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0009_remove_fileblob_ref_count"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="uploadsession",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("PENDING", "Pending"),
+                    ("COMPLETING", "Completing"),
+                    ("COMPLETED", "Completed"),
+                ],
+                default="PENDING",
+                max_length=10,
+            ),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:33
+
+from django.db import migrations
+from django.db.models import Count
+
+from apps.tasks.choices.priorities import Priorities
+from apps.tasks.choices.statuses import Statuses
+
+
+def backfill_project_stats(apps, schema_editor):
+    # Счетчики для проектов, созданных до появления ProjectStats
+    # (та же логика, что compute_project_stats, но на исторических моделях)
+    Project = apps.get_model("projects", "Project")
+    ProjectStats = apps.get_model("projects", "ProjectStats")
+    Task = apps.get_model("tasks", "Task")
+    db_alias = schema_editor.connection.alias
+
+    status_fields = {status.value: f"{status.name.lower()}_count" for status in Statuses}
+    priority_fields = {priority[0]: f"{priority.name.lower()}_priority_count" for priority in Priorities}
+
+    existing = set(ProjectStats.objects.using(db_alias).values_list("project_id", flat=True))
+    stats = {
+        project_id: {"tasks_count": 0, "files_count": 0}
+        for project_id in Project.objects.using(db_alias).values_list("id", flat=True)
+        if project_id not in existing
+    }
+    if not stats:
+        return
+
+    tasks = (
+        Task.objects.using(db_alias)
+        .filter(project_id__in=list(stats), deleted_at__isnull=True)
+        .order_by().values("project_id", "status", "priority").annotate(count=Count("id"))
+    )
+    for row in tasks:
+        counters = stats[row["project_id"]]
+        counters["tasks_count"] += row["count"]
+        for field in (status_fields.get(row["status"]), priority_fields.get(row["priority"])):
+            if field is not None:
+                counters[field] = counters.get(field, 0) + row["count"]
+
+    files = (
+        Project.files.through.objects.using(db_alias)
+        .filter(project_id__in=list(stats))
+        .order_by().values("project_id").annotate(count=Count("id"))
+    )
+    for row in files:
+        stats[row["project_id"]]["files_count"] = row["count"]
+
+    ProjectStats.objects.using(db_alias).bulk_create(
+        [ProjectStats(project_id=project_id, **counters) for project_id, counters in stats.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0010_upload_session_completing"),
+        ("tasks", "0004_task_soft_delete"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_project_stats, migrations.RunPython.noop),
+    ]
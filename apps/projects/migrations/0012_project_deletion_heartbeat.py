@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0011_backfill_project_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectdeletion",
+            name="heartbeat_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0012_project_deletion_heartbeat"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="deleting_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0013_project_deleting"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadsession",
+            name="writing_parts",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -1,2 +1,8 @@
 from .project import *
-from .project_file import *
\ No newline at end of file
+from .file_blob import *
+from .file_job import *
+from .project_deletion import *
+from .project_file import *
+from .project_file_metadata import *
+from .project_stats import *
+from .upload_session import *
@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class FileBlob(models.Model):
+    """
+    Содержимое файла в контентно-адресуемом хранилище (ключ - SHA-256).
+    Одинаковые файлы хранятся на диске один раз, а ProjectFile ссылаются на blob
+    (blob.files); blob без ссылок удаляется командой collect_file_blobs.
+    """
+    # sha256: хеш содержимого (hex), уникален
+    sha256 = models.CharField(max_length=64, unique=True)
+    # size: размер в байтах
+    size = models.BigIntegerField()
+    # path: путь к файлу в хранилище (documents/blobs/ab/cd/<sha256>)
+    path = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.sha256
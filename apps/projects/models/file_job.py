@@ -0,0 +1,40 @@
+from django.db import models
+
+
+class FileJob(models.Model):
+    """
+    Задание очереди фоновой обработки загруженного файла
+    (хеш, извлечение текста, подсчет строк). Выполняется командой run_file_workers.
+    """
+    STATUS_QUEUED = 'QUEUED'
+    STATUS_RUNNING = 'RUNNING'
+    STATUS_DONE = 'DONE'
+    STATUS_FAILED = 'FAILED'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    project_file = models.ForeignKey('ProjectFile', on_delete=models.CASCADE, related_name='jobs')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    # attempts: сколько раз задание уже забирали воркеры
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # locked_by / locked_at: какой воркер и когда забрал задание
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    # error: текст ошибки последней неудачной попытки
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Job {self.pk} for file {self.project_file_id}: {self.status}"
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            # Выборка следующего задания из очереди
+            models.Index(fields=['status', 'id'], name='file_job_status_idx'),
+        ]
@@ -1,5 +1,7 @@
 from django.db import models
 
+from apps.projects.querysets.project_queryset import ProjectManager, ProjectQuerySet
+
 
 class Project(models.Model):
     # name: строковое поле, макс. длина 100, должно быть уникальным
@@ -10,10 +12,21 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     # files: связующее поле "Многие ко Многим" к ProjectFile.
     files = models.ManyToManyField('ProjectFile', related_name='projects')
+    # deleting_at: время постановки в очередь на удаление (run_project_deletions).
+    # Такой проект уже не виден и не принимает изменений, пока удаляется пачками
+    deleting_at = models.DateTimeField(null=True, blank=True)
+
+    # Менеджер по умолчанию с агрегатами (with_counts): без удаляемых проектов
+    objects = ProjectManager()
+    # Все проекты, включая удаляемые (фоновое удаление)
+    all_objects = ProjectQuerySet.as_manager()
 
     @property
     def count_of_files(self):
-        # Динамическое поле, высчитывающее количество файлов для проекта
+        # Динамическое поле, высчитывающее количество файлов для проекта.
+        # Если queryset аннотирован через with_files_count() или with_counts(), дополнительный запрос не нужен.
+        if hasattr(self, 'files_count'):
+            return self.files_count
         return self.files.count()
 
     def __str__(self):
@@ -0,0 +1,39 @@
+from django.db import models
+
+
+class ProjectDeletion(models.Model):
+    """
+    Удаление большого проекта в фоне: задачи и связи с файлами удаляются
+    пачками короткими транзакциями (run_project_deletions), прогресс - в этой записи.
+    project_id - не ForeignKey: запись должна пережить сам проект.
+    """
+    STATUS_QUEUED = 'QUEUED'
+    STATUS_RUNNING = 'RUNNING'
+    STATUS_DONE = 'DONE'
+    STATUS_FAILED = 'FAILED'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    project_id = models.BigIntegerField(db_index=True)
+    project_name = models.CharField(max_length=100)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    # Прогресс: сколько задач было в проекте и сколько уже удалено
+    total_tasks = models.PositiveIntegerField(default=0)
+    deleted_tasks = models.PositiveIntegerField(default=0)
+    deleted_file_links = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    # Обновляется после каждой пачки: RUNNING без отметки дольше HEARTBEAT_TIMEOUT - воркер упал
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Deletion of project {self.project_id}: {self.status}"
+
+    class Meta:
+        ordering = ['id']
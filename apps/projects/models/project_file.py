@@ -2,10 +2,33 @@ from django.db import models
 
 
 class ProjectFile(models.Model):
+    PROCESSING_PENDING = 'PENDING'
+    PROCESSING_DONE = 'DONE'
+    PROCESSING_FAILED = 'FAILED'
+    PROCESSING_CHOICES = [
+        (PROCESSING_PENDING, 'Pending'),
+        (PROCESSING_DONE, 'Done'),
+        (PROCESSING_FAILED, 'Failed'),
+    ]
+
     # file_name: строковое поле, макс. длина 120 символов
     file_name = models.CharField(max_length=120)
     # file_path: поле для загрузки файлов, сохраняется в папке 'documents/'
     file_path = models.FileField(upload_to='documents/')
+    # blob: содержимое файла в контентно-адресуемом хранилище (пусто у старых файлов)
+    blob = models.ForeignKey(
+        'FileBlob',
+        on_delete=models.PROTECT, # Нельзя удалить blob, пока на него есть ссылки
+        related_name='files',
+        null=True,
+        blank=True,
+    )
+    # processing_status: состояние фоновой обработки (см. FileJob и run_file_workers)
+    processing_status = models.CharField(
+        max_length=10,
+        choices=PROCESSING_CHOICES,
+        default=PROCESSING_PENDING,
+    )
     # created_at: дата создания, автозаполняется при создании
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class ProjectFileMetadata(models.Model):
+    """
+    Результаты фоновой обработки файла. Хранятся отдельно от ProjectFile,
+    чтобы списки файлов не читали большие текстовые колонки.
+    """
+    project_file = models.OneToOneField(
+        'ProjectFile',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='metadata',
+    )
+    # sha256: хеш содержимого файла
+    sha256 = models.CharField(max_length=64)
+    # row_count: количество строк данных для .csv/.xlsx (без заголовка)
+    row_count = models.PositiveIntegerField(null=True, blank=True)
+    # text: извлеченный текст для .pdf/.txt/.csv (обрезается до лимита)
+    text = models.TextField(blank=True)
+    processed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Metadata for file {self.project_file_id}"
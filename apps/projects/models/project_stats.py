@@ -0,0 +1,35 @@
+from django.db import models
+
+
+class ProjectStats(models.Model):
+    """
+    Материализованные счетчики проекта. Обновляются инкрементально
+    (F() выражениями) при изменении задач и файлов проекта, см.
+    apps/projects/utils/project_stats.py; полный пересчет - rebuild_project_stats.
+    Учитываются только не удаленные задачи (deleted_at IS NULL).
+    """
+    project = models.OneToOneField(
+        'Project',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats',
+    )
+    tasks_count = models.IntegerField(default=0)
+    files_count = models.IntegerField(default=0)
+    # Количество задач по статусам (Statuses)
+    new_count = models.IntegerField(default=0)
+    in_progress_count = models.IntegerField(default=0)
+    pending_count = models.IntegerField(default=0)
+    blocked_count = models.IntegerField(default=0)
+    testing_count = models.IntegerField(default=0)
+    closed_count = models.IntegerField(default=0)
+    # Количество задач по приоритетам (Priorities)
+    very_low_priority_count = models.IntegerField(default=0)
+    low_priority_count = models.IntegerField(default=0)
+    medium_priority_count = models.IntegerField(default=0)
+    high_priority_count = models.IntegerField(default=0)
+    critical_priority_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Stats for project {self.project_id}"
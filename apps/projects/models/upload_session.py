@@ -0,0 +1,75 @@
+import uuid
+
+from django.db import models
+
+
+class UploadSession(models.Model):
+    """
+    Сессия загрузки файла по частям (init -> parts -> complete).
+    Части пишутся во временный файл по смещениям, поэтому прерванную загрузку
+    можно продолжить, дозагрузив только недостающие части.
+    """
+    STATUS_PENDING = 'PENDING'
+    STATUS_COMPLETING = 'COMPLETING' # Идет проверка хеша и перенос файла в хранилище
+    STATUS_COMPLETED = 'COMPLETED'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_COMPLETING, 'Completing'),
+        (STATUS_COMPLETED, 'Completed'),
+    ]
+
+    # id: UUID, чтобы идентификатор сессии нельзя было угадать
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # file_name: итоговое имя файла
+    file_name = models.CharField(max_length=120)
+    # project: проект, к которому будет привязан файл после завершения загрузки
+    project = models.ForeignKey('Project', on_delete=models.CASCADE, related_name='upload_sessions')
+    # size: полный размер файла в байтах
+    size = models.BigIntegerField()
+    # part_size: размер одной части в байтах (последняя часть может быть меньше)
+    part_size = models.PositiveIntegerField()
+    # sha256: ожидаемый хеш файла от клиента (необязательно) / вычисленный после завершения.
+    # Для файла больше одной части - SHA-256 от хешей частей (chunked_upload.combine_part_hashes)
+    sha256 = models.CharField(max_length=64, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    # writing_parts: сколько частей сейчас пишется во временный файл. Часть забирает
+    # сессию условным UPDATE (только PENDING), complete - только при writing_parts=0,
+    # поэтому файл не меняется, пока переносится в хранилище
+    writing_parts = models.PositiveIntegerField(default=0)
+    # project_file: созданный файл после завершения загрузки
+    project_file = models.ForeignKey('ProjectFile', on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    @property
+    def parts_count(self) -> int:
+        return max(1, -(-self.size // self.part_size))  # Деление с округлением вверх
+
+    def get_part_length(self, number: int) -> int:
+        # Ожидаемая длина части с номером number (нумерация с 1)
+        return min(self.part_size, self.size - (number - 1) * self.part_size)
+
+    def __str__(self):
+        return f"{self.file_name} ({self.status})"
+
+    class Meta:
+        ordering = ['-created_at']
+
+
+class UploadPart(models.Model):
+    """
+    Полученная часть файла. Отдельная строка на каждую часть позволяет
+    параллельно загружать части без гонок при обновлении сессии.
+    """
+    session = models.ForeignKey(UploadSession, on_delete=models.CASCADE, related_name='parts')
+    # number: номер части (с 1)
+    number = models.PositiveIntegerField()
+    size = models.PositiveIntegerField()
+    # sha256: хеш части, вычисленный при записи
+    sha256 = models.CharField(max_length=64)
+
+    def __str__(self):
+        return f"{self.session_id} part {self.number}"
+
+    class Meta:
+        ordering = ['number']
+        unique_together = ('session', 'number')
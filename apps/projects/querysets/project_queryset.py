@@ -0,0 +1,62 @@
+from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.tasks.choices.statuses import Statuses
+
+
+def count_subquery(queryset, outer_field: str):
+    """
+    Коррелированный подзапрос COUNT(*) по связанной таблице.
+    В отличие от нескольких Count() через JOIN, подзапросы не перемножают строки.
+    """
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{outer_field: OuterRef('pk')})
+            .order_by()
+            .values(outer_field)
+            .annotate(count=Count('*'))
+            .values('count')
+        ),
+        Value(0),
+    )
+
+
+class ProjectQuerySet(models.QuerySet):
+    """
+    QuerySet проектов с агрегатами, вычисляемыми в том же SQL запросе.
+    """
+
+    # Модели берем через связи, чтобы не импортировать Task (циклический импорт)
+    def _files_through(self):
+        return self.model._meta.get_field('files').remote_field.through
+
+    def _tasks(self):
+        return self.model._meta.get_field('tasks').related_model.objects
+
+    def with_files_count(self):
+        # Только счетчик файлов (count_of_files в карточке проекта)
+        return self.annotate(files_count=count_subquery(self._files_through().objects.all(), 'project_id'))
+
+    def with_counts(self):
+        open_tasks = self._tasks().exclude(status=Statuses.CLOSED.value)
+
+        return self.with_files_count().annotate(
+            tasks_count=count_subquery(self._tasks().all(), 'project_id'),
+            open_tasks_count=count_subquery(open_tasks, 'project_id'),
+            overdue_tasks_count=count_subquery(
+                open_tasks.filter(deadline__lt=timezone.now()), 'project_id',
+            ),
+        )
+
+
+class ProjectManager(models.Manager.from_queryset(ProjectQuerySet)):
+    """
+    Менеджер по умолчанию: проекты, поставленные в очередь на удаление, не видны
+    (в том числе для выбора проекта при создании задач и загрузке файлов).
+    Все проекты - через Project.all_objects.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleting_at__isnull=True)
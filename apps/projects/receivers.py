@@ -0,0 +1,104 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from agile_projects.response_cache import bump_generation
+from apps.projects.models import Project, ProjectFile, ProjectStats
+from apps.projects.utils.file_jobs import enqueue_file
+from apps.projects.utils.project_stats import (
+    add_files,
+    apply_task_change,
+    get_current_task_state,
+    get_saved_task_state,
+    rebuild_project_stats,
+    remove_tasks,
+)
+from apps.tasks.models import Task
+from apps.tasks.signals import tasks_bulk_deleting, tasks_bulk_saved
+
+
+@receiver(post_save, sender=ProjectFile, dispatch_uid='enqueue_project_file_processing')
+def enqueue_project_file_processing(sender, instance: ProjectFile, created, **kwargs):
+    # Новый файл ставим в очередь фоновой обработки (run_file_workers)
+    if created:
+        enqueue_file(instance)
+
+
+# Сброс кэша ответов списка проектов (agile_projects/response_cache.py)
+
+@receiver([post_save, post_delete], sender=Project, dispatch_uid='response_cache_project')
+@receiver([post_save, post_delete], sender=ProjectFile, dispatch_uid='response_cache_project_file')
+@receiver(m2m_changed, sender=ProjectFile.projects.through, dispatch_uid='response_cache_project_files_m2m')
+def invalidate_projects_response_cache(sender, **kwargs):
+    bump_generation('projects')
+
+
+# Инкрементальное обновление ProjectStats (apps/projects/utils/project_stats.py)
+
+@receiver(post_save, sender=Project, dispatch_uid='project_stats_create')
+def create_project_stats(sender, instance: Project, created, **kwargs):
+    if created:
+        ProjectStats.objects.get_or_create(project=instance)
+
+
+@receiver(pre_save, sender=Task, dispatch_uid='project_stats_task_pre_save')
+def remember_task_state(sender, instance: Task, using, **kwargs):
+    # Состояние до сохранения: новая задача еще ничего не добавила в счетчики.
+    # Task.save выполняется в транзакции, блокировка строки держится до post_save
+    instance._stats_old_state = None if instance._state.adding else get_saved_task_state(instance, using)
+
+
+@receiver(post_save, sender=Task, dispatch_uid='project_stats_task_post_save')
+def update_stats_on_task_save(sender, instance: Task, **kwargs):
+    apply_task_change(getattr(instance, '_stats_old_state', None), get_current_task_state(instance))
+
+
+@receiver(pre_delete, sender=Task, dispatch_uid='project_stats_task_pre_delete')
+def remember_deleted_task_state(sender, instance: Task, using, **kwargs):
+    # Удаление (Collector.delete) уже идет в транзакции - читаем строку под блокировкой
+    instance._stats_old_state = get_saved_task_state(instance, using)
+
+
+@receiver(post_delete, sender=Task, dispatch_uid='project_stats_task_delete')
+def update_stats_on_task_delete(sender, instance: Task, **kwargs):
+    apply_task_change(getattr(instance, '_stats_old_state', None), None)
+
+
+@receiver(tasks_bulk_saved, sender=Task, dispatch_uid='project_stats_tasks_bulk')
+def update_stats_on_tasks_bulk(sender, ids, project_ids=None, **kwargs):
+    # Массовые изменения не дают старых значений - пересчитываем затронутые проекты
+    if project_ids is None:
+        project_ids = set(Task.objects.filter(id__in=ids).values_list('project_id', flat=True))
+    rebuild_project_stats(project_ids)
+
+
+@receiver(tasks_bulk_deleting, sender=Task, dispatch_uid='project_stats_tasks_bulk_delete')
+def update_stats_on_tasks_bulk_delete(sender, ids, using, **kwargs):
+    remove_tasks(ids, using)
+
+
+@receiver(m2m_changed, sender=Project.files.through, dispatch_uid='project_stats_files_m2m')
+def update_stats_on_files_change(sender, instance, action, reverse, pk_set, **kwargs):
+    # Прямая сторона (project.files): instance - Project, pk_set - id файлов;
+    # обратная (file.projects): instance - ProjectFile, pk_set - id проектов.
+    # Уменьшаем до удаления связей и только по реально существующим связям.
+    if action == 'post_add':
+        if reverse:
+            add_files(pk_set, 1)
+        else:
+            add_files([instance.pk], len(pk_set))
+
+    elif action in ('pre_remove', 'pre_clear'):
+        links = sender.objects.filter(**{'projectfile_id' if reverse else 'project_id': instance.pk})
+        if action == 'pre_remove':
+            links = links.filter(**{'project_id__in' if reverse else 'projectfile_id__in': pk_set})
+
+        if reverse:
+            add_files(list(links.values_list('project_id', flat=True)), -1)
+        else:
+            add_files([instance.pk], -links.count())
+
+
+@receiver(pre_delete, sender=ProjectFile, dispatch_uid='project_stats_file_delete')
+def update_stats_on_file_delete(sender, instance: ProjectFile, **kwargs):
+    # Связи с проектами удаляются каскадом без m2m_changed
+    add_files(list(instance.projects.values_list('id', flat=True)), -1)
@@ -0,0 +1,8 @@
+from rest_framework import serializers
+
+
+class BoardQuerySerializer(serializers.Serializer):
+    """
+    Параметры доски проекта: limit - сколько задач показывать в каждой колонке.
+    """
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
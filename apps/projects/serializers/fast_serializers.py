@@ -0,0 +1,26 @@
+from agile_projects.fast_serializers import ValuesSerializer, datetime_to_representation
+
+
+class FastListProjectsSerializer(ValuesSerializer):
+    """
+    Быстрый аналог ListProjectsSerializer для списка проектов.
+    """
+    fields = {
+        'id': ('id', None),
+        'name': ('name', None),
+        'created_at': ('created_at', datetime_to_representation),
+    }
+
+
+class FastListProjectsWithCountsSerializer(FastListProjectsSerializer):
+    """
+    Быстрый аналог ListProjectsWithCountsSerializer.
+    Ожидает queryset, аннотированный через Project.objects.with_counts().
+    """
+    fields = {
+        **FastListProjectsSerializer.fields,
+        'files_count': ('files_count', None),
+        'tasks_count': ('tasks_count', None),
+        'open_tasks_count': ('open_tasks_count', None),
+        'overdue_tasks_count': ('overdue_tasks_count', None),
+    }
@@ -0,0 +1,16 @@
+from rest_framework import serializers
+
+from apps.projects.models import ProjectDeletion
+
+
+class ProjectDeletionSerializer(serializers.ModelSerializer):
+    """
+    Состояние фонового удаления проекта.
+    """
+    class Meta:
+        model = ProjectDeletion
+        fields = (
+            'id', 'project_id', 'project_name', 'status',
+            'total_tasks', 'deleted_tasks', 'deleted_file_links',
+            'error', 'created_at', 'started_at', 'heartbeat_at', 'finished_at',
+        )
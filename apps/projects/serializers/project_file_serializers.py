@@ -1,21 +1,23 @@
 from rest_framework import serializers
 
+from agile_projects.serializers import FieldSelectionMixin # Выбор полей через ?fields=
 from apps.projects.models import ProjectFile
-from apps.projects.utils.upload_file_helper import check_extension, create_file_path, check_file_size, save_file
+from apps.projects.utils.blob_storage import blob_reference, hash_uploaded_file, write_chunks
+from apps.projects.utils.upload_file_helper import check_extension, check_file_size
 
 
-class ListProjectFileSerializer(serializers.ModelSerializer):
+class ListProjectFileSerializer(FieldSelectionMixin, serializers.ModelSerializer):
     """
     Сериализатор для отображения краткой информации о всех файлах.
     """
-    project = serializers.PrimaryKeyRelatedField(many=True, read_only=True) # Добавим, чтобы увидеть ID связанных проектов
+    project = serializers.PrimaryKeyRelatedField(source='projects', many=True, read_only=True) # Добавим, чтобы увидеть ID связанных проектов
                                                                             # или StringRelatedField, чтобы увидеть их строковое представление.
                                                                             # По умолчанию ManyToMany не отображается так просто.
                                                                             # Если просто `project`, то DRF попытается взять `__str__` или `pk`.
                                                                             # В данном случае, ManyToManyField будет отображаться как список PK по умолчанию.
     class Meta:
         model = ProjectFile
-        fields = ['id', 'file_name', 'project']
+        fields = ['id', 'file_name', 'project', 'processing_status']
 
 
 class CreateProjectFileSerializer(serializers.ModelSerializer):
@@ -48,10 +50,6 @@ class CreateProjectFileSerializer(serializers.ModelSerializer):
         return value
 
     def create(self, validated_data):  # Переопределяем метод create для обработки загрузки файла
-        # Получаем имя файла из валидированных данных
-        file_name = validated_data['file_name']
-        file_path = create_file_path(file_name=file_name)  # Создаем путь для сохранения файла
-
         # raw_file - это сам файл, переданный через request.FILES.
         # Мы передаем его в сериализатор через `context` в представлении.
         raw_file = self.context.get('raw_file')
@@ -60,11 +58,15 @@ class CreateProjectFileSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("No file content provided.")
 
         if check_file_size(file=raw_file): # Проверяем размер файла
-            save_file(file_path=file_path, file_content=raw_file) # Сохраняем файл
+            # Сохраняем файл в контентно-адресуемое хранилище.
+            # Если такой же файл уже загружался, повторной записи на диск не будет.
+            sha256 = hash_uploaded_file(raw_file)
 
-            validated_data['file_path'] = file_path # Добавляем путь файла в validated_data
+            with blob_reference(sha256, raw_file.size, write_chunks(raw_file.chunks)) as blob:
+                validated_data['blob'] = blob
+                validated_data['file_path'] = blob.path # Добавляем путь файла в validated_data
 
-            project_file = ProjectFile.objects.create(**validated_data)
+                project_file = ProjectFile.objects.create(**validated_data)
 
             return project_file
         else:  # Если файл слишком большой
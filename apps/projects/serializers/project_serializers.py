@@ -1,8 +1,11 @@
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
+from agile_projects.serializers import FieldSelectionMixin # Выбор полей через ?fields=
 from apps.projects.models.project import Project # Импортируем нашу модель Project
 
 
-class ListProjectsSerializer(serializers.ModelSerializer):
+class ListProjectsSerializer(FieldSelectionMixin, serializers.ModelSerializer):
     """
     Сериализатор для отображения краткой информации о всех проектах.
     """
@@ -12,10 +15,31 @@ class ListProjectsSerializer(serializers.ModelSerializer):
         fields = ('id', 'name', 'created_at')
 
 
+class ListProjectsWithCountsSerializer(ListProjectsSerializer):
+    """
+    Сериализатор списка проектов со счетчиками файлов и задач.
+    Ожидает queryset, аннотированный через Project.objects.with_counts().
+    """
+    files_count = serializers.IntegerField(read_only=True)
+    tasks_count = serializers.IntegerField(read_only=True)
+    open_tasks_count = serializers.IntegerField(read_only=True)
+    overdue_tasks_count = serializers.IntegerField(read_only=True)
+
+    class Meta(ListProjectsSerializer.Meta):
+        fields = ListProjectsSerializer.Meta.fields + (
+            'files_count', 'tasks_count', 'open_tasks_count', 'overdue_tasks_count',
+        )
+
+
 class CreateProjectSerializer(serializers.ModelSerializer):
     """
     Сериализатор для создания нового проекта.
     """
+    # Имя уникально среди всех проектов, включая удаляемые в фоне (их скрывает Project.objects)
+    name = serializers.CharField(
+        max_length=100,
+        validators=[UniqueValidator(queryset=Project.all_objects.all())],
+    )
     # created_at должно быть только для чтения, так как оно заполняется автоматически
     created_at = serializers.DateTimeField(read_only=True)
 
@@ -37,7 +61,7 @@ class CreateProjectSerializer(serializers.ModelSerializer):
         return value
 
 
-class DetailProjectSerializer(serializers.ModelSerializer):
+class DetailProjectSerializer(FieldSelectionMixin, serializers.ModelSerializer):
     """
     Сериализатор для детального отображения одного проекта.
     """
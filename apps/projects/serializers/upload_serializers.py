@@ -0,0 +1,48 @@
+from rest_framework import serializers
+
+from apps.projects.models import Project, UploadSession
+from apps.projects.serializers.project_file_serializers import CreateProjectFileSerializer
+from apps.projects.utils.chunked_upload import MAX_CHUNKED_UPLOAD_SIZE, UPLOAD_PART_SIZE
+
+
+class CreateUploadSessionSerializer(serializers.ModelSerializer):
+    """
+    Сериализатор для создания сессии загрузки файла по частям.
+    """
+    project_id = serializers.PrimaryKeyRelatedField(
+        source='project',
+        queryset=Project.objects.all(),
+    )
+    size = serializers.IntegerField(min_value=1, max_value=MAX_CHUNKED_UPLOAD_SIZE)
+    sha256 = serializers.RegexField(r'^[0-9a-f]{64}$', required=False)
+
+    class Meta:
+        model = UploadSession
+        fields = ['file_name', 'project_id', 'size', 'sha256']
+
+    def validate_file_name(self, value: str):
+        # Те же правила, что и для обычной загрузки (ASCII, разрешенные расширения)
+        return CreateProjectFileSerializer().validate_file_name(value)
+
+    def create(self, validated_data):
+        validated_data['part_size'] = UPLOAD_PART_SIZE
+        return super().create(validated_data)
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """
+    Сериализатор для отображения состояния сессии загрузки.
+    received_parts позволяет клиенту продолжить прерванную загрузку.
+    """
+    parts_count = serializers.IntegerField(read_only=True)
+    received_parts = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadSession
+        fields = [
+            'id', 'file_name', 'project', 'size', 'part_size', 'parts_count',
+            'received_parts', 'sha256', 'status', 'project_file',
+        ]
+
+    def get_received_parts(self, obj: UploadSession) -> list[int]:
+        return list(obj.parts.values_list('number', flat=True))
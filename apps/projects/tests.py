@@ -1,3 +1,670 @@
-from django.test import TestCase
+import io
+import json
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+
+from apps.projects.models import FileBlob, FileJob, Project, ProjectDeletion, ProjectFile, ProjectStats, UploadSession
+from apps.projects.serializers.project_file_serializers import CreateProjectFileSerializer
+from apps.projects.utils.chunked_upload import get_temp_path, hash_file
+from apps.projects.utils.file_jobs import LOCK_TIMEOUT, MAX_ATTEMPTS, claim_job, run_job
+from apps.projects.utils.project_delete import (
+    HEARTBEAT_TIMEOUT,
+    claim_project_deletion,
+    queue_project_deletion,
+    run_project_deletion,
+)
+from apps.projects.utils.project_stats import check_project_stats, rebuild_project_stats
+from apps.projects.views.project_views import ProjectListCreateAPIView
+from apps.tasks.choices.statuses import Statuses
+from apps.search.utils.search_backends import get_search_backend
+from apps.tasks.models import Tag, Task
+from apps.tasks.tests import PER_PROCESS_CACHES
+
+
+class FileJobQueueTestCase(TestCase):
+    """
+    Очередь фоновой обработки файлов: брошенные задания и удаленные файлы
+    не должны останавливать воркер или оставлять файлы в PENDING.
+    """
+
+    def setUp(self):
+        self.project_file = ProjectFile.objects.create(file_name='notes.txt', file_path='documents/notes.txt')
+        self.job = self.project_file.jobs.get() # Задание создается сигналом post_save
+
+    def test_exhausted_stale_job_is_failed(self):
+        FileJob.objects.filter(pk=self.job.pk).update(
+            status=FileJob.STATUS_RUNNING,
+            attempts=MAX_ATTEMPTS,
+            locked_at=timezone.now() - LOCK_TIMEOUT - timedelta(minutes=1),
+        )
+
+        self.assertIsNone(claim_job('test'))
+
+        self.job.refresh_from_db()
+        self.project_file.refresh_from_db()
+        self.assertEqual(self.job.status, FileJob.STATUS_FAILED)
+        self.assertEqual(self.project_file.processing_status, ProjectFile.PROCESSING_FAILED)
+
+    def test_stale_job_with_attempts_left_is_reclaimed(self):
+        FileJob.objects.filter(pk=self.job.pk).update(
+            status=FileJob.STATUS_RUNNING,
+            attempts=1,
+            locked_at=timezone.now() - LOCK_TIMEOUT - timedelta(minutes=1),
+        )
+
+        job = claim_job('test')
+
+        self.assertEqual(job.pk, self.job.pk)
+        self.assertEqual(job.attempts, 2)
+
+    def test_deleted_file_does_not_stop_worker(self):
+        job = claim_job('test')
+        ProjectFile.objects.filter(pk=self.project_file.pk).delete()
+
+        run_job(job) # Не должно бросать DoesNotExist
+
+
+class TempStorageMixin:
+    # Хранилище blob и временные файлы загрузок - во временной папке теста
+
+    def setUp(self):
+        super().setUp()
+        self.storage_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.storage_dir, ignore_errors=True)
+
+        for target, name in (
+            ('apps.projects.utils.blob_storage.BLOBS_DIR', 'blobs'),
+            ('apps.projects.utils.chunked_upload.UPLOADS_TEMP_DIR', '.uploads'),
+        ):
+            patcher = mock.patch(target, os.path.join(self.storage_dir, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class BlobStorageTestCase(TempStorageMixin, TestCase):
+    """
+    Ссылки на blob - сами ProjectFile: одинаковое содержимое хранится один раз,
+    а blob удаляется сборщиком только после удаления последнего файла.
+    """
+
+    def upload(self, file_name: str, content: bytes) -> ProjectFile:
+        serializer = CreateProjectFileSerializer(
+            data={'file_name': file_name},
+            context={'raw_file': SimpleUploadedFile(file_name, content)},
+        )
+        serializer.is_valid(raise_exception=True)
+        return serializer.save()
+
+    def test_same_content_is_stored_once(self):
+        first = self.upload('a.txt', b'same content')
+        second = self.upload('b.txt', b'same content')
+
+        self.assertEqual(first.blob_id, second.blob_id)
+        self.assertEqual(FileBlob.objects.count(), 1)
+        with open(first.blob.path, 'rb') as f:
+            self.assertEqual(f.read(), b'same content')
+
+    def test_failed_file_create_leaves_no_reference(self):
+        with mock.patch.object(ProjectFile.objects, 'create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.upload('a.txt', b'content')
+
+        # Транзакция blob_reference отменена вместе с записью FileBlob
+        self.assertFalse(FileBlob.objects.exists())
+
+    def test_collect_removes_only_unreferenced_blobs(self):
+        first = self.upload('a.txt', b'shared')
+        second = self.upload('b.txt', b'shared')
+        path = first.blob.path
+
+        first.delete()
+        call_command('collect_file_blobs', stdout=io.StringIO())
+        self.assertTrue(FileBlob.objects.filter(pk=second.blob_id).exists())
+
+        second.delete()
+        call_command('collect_file_blobs', stdout=io.StringIO())
+        self.assertFalse(FileBlob.objects.exists())
+        self.assertFalse(os.path.exists(path))
+
+
+class ChunkedUploadTestCase(TempStorageMixin, TestCase):
+    """
+    Завершение загрузки по частям: неудачная попытка не теряет временный файл,
+    и запрос complete можно повторить.
+    """
+    content = b'chunked upload content'
+
+    def setUp(self):
+        super().setUp()
+        project = Project.objects.create(name='Upload project', description='d' * 40)
+        response = self.client.post(
+            reverse('upload-session-create'),
+            {'file_name': 'data.txt', 'project_id': project.pk, 'size': len(self.content)},
+            content_type='application/json',
+        )
+        self.session_id = response.data['id']
+        self.client.put(
+            reverse('upload-part', args=[self.session_id, 1]),
+            self.content,
+            content_type='application/octet-stream',
+        )
+
+    def complete(self):
+        return self.client.post(reverse('upload-complete', args=[self.session_id]))
+
+    def test_complete(self):
+        response = self.complete()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(os.path.exists(get_temp_path(self.session_id)))
+        with open(ProjectFile.objects.get(pk=response.data['id']).blob.path, 'rb') as f:
+            self.assertEqual(f.read(), self.content)
+
+        self.assertEqual(self.complete().status_code, 409)
+
+    def test_failed_complete_can_be_retried(self):
+        with mock.patch.object(ProjectFile.objects, 'create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.complete()
+
+        self.assertEqual(UploadSession.objects.get(pk=self.session_id).status, UploadSession.STATUS_PENDING)
+        self.assertTrue(os.path.exists(get_temp_path(self.session_id)))
+
+        self.assertEqual(self.complete().status_code, 200)
+
+    def test_complete_waits_for_parts_being_written(self):
+        UploadSession.objects.filter(pk=self.session_id).update(writing_parts=1)
+        self.assertEqual(self.complete().status_code, 409)
+
+        UploadSession.objects.filter(pk=self.session_id).update(writing_parts=0)
+        self.assertEqual(self.complete().status_code, 200)
+
+        # После завершения часть уже не принимается (и не меняет перенесенный файл)
+        response = self.client.put(
+            reverse('upload-part', args=[self.session_id, 1]), self.content, content_type='application/octet-stream',
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(UploadSession.objects.get(pk=self.session_id).writing_parts, 0)
+
+    @mock.patch('apps.projects.utils.chunked_upload.UPLOAD_PART_SIZE', 8)
+    @mock.patch('apps.projects.serializers.upload_serializers.UPLOAD_PART_SIZE', 8)
+    def test_multipart_hash_matches_direct_upload(self):
+        # Хеш из хешей частей совпадает с хешем того же содержимого, загруженного целиком,
+        # поэтому оба файла ссылаются на один blob
+        response = self.client.post(
+            reverse('upload-session-create'),
+            {'file_name': 'parts.txt', 'project_id': Project.objects.get().pk, 'size': len(self.content)},
+            content_type='application/json',
+        )
+        session_id = response.data['id']
+        for number in range(1, response.data['parts_count'] + 1):
+            self.client.put(
+                reverse('upload-part', args=[session_id, number]),
+                self.content[(number - 1) * 8:number * 8],
+                content_type='application/octet-stream',
+            )
+        completed = self.client.post(reverse('upload-complete', args=[session_id]))
+        self.assertEqual(response.data['parts_count'], 3)
+        self.assertEqual(completed.data['sha256'], hash_file(ProjectFile.objects.get(pk=completed.data['id']).blob.path))
+
+        direct = CreateProjectFileSerializer(
+            data={'file_name': 'direct.txt'},
+            context={'raw_file': SimpleUploadedFile('direct.txt', self.content)},
+        )
+        direct.is_valid(raise_exception=True)
+        self.assertEqual(direct.save().blob.sha256, completed.data['sha256'])
+
+    def test_clean_abandoned_sessions(self):
+        UploadSession.objects.filter(pk=self.session_id).update(created_at=timezone.now() - timedelta(days=2))
+
+        call_command('clean_upload_sessions', stdout=io.StringIO())
+
+        self.assertFalse(UploadSession.objects.filter(pk=self.session_id).exists())
+        self.assertFalse(os.path.exists(get_temp_path(self.session_id)))
+
+
+class ProjectQuerySetTestCase(TestCase):
+    """
+    ProjectQuerySet.with_counts(): счетчики файлов, задач, открытых и просроченных задач
+    совпадают с данными и считаются одним запросом; "мягко" удаленные задачи не учитываются.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.project = Project.objects.create(name='Counted project', description='d' * 40)
+        cls.empty = Project.objects.create(name='Empty project', description='d' * 40)
+
+        def create(name, **fields):
+            return Task.objects.create(name=name, description='d' * 60, project=cls.project, **fields)
+
+        create('Open', deadline=now + timedelta(days=1))
+        create('Open overdue', deadline=now - timedelta(days=1))
+        create('Closed overdue', status=Statuses.CLOSED.value, deadline=now - timedelta(days=1))
+        deleted = [
+            create('Deleted open', deadline=now + timedelta(days=1)),
+            create('Deleted overdue', deadline=now - timedelta(days=1)),
+        ]
+        Task.all_objects.filter(pk__in=[task.pk for task in deleted]).soft_delete()
+
+        files = [ProjectFile.objects.create(file_name=f'{i}.txt', file_path=f'documents/{i}.txt') for i in range(2)]
+        cls.project.files.add(*files)
+        cls.empty.files.add(files[0])
+
+    def test_counts(self):
+        with self.assertNumQueries(1):
+            counts = {
+                project.name: (project.files_count, project.tasks_count, project.open_tasks_count,
+                               project.overdue_tasks_count)
+                for project in Project.objects.with_counts()
+            }
+
+        self.assertEqual(counts, {
+            'Counted project': (2, 3, 2, 1),
+            'Empty project': (1, 0, 0, 0),
+        })
+
+    def test_files_count_only(self):
+        project = Project.objects.with_files_count().get(pk=self.project.pk)
+
+        self.assertEqual(project.count_of_files, 2)
+        self.assertFalse(hasattr(project, 'tasks_count'))
+
+
+class ProjectStatsTestCase(TestCase):
+    """
+    Инкрементальные счетчики ProjectStats должны совпадать с полным пересчетом
+    после каждого вида изменения задач и файлов.
+    """
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Stats project', description='d' * 40)
+        self.other = Project.objects.create(name='Other project', description='d' * 40)
+
+    def create_task(self, name='Task', **kwargs):
+        return Task.objects.create(name=name, description='d' * 60, project=self.project, **kwargs)
+
+    def get_stats(self, project=None) -> ProjectStats:
+        return ProjectStats.objects.get(project=project or self.project)
+
+    def assertConsistent(self):
+        self.assertEqual(check_project_stats(), [])
+
+    def test_create_and_status_change(self):
+        task = self.create_task()
+        stats = self.get_stats()
+        self.assertEqual((stats.tasks_count, stats.new_count), (1, 1))
+
+        task.status = Statuses.CLOSED.value
+        task.save()
+        stats = self.get_stats()
+        self.assertEqual((stats.tasks_count, stats.new_count, stats.closed_count), (1, 0, 1))
+        self.assertConsistent()
+
+    def test_stale_instances(self):
+        # Два запроса загрузили задачу до изменений друг друга: второй должен
+        # вычесть состояние из БД, а не загруженное в его экземпляр
+        task = self.create_task()
+        first, second = Task.objects.get(pk=task.pk), Task.objects.get(pk=task.pk)
+
+        first.status = Statuses.CLOSED.value
+        first.save()
+        second.status = Statuses.IN_PROGRESS.value
+        second.save()
+        self.assertConsistent()
+
+        first.delete()
+        self.assertEqual(self.get_stats().tasks_count, 0)
+        self.assertConsistent()
+
+    def test_move_to_other_project(self):
+        task = self.create_task()
+
+        task.project = self.other
+        task.save()
+
+        self.assertEqual(self.get_stats().tasks_count, 0)
+        self.assertEqual(self.get_stats(self.other).tasks_count, 1)
+        self.assertConsistent()
+
+    def test_soft_delete_and_hard_delete(self):
+        first = self.create_task('First')
+        second = self.create_task('Second')
+
+        response = self.client.delete(reverse('task-detail-update-delete', args=[first.pk]))
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.get_stats().tasks_count, 1)
+
+        second.delete()
+        self.assertEqual(self.get_stats().tasks_count, 0)
+        self.assertConsistent()
+
+    def test_files_add_remove_clear(self):
+        files = [ProjectFile.objects.create(file_name=f'{i}.txt', file_path=f'documents/{i}.txt') for i in range(3)]
+
+        self.project.files.add(*files)
+        files[0].projects.add(self.other)
+        self.assertEqual(self.get_stats().files_count, 3)
+        self.assertEqual(self.get_stats(self.other).files_count, 1)
+
+        files[0].projects.remove(self.project)
+        self.assertEqual(self.get_stats().files_count, 2)
+
+        self.project.files.clear()
+        files[0].delete()
+        self.assertEqual(self.get_stats().files_count, 0)
+        self.assertEqual(self.get_stats(self.other).files_count, 0)
+        self.assertConsistent()
+
+    def test_check_and_rebuild(self):
+        self.create_task()
+        ProjectStats.objects.filter(project=self.project).update(tasks_count=10)
+        ProjectStats.objects.filter(project=self.other).delete()
+
+        mismatches = check_project_stats()
+        self.assertIn((self.project.id, 'tasks_count', 10, 1), mismatches)
+        self.assertIn((self.other.id, None, None, None), mismatches)
+
+        self.assertEqual(rebuild_project_stats(), 2)
+        self.assertConsistent()
+
+
+@override_settings(CACHES=PER_PROCESS_CACHES)
+class ProjectListParityTestCase(TestCase):
+    """
+    Список проектов: FastListProjects(WithCounts)Serializer и ModelSerializer дают один и тот же ответ.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(3):
+            project = Project.objects.create(name=f'Parity {i}', description='d' * 40)
+            for j in range(i):
+                Task.objects.create(
+                    name=f'Task {i}-{j}', description='d' * 60, project=project,
+                    deadline=timezone.now() + timedelta(days=j - 1), # Одна просроченная
+                )
+        project.files.add(ProjectFile.objects.create(file_name='notes.txt', file_path='documents/notes.txt'))
+
+    def test_list(self):
+        for params in ({}, {'with_counts': 'true'}, {'with_counts': 'true', 'fields': 'name,tasks_count'}):
+            with self.subTest(params=params):
+                fast = self.client.get(reverse('project-list-create'), params)
+                with mock.patch.object(ProjectListCreateAPIView, 'get_fast_serializer_class', lambda view: None):
+                    slow = self.client.get(reverse('project-list-create'), params)
+
+                self.assertEqual(fast.status_code, 200)
+                self.assertEqual(json.loads(fast.content), json.loads(slow.content))
+
+    def test_detail_counts_only_files(self):
+        # Карточке проекта нужен только count_of_files - подзапросов по задачам нет
+        project = Project.objects.get(name='Parity 2')
+        with CaptureQueriesContext(connections['default']) as queries:
+            response = self.client.get(reverse('project-detail-update-delete', args=[project.pk]))
+
+        self.assertEqual(response.data['count_of_files'], 1)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('tasks_task', queries.captured_queries[0]['sql'])
+
+
+class ProjectBoardTestCase(TestCase):
+    """
+    Доска проекта: задачи сгруппированы по статусам с счетчиками и просроченными,
+    число запросов не зависит от количества задач.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(name='Board project', description='d' * 40)
+        other = Project.objects.create(name='Other board project', description='d' * 40)
+        now = timezone.now()
+
+        def create(name, project=None, **fields):
+            return Task.objects.create(name=name, description='d' * 60, project=project or cls.project, **fields)
+
+        for i in range(4):
+            create(f'New {i}', priority=i % 2 + 2, deadline=now + timedelta(days=4 - i))
+        create('New overdue', deadline=now - timedelta(days=1))
+        create('Blocked', status=Statuses.BLOCKED.value, priority=5, deadline=now + timedelta(days=1))
+        create('Closed overdue', status=Statuses.CLOSED.value, deadline=now - timedelta(days=2))
+        create('Other project task', project=other)
+        deleted = create('Soft deleted', status=Statuses.BLOCKED.value)
+        Task.all_objects.filter(pk=deleted.pk).soft_delete()
+
+    def get_board(self, pk=None, **params):
+        return self.client.get(reverse('project-board', args=[pk or self.project.pk]), params)
+
+    def test_grouping(self):
+        response = self.get_board(limit=3)
+        self.assertEqual(response.status_code, 200)
+        board = response.data
+        columns = {column['status']: column for column in board['columns']}
+
+        self.assertEqual(board['project'], {'id': self.project.id, 'name': 'Board project'})
+        self.assertEqual((board['total'], board['overdue']), (7, 1)) # Закрытая не просрочена
+        self.assertEqual(list(columns), [status.value for status in Statuses])
+        self.assertEqual(
+            {item['priority']: item['count'] for item in board['priorities']},
+            {1: 0, 2: 2, 3: 4, 4: 0, 5: 1},
+        )
+
+        # Первые limit задач колонки - по дедлайну; count - все задачи статуса
+        new = columns[Statuses.NEW.value]
+        self.assertEqual((new['count'], new['overdue']), (5, 1))
+        self.assertEqual([task['name'] for task in new['tasks']], ['New overdue', 'New 3', 'New 2'])
+        self.assertEqual([task['name'] for task in columns[Statuses.BLOCKED.value]['tasks']], ['Blocked'])
+        self.assertEqual(columns[Statuses.TESTING.value], {
+            'status': Statuses.TESTING.value, 'count': 0, 'overdue': 0, 'tasks': [],
+        })
+
+    def test_unknown_project_and_invalid_limit(self):
+        self.assertEqual(self.get_board(pk=10 ** 6).status_code, 404)
+        self.assertEqual(self.get_board(limit=0).status_code, 400)
+
+    def test_query_count(self):
+        # Проект, GROUP BY (status, priority) и ROW_NUMBER() по статусам
+        with self.assertNumQueries(3):
+            self.get_board()
+
+        for i in range(20):
+            Task.objects.create(name=f'Extra {i}', description='d' * 60, project=self.project)
+        with self.assertNumQueries(3):
+            self.get_board()
+
+
+@override_settings(PROJECT_DELETE_INLINE_MAX_TASKS=3, PROJECT_DELETE_PAUSE=0)
+class ProjectDeletionTestCase(TestCase):
+    """
+    Удаление проекта: маленький - сразу (204), большой - в очередь (202) с прогрессом;
+    задание упавшего воркера снова забирается и продолжает счет.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tag = Tag.objects.create(name='deleted with project')
+
+    def create_project(self, tasks: int) -> Project:
+        project = Project.objects.create(name=f'Project {tasks}', description='d' * 40)
+        for i in range(tasks):
+            Task.objects.create(name=f'Task {i}', description='d' * 60, project=project).tags.add(self.tag)
+        project.files.add(ProjectFile.objects.create(file_name='notes.txt', file_path='documents/notes.txt'))
+        return project
+
+    def delete_project(self, project):
+        return self.client.delete(reverse('project-detail-update-delete', args=[project.pk]))
+
+    def test_inline_deletion(self):
+        project = self.create_project(tasks=3)
+
+        response = self.delete_project(project)
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Project.objects.filter(pk=project.pk).exists())
+        self.assertFalse(Task.all_objects.filter(project_id=project.pk).exists())
+        self.assertFalse(ProjectDeletion.objects.exists())
+
+    def test_queued_deletion_with_progress(self):
+        project = self.create_project(tasks=5)
+
+        response = self.delete_project(project)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual((response.data['status'], response.data['total_tasks']), ('QUEUED', 5))
+        # Повторный DELETE возвращает то же задание, проект пока на месте, но уже скрыт
+        self.assertEqual(self.delete_project(project).data['id'], response.data['id'])
+        self.assertTrue(Project.all_objects.filter(pk=project.pk).exists())
+        self.assertFalse(Project.objects.filter(pk=project.pk).exists())
+        self.assertEqual(
+            self.client.get(reverse('project-detail-update-delete', args=[project.pk])).status_code, 404,
+        )
+
+        # Новые задачи в удаляемом проекте не создаются
+        response_create = self.client.post(reverse('task-list-create'), {
+            'name': 'Late task', 'description': 'd' * 60, 'project': project.name,
+        }, content_type='application/json')
+        self.assertEqual(response_create.status_code, 400)
+        self.assertIn('project', response_create.data)
+
+        self.assertEqual(len(get_search_backend().search('Task', 10)), 5)
+
+        deletion = claim_project_deletion()
+        self.assertEqual(deletion.status, ProjectDeletion.STATUS_RUNNING)
+        self.assertIsNone(claim_project_deletion()) # Второй воркер не заберет то же задание
+
+        # Прогресс виден между пачками (в паузе перед следующей пачкой)
+        reported = []
+        def record_progress(seconds):
+            reported.append(ProjectDeletion.objects.get(pk=deletion.pk).deleted_tasks)
+
+        with mock.patch('apps.tasks.utils.purge_tasks.time.sleep', side_effect=record_progress):
+            run_project_deletion(deletion, batch_size=2, pause=0)
+        self.assertEqual(reported, [2, 4])
+
+        detail = self.client.get(reverse('project-deletion-detail', args=[deletion.pk])).data
+        self.assertEqual(detail['status'], 'DONE')
+        self.assertEqual((detail['deleted_tasks'], detail['deleted_file_links']), (5, 1))
+        self.assertIsNotNone(detail['heartbeat_at'])
+        self.assertFalse(Project.all_objects.filter(pk=project.pk).exists())
+        # Связи с тегами и поисковый индекс удалены вместе с задачами
+        self.assertFalse(Task.tags.through.objects.exists())
+        self.assertEqual(get_search_backend().search('Task', 10), [])
+
+    def test_batch_deletes_tasks_without_per_row_signals(self):
+        project = self.create_project(tasks=5)
+        deletion = queue_project_deletion(project)
+
+        # Пачка: SELECT id, блокировка строк для счетчиков, поиск, связи с тегами,
+        # задачи и отметка прогресса - не зависит от числа задач в пачке
+        with CaptureQueriesContext(connections['default']) as queries:
+            run_project_deletion(deletion, batch_size=10, pause=0)
+
+        self.assertFalse(Project.all_objects.filter(pk=project.pk).exists())
+        self.assertEqual(
+            sum(query['sql'].startswith('DELETE FROM "tasks_task"') for query in queries.captured_queries), 1,
+        )
+
+    def test_stale_running_deletion_is_reclaimed(self):
+        project = self.create_project(tasks=5)
+        self.delete_project(project)
+
+        # Воркер удалил 2 задачи и упал, не отметившись дольше HEARTBEAT_TIMEOUT
+        deletion = claim_project_deletion()
+        Task.all_objects.filter(pk__in=Task.all_objects.filter(project_id=project.pk).values('pk')[:2]).delete()
+        ProjectDeletion.objects.filter(pk=deletion.pk).update(
+            deleted_tasks=2, heartbeat_at=timezone.now() - HEARTBEAT_TIMEOUT - timedelta(seconds=1),
+        )
+
+        reclaimed = claim_project_deletion()
+        self.assertEqual(reclaimed.pk, deletion.pk)
+
+        run_project_deletion(reclaimed, batch_size=2, pause=0)
+        reclaimed.refresh_from_db()
+        self.assertEqual((reclaimed.status, reclaimed.deleted_tasks), (ProjectDeletion.STATUS_DONE, 5))
+        self.assertFalse(Project.all_objects.filter(pk=project.pk).exists())
+
+
+class ProjectFileDownloadTestCase(TestCase):
+    """
+    Скачивание файла: 206 для одного диапазона, 416 за пределами файла,
+    несколько диапазонов и устаревший If-Range (ETag или дата) - файл целиком.
+    """
+    content = bytes(range(256)) * 4
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+
+        path = os.path.join(directory, 'report.pdf')
+        with open(path, 'wb') as file:
+            file.write(self.content)
+
+        self.project_file = ProjectFile.objects.create(file_name='отчет "Q1".pdf', file_path=path)
+        self.url = reverse('project-file-download', args=[self.project_file.pk])
+
+    def download(self, **headers):
+        response = self.client.get(self.url, headers=headers)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        return response, body
+
+    def test_full_file_and_content_disposition(self):
+        response, body = self.download()
+
+        self.assertEqual((response.status_code, body), (200, self.content))
+        self.assertEqual(
+            response['Content-Disposition'],
+            "attachment; filename*=utf-8''%D0%BE%D1%82%D1%87%D0%B5%D1%82%20%22Q1%22.pdf",
+        )
+
+    def test_partial_content(self):
+        for header, expected in (
+            ('bytes=0-99', self.content[:100]),
+            ('bytes=1000-', self.content[1000:]),
+            ('bytes=-24', self.content[-24:]),
+            ('bytes=1000-5000', self.content[1000:]), # Конец обрезается по размеру файла
+        ):
+            with self.subTest(range=header):
+                response, body = self.download(Range=header)
+                self.assertEqual((response.status_code, body), (206, expected))
+                self.assertEqual(response['Content-Length'], str(len(expected)))
+                self.assertTrue(response['Content-Range'].endswith(f'/{len(self.content)}'))
+
+    def test_range_not_satisfiable(self):
+        for header in ('bytes=1024-', 'bytes=-0', 'bytes=10-5'):
+            with self.subTest(range=header):
+                response, _ = self.download(Range=header)
+                self.assertEqual(response.status_code, 416)
+                self.assertEqual(response['Content-Range'], f'bytes */{len(self.content)}')
+
+    def test_multiple_ranges_return_whole_file(self):
+        # multipart/byteranges не поддерживается: Range игнорируется (RFC 9110 это допускает)
+        response, body = self.download(Range='bytes=0-9,20-29')
+
+        self.assertEqual((response.status_code, body), (200, self.content))
+
+    def test_if_range(self):
+        etag = self.download()[0]['ETag']
+        last_modified = http_date(int(self.project_file.created_at.timestamp()))
+        stale_date = http_date(int(self.project_file.created_at.timestamp()) - 60)
+
+        for if_range, status_code in (
+            (etag, 206),
+            ('"other"', 200),
+            (f'W/{etag}', 200), # Слабый ETag не подходит для диапазонов
+            (last_modified, 206),
+            (stale_date, 200),
+            ('not a date', 200),
+        ):
+            with self.subTest(if_range=if_range):
+                response, _ = self.download(Range='bytes=0-9', **{'If-Range': if_range})
+                self.assertEqual(response.status_code, status_code)
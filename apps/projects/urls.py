@@ -1,12 +1,32 @@
 from django.urls import path
 
-from apps.projects.views.project_file_views import ListCreateProjectFileAPIView
+from apps.projects.views.project_board_views import ProjectBoardAPIView
+from apps.projects.views.project_deletion_views import ProjectDeletionDetailAPIView
+from apps.projects.views.project_export_views import ProjectExportAPIView
+from apps.projects.views.project_stats_views import ProjectStatsAPIView
+from apps.projects.views.project_file_views import ListCreateProjectFileAPIView, ProjectFileDownloadAPIView
 from apps.projects.views.project_views import *
+from apps.projects.views.upload_views import (
+    UploadSessionCreateAPIView,
+    UploadSessionDetailAPIView,
+    UploadPartAPIView,
+    UploadCompleteAPIView,
+)
 
 urlpatterns = [
     path('', ProjectListCreateAPIView.as_view(), name='project-list-create'),  # api/v1/projects/
     # <int:pk> - это динамическая часть. Django поймет, что сюда нужно подставить
     # число (id проекта) и передать его в наш view как аргумент 'pk'.
     path('<int:pk>/', ProjectDetailUpdateDeleteAPIView.as_view(), name='project-detail-update-delete'), # api/v1/projects/1/
+    path('<int:pk>/board/', ProjectBoardAPIView.as_view(), name='project-board'), # api/v1/projects/1/board/
+    path('<int:pk>/stats/', ProjectStatsAPIView.as_view(), name='project-stats'), # api/v1/projects/1/stats/
+    path('deletions/<int:pk>/', ProjectDeletionDetailAPIView.as_view(), name='project-deletion-detail'), # api/v1/projects/deletions/1/
+    path('export/', ProjectExportAPIView.as_view(), name='project-export'), # api/v1/projects/export/
     path('files/', ListCreateProjectFileAPIView.as_view(), name='project-file-list-create'), # api/v1/projects/files
+    path('files/<int:pk>/download/', ProjectFileDownloadAPIView.as_view(), name='project-file-download'), # api/v1/projects/files/1/download/
+    # Загрузка файла по частям: init -> parts/<N> -> complete
+    path('files/uploads/', UploadSessionCreateAPIView.as_view(), name='upload-session-create'),
+    path('files/uploads/<uuid:pk>/', UploadSessionDetailAPIView.as_view(), name='upload-session-detail'),
+    path('files/uploads/<uuid:pk>/parts/<int:number>/', UploadPartAPIView.as_view(), name='upload-part'),
+    path('files/uploads/<uuid:pk>/complete/', UploadCompleteAPIView.as_view(), name='upload-complete'),
 ]
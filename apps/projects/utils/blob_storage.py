@@ -0,0 +1,153 @@
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.db import IntegrityError, transaction
+
+from apps.projects.models import FileBlob
+from apps.projects.utils.chunked_upload import hash_chunks
+
+
+# Папка контентно-адресуемого хранилища
+BLOBS_DIR = os.path.join("documents", "blobs")
+# Файлы в хранилище без записи FileBlob моложе этого возраста (сек.) сборщик не трогает:
+# это может быть содержимое, которое прямо сейчас сохраняется
+ORPHAN_GRACE_PERIOD = 60 * 60
+
+
+def get_blob_path(sha256: str) -> str:
+    """
+    Путь к blob: documents/blobs/ab/cd/<sha256> (две вложенные папки,
+    чтобы в одной папке не было слишком много файлов).
+    """
+    return os.path.join(BLOBS_DIR, sha256[:2], sha256[2:4], sha256)
+
+
+def lock_blob(sha256: str, size: int) -> FileBlob:
+    """
+    Находит запись FileBlob под блокировкой (select_for_update) или создает ее.
+    Вызывается внутри transaction.atomic(): пока транзакция не зафиксирована,
+    collect_file_blobs не может удалить blob, а после фиксации на него уже ссылается ProjectFile.
+    """
+    blob = FileBlob.objects.select_for_update().filter(sha256=sha256).first()
+
+    if blob is None:
+        try:
+            with transaction.atomic():
+                blob = FileBlob.objects.create(sha256=sha256, size=size, path=get_blob_path(sha256))
+        except IntegrityError:  # Тот же файл параллельно загрузил другой запрос
+            blob = FileBlob.objects.select_for_update().get(sha256=sha256)
+
+    return blob
+
+
+@contextmanager
+def blob_reference(sha256: str, size: int, write_content):
+    """
+    Транзакция, в которой создается ссылка на blob (ProjectFile с blob=...):
+
+        with blob_reference(sha256, size, write_content) as blob:
+            ProjectFile.objects.create(..., blob=blob)
+
+    Ссылки на blob - это сами ProjectFile (blob.files), отдельного счетчика нет,
+    поэтому неудачное создание ProjectFile ничего не "теряет".
+    write_content(path) записывает содержимое в path; вызывается до транзакции,
+    если содержимого нет на диске, и повторно после нее, если сборщик успел удалить
+    файл между записью и появлением ссылки.
+    """
+    path = get_blob_path(sha256)
+
+    if not os.path.exists(path):
+        write_content(path)
+
+    with transaction.atomic():
+        yield lock_blob(sha256, size)
+
+    if not os.path.exists(path):
+        write_content(path)
+
+
+def replace_file(path: str, fill):
+    """
+    Записывает файл через временный файл и атомарный os.replace,
+    чтобы параллельные записи одного и того же содержимого не мешали друг другу.
+    fill(temp_path) создает временный файл.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+
+    try:
+        fill(temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def write_chunks(chunks):
+    """
+    write_content для blob_reference: содержимое из итератора частей.
+    """
+    def write(path: str):
+        def fill(temp_path: str):
+            with open(temp_path, 'wb') as f:
+                for chunk in chunks():
+                    f.write(chunk)
+
+        replace_file(path, fill)
+
+    return write
+
+
+def copy_local_file(file_path: str):
+    """
+    write_content для blob_reference: содержимое из локального файла.
+    Жесткая ссылка вместо копирования, если файл на том же диске;
+    исходный файл остается на месте до успешного завершения.
+    """
+    def write(path: str):
+        def fill(temp_path: str):
+            try:
+                os.link(file_path, temp_path)
+            except OSError:
+                shutil.copyfile(file_path, temp_path)
+
+        replace_file(path, fill)
+
+    return write
+
+
+def hash_uploaded_file(file_content) -> str:
+    """
+    Хеш файла из request.FILES (проход по частям). Та же схема, что у загрузки
+    по частям (chunked_upload.hash_chunks), иначе одинаковое содержимое не совпадет в хранилище.
+    """
+    return hash_chunks(file_content.chunks())
+
+
+def collect_orphan_files(dry_run: bool = False) -> tuple[int, int]:
+    """
+    Удаляет из хранилища файлы без записи FileBlob (их транзакция была отменена)
+    и брошенные временные файлы старше ORPHAN_GRACE_PERIOD.
+    :return: (количество файлов, освобождено байт)
+    """
+    removed = freed = 0
+    deadline = time.time() - ORPHAN_GRACE_PERIOD
+
+    for directory, _, names in os.walk(BLOBS_DIR):
+        known = set(FileBlob.objects.filter(sha256__in=names).values_list('sha256', flat=True))
+
+        for name in names:
+            path = os.path.join(directory, name)
+            if name in known or os.path.getmtime(path) > deadline:
+                continue
+
+            size = os.path.getsize(path)
+            if not dry_run:
+                os.remove(path)
+            removed += 1
+            freed += size
+
+    return removed, freed
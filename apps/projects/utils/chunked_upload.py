@@ -0,0 +1,154 @@
+import hashlib
+import os
+import time
+from datetime import timedelta
+
+
+# Папка для временных файлов незавершенных загрузок
+UPLOADS_TEMP_DIR = os.path.join("documents", ".uploads")
+# Размер одной части загрузки
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+# Максимальный размер файла, загружаемого по частям
+MAX_CHUNKED_UPLOAD_SIZE = 2 * 1024 * 1024 * 1024
+# Размер буфера при чтении запроса и хешировании файла
+READ_BUFFER_SIZE = 1024 * 1024
+# Незавершенные сессии старше этого возраста удаляются командой clean_upload_sessions
+UPLOAD_SESSION_TTL = timedelta(hours=24)
+
+
+class PartSizeMismatch(Exception):
+    """
+    Длина полученной части не совпадает с ожидаемой.
+    """
+
+
+def get_temp_path(session_id) -> str:
+    """
+    Путь к временному файлу сессии загрузки.
+    """
+    return os.path.join(UPLOADS_TEMP_DIR, f"{session_id}.part")
+
+
+def create_temp_file(session_id, size: int) -> str:
+    """
+    Создает временный файл нужного размера, в который по смещениям пишутся части.
+    """
+    os.makedirs(UPLOADS_TEMP_DIR, exist_ok=True)
+    temp_path = get_temp_path(session_id)
+
+    with open(temp_path, 'wb') as f:
+        f.truncate(size)  # Разреженный файл: место на диске занимают только записанные части
+
+    return temp_path
+
+
+def write_part(session_id, offset: int, expected_length: int, stream) -> str:
+    """
+    Потоково пишет часть из stream во временный файл по смещению offset (os.pwrite),
+    одновременно вычисляя SHA-256 части. В памяти одновременно не больше READ_BUFFER_SIZE байт.
+    :return: SHA-256 части (hex)
+    """
+    hasher = hashlib.sha256()
+    written = 0
+    fd = os.open(get_temp_path(session_id), os.O_WRONLY)
+
+    try:
+        while written < expected_length:
+            chunk = stream.read(min(READ_BUFFER_SIZE, expected_length - written))
+            if not chunk:
+                break
+
+            os.pwrite(fd, chunk, offset + written)
+            hasher.update(chunk)
+            written += len(chunk)
+
+        # Лишние данные в теле запроса - тоже ошибка
+        if written != expected_length or stream.read(1):
+            raise PartSizeMismatch(f"Expected {expected_length} bytes")
+    finally:
+        os.close(fd)
+
+    return hasher.hexdigest()
+
+
+def combine_part_hashes(part_hashes) -> str:
+    """
+    Хеш содержимого файла, разбитого на части по UPLOAD_PART_SIZE: SHA-256 от подряд
+    идущих SHA-256 частей (как ETag составной загрузки S3). Файл из одной части
+    (до UPLOAD_PART_SIZE) - обычный SHA-256 его содержимого.
+    Для загрузки по частям считается по хешам частей, без повторного чтения файла.
+    """
+    part_hashes = list(part_hashes)
+    if len(part_hashes) == 1:
+        return part_hashes[0]
+    return hashlib.sha256(b''.join(bytes.fromhex(part_hash) for part_hash in part_hashes)).hexdigest()
+
+
+def hash_chunks(chunks) -> str:
+    """
+    Тот же хеш (combine_part_hashes) для содержимого из итератора кусков любой длины:
+    куски режутся на части по UPLOAD_PART_SIZE.
+    """
+    part_hashes = []
+    hasher = hashlib.sha256()
+    filled = 0
+
+    for chunk in chunks:
+        view = memoryview(chunk)
+        while view:
+            piece = view[:UPLOAD_PART_SIZE - filled]
+            hasher.update(piece)
+            filled += len(piece)
+            view = view[len(piece):]
+
+            if filled == UPLOAD_PART_SIZE:
+                part_hashes.append(hasher.hexdigest())
+                hasher = hashlib.sha256()
+                filled = 0
+
+    if filled or not part_hashes: # Неполная последняя часть (или пустой файл)
+        part_hashes.append(hasher.hexdigest())
+
+    return combine_part_hashes(part_hashes)
+
+
+def hash_file(file_path: str) -> str:
+    """
+    Вычисляет хеш содержимого файла (hash_chunks), читая его по частям.
+    """
+    with open(file_path, 'rb') as f:
+        return hash_chunks(iter(lambda: f.read(READ_BUFFER_SIZE), b''))
+
+
+def delete_temp_file(session_id):
+    """
+    Удаляет временный файл сессии, если он есть.
+    """
+    try:
+        os.remove(get_temp_path(session_id))
+    except FileNotFoundError:
+        pass
+
+
+def collect_orphan_temp_files(live_session_ids, older_than: timedelta) -> int:
+    """
+    Удаляет временные файлы, у которых нет незавершенной сессии
+    (например, сессия удалена каскадом вместе с проектом).
+    :return: количество удаленных файлов
+    """
+    if not os.path.isdir(UPLOADS_TEMP_DIR):
+        return 0
+
+    live = {f"{session_id}.part" for session_id in live_session_ids}
+    deadline = time.time() - older_than.total_seconds()
+    removed = 0
+
+    for name in os.listdir(UPLOADS_TEMP_DIR):
+        path = os.path.join(UPLOADS_TEMP_DIR, name)
+        if name in live or os.path.getmtime(path) > deadline:
+            continue
+
+        os.remove(path)
+        removed += 1
+
+    return removed
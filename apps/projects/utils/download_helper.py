@@ -0,0 +1,94 @@
+import hashlib
+import os
+import re
+
+from django.utils.http import parse_http_date_safe
+
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeNotSatisfiable(Exception):
+    """
+    Запрошенный диапазон выходит за пределы файла (416).
+    """
+
+
+def parse_range(header: str, size: int):
+    """
+    Разбирает заголовок Range. Поддерживается один диапазон: bytes=start-end,
+    bytes=start- и bytes=-suffix.
+    :return: (start, end) включительно или None, если заголовок нужно проигнорировать
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match or match.groups() == ('', ''):
+        return None  # Несколько диапазонов или некорректный заголовок - отдаем файл целиком
+
+    first, last = match.groups()
+
+    if not first:  # bytes=-500 - последние 500 байт
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+
+    if start >= size or start > end:
+        raise RangeNotSatisfiable
+
+    return start, end
+
+
+def if_range_matches(if_range: str, etag: str, last_modified: int) -> bool:
+    """
+    Проверяет If-Range: диапазон отдается, только если файл не изменился.
+    Значение - ETag (сильное сравнение, слабый W/ не совпадает никогда) или
+    HTTP дата, которая должна точно совпасть с Last-Modified.
+    """
+    if not if_range:
+        return True
+
+    if_range = if_range.strip()
+    if if_range.startswith(('"', 'W/')):
+        return if_range == etag
+
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def get_file_etag(project_file, file_path: str) -> str:
+    """
+    ETag файла: SHA-256 содержимого из хранилища, а для старых файлов -
+    хеш от размера и времени изменения.
+    """
+    if project_file.blob_id:
+        return f'"{project_file.blob.sha256}"'
+
+    stat = os.stat(file_path)
+    return '"{}"'.format(hashlib.md5(f"{stat.st_size}-{stat.st_mtime_ns}".encode()).hexdigest())
+
+
+class RangeFileWrapper:
+    """
+    Файловый объект, отдающий только диапазон [start, end] исходного файла.
+    """
+    def __init__(self, file, start: int, end: int, block_size=64 * 1024):
+        self.file = file
+        self.remaining = end - start + 1
+        self.block_size = block_size
+        self.file.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+
+        data = self.file.read(min(size, self.block_size))
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
@@ -0,0 +1,152 @@
+import logging
+import os
+import socket
+import time
+import traceback
+from datetime import timedelta
+
+import django
+from django.db import connections, router, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.projects.models import FileJob, ProjectFile
+from apps.projects.utils.file_processing import process_file
+
+
+logger = logging.getLogger(__name__)
+
+# Сколько раз задание может быть взято в работу, прежде чем оно будет помечено FAILED
+MAX_ATTEMPTS = 3
+# Задание в статусе RUNNING дольше этого времени считается брошенным (воркер упал)
+LOCK_TIMEOUT = timedelta(minutes=10)
+
+
+def enqueue_file(project_file: ProjectFile) -> FileJob:
+    return FileJob.objects.create(project_file=project_file)
+
+
+def claimable_jobs():
+    # Задания в очереди и "зависшие" задания упавших воркеров
+    stale = timezone.now() - LOCK_TIMEOUT
+    return FileJob.objects.filter(
+        Q(status=FileJob.STATUS_QUEUED) | Q(status=FileJob.STATUS_RUNNING, locked_at__lt=stale),
+        attempts__lt=MAX_ATTEMPTS,
+    )
+
+
+def fail_exhausted_jobs() -> int:
+    """
+    Брошенные задания, у которых закончились попытки, больше никто не заберет:
+    помечаем их FAILED вместе с файлами, чтобы файлы не оставались PENDING навсегда.
+    """
+    stale = timezone.now() - LOCK_TIMEOUT
+    exhausted = FileJob.objects.filter(
+        status=FileJob.STATUS_RUNNING,
+        locked_at__lt=stale,
+        attempts__gte=MAX_ATTEMPTS,
+    )
+
+    with transaction.atomic():
+        file_ids = list(exhausted.values_list('project_file_id', flat=True))
+        if not file_ids:
+            return 0
+
+        failed = exhausted.update(
+            status=FileJob.STATUS_FAILED,
+            error='Worker did not finish the job (lock timeout)',
+            finished_at=timezone.now(),
+        )
+        ProjectFile.objects.filter(pk__in=file_ids).update(processing_status=ProjectFile.PROCESSING_FAILED)
+
+    return failed
+
+
+def claim_job(worker_name: str):
+    """
+    Забирает следующее задание из очереди так, чтобы два воркера не взяли одно и то же.
+    PostgreSQL/MySQL: SELECT ... FOR UPDATE SKIP LOCKED.
+    SQLite: блокировок строк нет, но записи сериализуются - задание забирается
+    условным UPDATE ... WHERE status = <свободно>, и выигрывает тот, у кого rowcount = 1.
+    """
+    fail_exhausted_jobs()
+
+    connection = connections[router.db_for_write(FileJob)]
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job = claimable_jobs().select_for_update(skip_locked=True).order_by('id').first()
+            if job is None:
+                return None
+
+            job.status = FileJob.STATUS_RUNNING
+            job.locked_by = worker_name
+            job.locked_at = timezone.now()
+            job.attempts += 1
+            job.save(update_fields=['status', 'locked_by', 'locked_at', 'attempts'])
+            return job
+
+    for job_id in claimable_jobs().order_by('id').values_list('id', flat=True)[:10]:
+        claimed = claimable_jobs().filter(pk=job_id).update(
+            status=FileJob.STATUS_RUNNING,
+            locked_by=worker_name,
+            locked_at=timezone.now(),
+            attempts=F('attempts') + 1,
+        )
+        if claimed:
+            return FileJob.objects.get(pk=job_id)
+
+    return None
+
+
+def run_job(job: FileJob):
+    try:
+        project_file = ProjectFile.objects.select_related('blob').get(pk=job.project_file_id)
+    except ProjectFile.DoesNotExist:
+        # Файл удалили после постановки в очередь - обрабатывать нечего
+        FileJob.objects.filter(pk=job.pk).update(
+            status=FileJob.STATUS_FAILED,
+            error='Project file no longer exists',
+            finished_at=timezone.now(),
+        )
+        return
+
+    try:
+        process_file(project_file)
+    except Exception:
+        logger.exception('File job %s failed', job.pk)
+        failed = job.attempts >= MAX_ATTEMPTS
+
+        FileJob.objects.filter(pk=job.pk).update(
+            status=FileJob.STATUS_FAILED if failed else FileJob.STATUS_QUEUED,
+            error=traceback.format_exc(),
+            finished_at=timezone.now() if failed else None,
+        )
+        if failed:
+            ProjectFile.objects.filter(pk=project_file.pk).update(processing_status=ProjectFile.PROCESSING_FAILED)
+        return
+
+    FileJob.objects.filter(pk=job.pk).update(status=FileJob.STATUS_DONE, error='', finished_at=timezone.now())
+    ProjectFile.objects.filter(pk=project_file.pk).update(processing_status=ProjectFile.PROCESSING_DONE)
+
+
+def run_worker(worker_name: str, poll_interval: float, once: bool) -> int:
+    """
+    Цикл воркера: забирает и выполняет задания, пока они есть.
+    once=True - выйти, когда очередь опустеет. Возвращает количество выполненных заданий.
+    """
+    django.setup()  # Нужно при запуске в новом процессе (spawn), в остальных случаях ничего не делает
+    connections.close_all()  # Не используем соединения, унаследованные от родительского процесса
+    worker_name = f"{socket.gethostname()}:{os.getpid()}:{worker_name}"
+    processed = 0
+
+    while True:
+        job = claim_job(worker_name)
+
+        if job is None:
+            if once:
+                return processed
+            time.sleep(poll_interval)
+            continue
+
+        run_job(job)
+        processed += 1
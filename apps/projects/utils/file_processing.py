@@ -0,0 +1,81 @@
+import csv
+from pathlib import Path
+
+from apps.projects.models import ProjectFile, ProjectFileMetadata
+from apps.projects.utils.chunked_upload import hash_file
+
+
+# Максимальная длина сохраняемого извлеченного текста (в символах)
+TEXT_LIMIT = 1_000_000
+
+TEXT_EXTENSIONS = ['.pdf', '.txt', '.csv']
+ROW_COUNT_EXTENSIONS = ['.csv', '.xlsx']
+
+
+def extract_text(file_path: str, extension: str) -> str:
+    """
+    Извлекает текст из .txt/.csv (как есть) и .pdf (если установлен pypdf).
+    """
+    if extension in ('.txt', '.csv'):
+        with open(file_path, encoding='utf-8', errors='replace') as f:
+            return f.read(TEXT_LIMIT)
+
+    if extension == '.pdf':
+        try:
+            from pypdf import PdfReader  # Необязательная зависимость
+        except ImportError:
+            return ''
+
+        parts, length = [], 0
+        for page in PdfReader(file_path).pages:
+            text = page.extract_text() or ''
+            parts.append(text)
+            length += len(text)
+            if length >= TEXT_LIMIT:
+                break
+
+        return '\n'.join(parts)[:TEXT_LIMIT]
+
+    return ''
+
+
+def count_rows(file_path: str, extension: str):
+    """
+    Считает строки данных (без заголовка) в .csv и .xlsx (если установлен openpyxl).
+    """
+    if extension == '.csv':
+        with open(file_path, encoding='utf-8', errors='replace', newline='') as f:
+            return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+
+    if extension == '.xlsx':
+        try:
+            from openpyxl import load_workbook  # Необязательная зависимость
+        except ImportError:
+            return None
+
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            return max((workbook.active.max_row or 0) - 1, 0)
+        finally:
+            workbook.close()
+
+    return None
+
+
+def process_file(project_file: ProjectFile) -> ProjectFileMetadata:
+    """
+    Вычисляет хеш, извлекает текст и считает строки файла, сохраняет результат.
+    """
+    file_path = project_file.file_path.name
+    extension = Path(project_file.file_name).suffix
+
+    sha256 = project_file.blob.sha256 if project_file.blob_id else hash_file(file_path)
+    text = extract_text(file_path, extension) if extension in TEXT_EXTENSIONS else ''
+    row_count = count_rows(file_path, extension) if extension in ROW_COUNT_EXTENSIONS else None
+
+    metadata, _ = ProjectFileMetadata.objects.update_or_create(
+        project_file=project_file,
+        defaults={'sha256': sha256, 'text': text, 'row_count': row_count},
+    )
+
+    return metadata
@@ -0,0 +1,47 @@
+from apps.projects.models import Project
+from apps.tasks.choices.priorities import Priorities
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.models import Task
+from apps.tasks.serializers.fast_serializers import FastListTaskSerializer
+
+
+def build_board(project: Project, limit: int) -> dict:
+    """
+    Канбан-доска проекта за два запроса, независимо от количества задач:
+    1) GROUP BY (status, priority) - счетчики по статусам, приоритетам и просроченные;
+    2) ROW_NUMBER() по статусам - первые limit задач каждой колонки.
+    """
+    tasks = Task.objects.filter(project=project)
+
+    columns = {
+        status.value: {'status': status.value, 'count': 0, 'overdue': 0, 'tasks': []}
+        for status in Statuses
+    }
+    priorities = {priority[0]: 0 for priority in Priorities}
+    total = overdue = 0
+
+    for row in tasks.status_priority_counts():
+        column = columns.setdefault(
+            row['status'], {'status': row['status'], 'count': 0, 'overdue': 0, 'tasks': []},
+        )
+        column['count'] += row['count']
+        column['overdue'] += row['overdue']
+        priorities[row['priority']] = priorities.get(row['priority'], 0) + row['count']
+        total += row['count']
+        overdue += row['overdue']
+
+    # Задачи колонок в формате списка задач (ListTaskSerializer)
+    serializer = FastListTaskSerializer()
+    rows = list(serializer.values(tasks.top_per_status(limit)))
+    for row, task in zip(rows, serializer.serialize(rows)):
+        columns[row['status']]['tasks'].append(task)
+
+    return {
+        'project': {'id': project.id, 'name': project.name},
+        'total': total,
+        'overdue': overdue,
+        'priorities': [
+            {'priority': priority, 'count': count} for priority, count in priorities.items()
+        ],
+        'columns': list(columns.values()),
+    }
@@ -0,0 +1,136 @@
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.projects.models import Project, ProjectDeletion, ProjectStats
+from apps.tasks.models import Task
+from apps.tasks.utils.purge_tasks import delete_in_batches, delete_tasks
+
+
+logger = logging.getLogger(__name__)
+
+# RUNNING задание без отметки воркера дольше этого времени снова забирается из очереди
+HEARTBEAT_TIMEOUT = timedelta(minutes=10)
+
+
+def delete_project_in_batches(project: Project, batch_size=None, pause=None, progress=None):
+    """
+    Удаляет проект без одной большой транзакции: сначала задачи (delete_tasks:
+    вместе со связями с тегами и поисковым индексом, без сигналов на каждую строку)
+    и связи с файлами пачками по batch_size, каждая пачка - своя короткая
+    транзакция, затем сам почти пустой проект.
+    progress(stage, deleted) вызывается после каждой пачки ('tasks' / 'files').
+    """
+    batch_size = batch_size or settings.PROJECT_DELETE_BATCH_SIZE
+    pause = settings.PROJECT_DELETE_PAUSE if pause is None else pause
+
+    # Счетчики проекта больше не нужны: удаляем строку статистики заранее, чтобы
+    # она не держала полуобновленные значения. Вычитание пачек задач из счетчиков
+    # по-прежнему выполняется, но не находит строку (при сбое она пересчитается при чтении)
+    ProjectStats.objects.filter(project_id=project.pk).delete()
+
+    deleted_tasks = 0
+    tasks = Task.all_objects.filter(project_id=project.pk) # Включая "мягко" удаленные
+    for deleted in delete_in_batches(tasks, batch_size, pause, delete=delete_tasks):
+        deleted_tasks += deleted
+        if progress is not None:
+            progress('tasks', deleted_tasks)
+
+    deleted_links = 0
+    links = Project.files.through.objects.filter(project_id=project.pk)
+    for deleted in delete_in_batches(links, batch_size, pause):
+        deleted_links += deleted
+        if progress is not None:
+            progress('files', deleted_links)
+
+    with transaction.atomic():
+        project.delete() # Остались только статистика и сессии загрузки
+
+    return deleted_tasks, deleted_links
+
+
+def should_queue_deletion(project: Project) -> bool:
+    # Большие проекты удаляются в фоне, маленькие - сразу в запросе
+    limit = settings.PROJECT_DELETE_INLINE_MAX_TASKS
+    return Task.all_objects.filter(project_id=project.pk)[:limit + 1].count() > limit
+
+
+@transaction.atomic
+def queue_project_deletion(project: Project) -> ProjectDeletion:
+    # Повторный DELETE того же проекта возвращает уже созданное задание
+    active = ProjectDeletion.objects.filter(
+        project_id=project.pk,
+        status__in=[ProjectDeletion.STATUS_QUEUED, ProjectDeletion.STATUS_RUNNING],
+    ).first()
+    if active is not None:
+        return active
+
+    # Проект скрывается сразу (Project.objects): новые задачи, загрузки и изменения
+    # в нем отклоняются, пока фоновое удаление не дойдет до конца.
+    # save(), а не update(): post_save сбрасывает кэш "имя -> id" проектов
+    if project.deleting_at is None:
+        project.deleting_at = timezone.now()
+        project.save(update_fields=['deleting_at'])
+
+    return ProjectDeletion.objects.create(
+        project_id=project.pk,
+        project_name=project.name,
+        total_tasks=Task.all_objects.filter(project_id=project.pk).count(),
+    )
+
+
+def claimable_deletions():
+    # Задания в очереди и задания упавших воркеров (давно нет отметки heartbeat_at)
+    stale = timezone.now() - HEARTBEAT_TIMEOUT
+    return ProjectDeletion.objects.filter(
+        Q(status=ProjectDeletion.STATUS_QUEUED)
+        | Q(status=ProjectDeletion.STATUS_RUNNING, heartbeat_at__lt=stale)
+    )
+
+
+def claim_project_deletion():
+    # Забираем задание условным UPDATE: при нескольких запущенных командах выиграет одна
+    for deletion_id in claimable_deletions().values_list('id', flat=True)[:10]:
+        now = timezone.now()
+        claimed = claimable_deletions().filter(pk=deletion_id).update(
+            status=ProjectDeletion.STATUS_RUNNING, started_at=now, heartbeat_at=now,
+        )
+        if claimed:
+            return ProjectDeletion.objects.get(pk=deletion_id)
+
+    return None
+
+
+def run_project_deletion(deletion: ProjectDeletion, batch_size=None, pause=None):
+    # Повторный запуск после упавшего воркера продолжает счет уже удаленных строк
+    already_deleted = {'tasks': deletion.deleted_tasks, 'files': deletion.deleted_file_links}
+
+    def progress(stage, deleted):
+        field = 'deleted_tasks' if stage == 'tasks' else 'deleted_file_links'
+        ProjectDeletion.objects.filter(pk=deletion.pk).update(
+            heartbeat_at=timezone.now(), **{field: already_deleted[stage] + deleted},
+        )
+
+    project = Project.all_objects.filter(pk=deletion.project_id).first()
+
+    try:
+        if project is not None:
+            delete_project_in_batches(project, batch_size, pause, progress)
+    except Exception:
+        logger.exception('Project deletion %s failed', deletion.pk)
+        ProjectDeletion.objects.filter(pk=deletion.pk).update(
+            status=ProjectDeletion.STATUS_FAILED,
+            error=traceback.format_exc(),
+            finished_at=timezone.now(),
+        )
+        return
+
+    ProjectDeletion.objects.filter(pk=deletion.pk).update(
+        status=ProjectDeletion.STATUS_DONE,
+        finished_at=timezone.now(),
+    )
@@ -0,0 +1,237 @@
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from apps.projects.models import Project, ProjectFile, ProjectStats
+from apps.tasks.choices.priorities import Priorities
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.models import Task
+
+
+# Колонки ProjectStats для каждого статуса и приоритета
+STATUS_FIELDS = {status.value: f'{status.name.lower()}_count' for status in Statuses}
+PRIORITY_FIELDS = {priority[0]: f'{priority.name.lower()}_priority_count' for priority in Priorities}
+COUNT_FIELDS = ['tasks_count', 'files_count', *STATUS_FIELDS.values(), *PRIORITY_FIELDS.values()]
+
+# Поля задачи, от которых зависят счетчики
+TASK_STATE_FIELDS = ('project_id', 'status', 'priority', 'deleted_at')
+
+
+def get_task_state(values: dict):
+    """
+    Вклад задачи в счетчики: (project_id, status, priority) или None для удаленной задачи.
+    """
+    if values['deleted_at'] is not None:
+        return None
+    return values['project_id'], values['status'], values['priority']
+
+
+def get_current_task_state(task: Task):
+    return get_task_state({field: getattr(task, field) for field in TASK_STATE_FIELDS})
+
+
+def get_saved_task_state(task: Task, using: str):
+    """
+    Состояние задачи в БД до сохранения или удаления. Строка блокируется (select_for_update)
+    до конца транзакции, поэтому параллельное изменение той же задачи дождется ее
+    и вычтет уже новое состояние, а не то, что было загружено в экземпляр.
+    """
+    values = (
+        Task.all_objects.using(using).select_for_update()
+        .filter(pk=task.pk).values(*TASK_STATE_FIELDS).first()
+    )
+    return get_task_state(values) if values else None
+
+
+def add_task(state, delta: int):
+    project_id, status, priority = state
+    changes = {'tasks_count': F('tasks_count') + delta}
+
+    for field in (STATUS_FIELDS.get(status), PRIORITY_FIELDS.get(priority)):
+        if field is not None:
+            changes[field] = F(field) + delta
+
+    # Нет строки статистики - ничего не делаем: она будет пересчитана при чтении
+    ProjectStats.objects.filter(project_id=project_id).update(updated_at=timezone.now(), **changes)
+
+
+def apply_task_change(old_state, new_state):
+    """
+    Инкрементальное обновление при создании, изменении (смена статуса,
+    приоритета, проекта, мягкое удаление) и удалении задачи.
+    UPDATE ... SET x = x + 1 не теряет изменения параллельных запросов.
+    """
+    if old_state == new_state:
+        return
+
+    if old_state is not None:
+        add_task(old_state, -1)
+    if new_state is not None:
+        add_task(new_state, 1)
+
+
+def remove_tasks(ids, using: str):
+    """
+    Вычитает из счетчиков пачку задач перед пакетным удалением (tasks_bulk_deleting):
+    один SELECT под блокировкой строк и один UPDATE на проект вместо UPDATE на каждую задачу.
+    """
+    changes = defaultdict(Counter)
+    states = (
+        Task.all_objects.using(using).select_for_update()
+        .filter(pk__in=ids).values_list(*TASK_STATE_FIELDS)
+    )
+    for values in states:
+        state = get_task_state(dict(zip(TASK_STATE_FIELDS, values)))
+        if state is None: # "Мягко" удаленная задача в счетчиках уже не учтена
+            continue
+
+        project_id, status, priority = state
+        for field in ('tasks_count', STATUS_FIELDS.get(status), PRIORITY_FIELDS.get(priority)):
+            if field is not None:
+                changes[project_id][field] += 1
+
+    for project_id, counters in changes.items():
+        ProjectStats.objects.using(using).filter(project_id=project_id).update(
+            updated_at=timezone.now(),
+            **{field: F(field) - count for field, count in counters.items()},
+        )
+
+
+def add_files(project_ids, delta: int):
+    if project_ids:
+        ProjectStats.objects.filter(project_id__in=project_ids).update(
+            files_count=F('files_count') + delta,
+            updated_at=timezone.now(),
+        )
+
+
+def compute_project_stats(project_ids=None) -> dict:
+    """
+    Полный пересчет счетчиков: один GROUP BY по задачам и один по связям файлов.
+    Возвращает {project_id: {поле: значение}}.
+    """
+    projects = Project.objects.all()
+    if project_ids is not None:
+        projects = projects.filter(id__in=project_ids)
+
+    stats = {project_id: dict.fromkeys(COUNT_FIELDS, 0) for project_id in projects.values_list('id', flat=True)}
+
+    tasks = (
+        Task.objects.filter(project_id__in=list(stats), deleted_at__isnull=True)
+        .order_by().values('project_id', 'status', 'priority').annotate(count=Count('id'))
+    )
+    for row in tasks:
+        counters = stats[row['project_id']]
+        counters['tasks_count'] += row['count']
+        for field in (STATUS_FIELDS.get(row['status']), PRIORITY_FIELDS.get(row['priority'])):
+            if field is not None:
+                counters[field] += row['count']
+
+    files = (
+        ProjectFile.projects.through.objects.filter(project_id__in=list(stats))
+        .order_by().values('project_id').annotate(count=Count('id'))
+    )
+    for row in files:
+        stats[row['project_id']]['files_count'] = row['count']
+
+    return stats
+
+
+# Сколько проектов пересчитывается в одной транзакции
+REBUILD_BATCH_SIZE = 1000
+
+
+def rebuild_project_stats(project_ids=None) -> int:
+    """
+    Пересчитывает и перезаписывает ProjectStats (всех проектов или только указанных).
+    Строки обновляются на месте под блокировкой (select_for_update), а пересчет идет
+    в той же транзакции: параллельный F() инкремент либо уже зафиксирован и попал
+    в пересчет, либо ждет блокировку и применяется поверх новых значений.
+    (SQLite с BEGIN IMMEDIATE просто сериализует такие транзакции.)
+    """
+    projects = Project.objects.order_by('id')
+    if project_ids is not None:
+        projects = projects.filter(id__in=project_ids)
+    ids = list(projects.values_list('id', flat=True))
+
+    # Недостающие строки создаем заранее, отдельной транзакцией: иначе параллельные
+    # инкременты не нашли бы строку и не стали бы ждать ее блокировку
+    ProjectStats.objects.bulk_create(
+        [ProjectStats(project_id=project_id) for project_id in ids],
+        batch_size=REBUILD_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+    rebuilt = 0
+    for start in range(0, len(ids), REBUILD_BATCH_SIZE):
+        with transaction.atomic():
+            rows = list(
+                ProjectStats.objects.select_for_update()
+                .filter(project_id__in=ids[start:start + REBUILD_BATCH_SIZE])
+            )
+            stats = compute_project_stats([row.project_id for row in rows])
+            now = timezone.now()
+
+            for row in rows:
+                for field, value in stats[row.project_id].items():
+                    setattr(row, field, value)
+                row.updated_at = now
+
+            ProjectStats.objects.bulk_update(rows, [*COUNT_FIELDS, 'updated_at'])
+            rebuilt += len(rows)
+
+    return rebuilt
+
+
+def check_project_stats(project_ids=None) -> list:
+    """
+    Сравнивает сохраненные счетчики с пересчитанными.
+    Возвращает список расхождений (project_id, поле, сохранено, фактически);
+    отсутствующая строка ProjectStats - расхождение с полем None.
+    """
+    actual = compute_project_stats(project_ids)
+    stored = {
+        row['project_id']: row
+        for row in ProjectStats.objects.filter(project_id__in=list(actual)).values('project_id', *COUNT_FIELDS)
+    }
+
+    mismatches = []
+    for project_id, counters in actual.items():
+        if project_id not in stored:
+            mismatches.append((project_id, None, None, None))
+            continue
+
+        for field, value in counters.items():
+            if stored[project_id][field] != value:
+                mismatches.append((project_id, field, stored[project_id][field], value))
+
+    return mismatches
+
+
+def get_project_stats(project: Project) -> dict:
+    """
+    Счетчики проекта для дашборда. Просроченные задачи зависят от текущего времени,
+    поэтому не материализуются, а считаются по индексу (project, status, deadline).
+    """
+    stats = ProjectStats.objects.filter(project=project).first()
+    if stats is None: # Строки еще нет (проект создан до появления статистики)
+        rebuild_project_stats([project.id])
+        stats = ProjectStats.objects.get(project=project)
+
+    overdue = (
+        Task.objects.filter(project=project, deleted_at__isnull=True, deadline__lt=timezone.now())
+        .exclude(status=Statuses.CLOSED.value)
+        .count()
+    )
+
+    return {
+        'project': project.id,
+        'tasks_count': stats.tasks_count,
+        'files_count': stats.files_count,
+        'overdue_count': overdue,
+        'statuses': {status: getattr(stats, field) for status, field in STATUS_FIELDS.items()},
+        'priorities': {priority: getattr(stats, field) for priority, field in PRIORITY_FIELDS.items()},
+        'updated_at': stats.updated_at,
+    }
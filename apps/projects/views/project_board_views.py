@@ -0,0 +1,24 @@
+from rest_framework.generics import get_object_or_404
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import HTTP_200_OK
+from rest_framework.views import APIView
+
+from apps.projects.models import Project
+from apps.projects.serializers.board_serializers import BoardQuerySerializer
+from apps.projects.utils.project_board import build_board
+
+
+class ProjectBoardAPIView(APIView):
+    """
+    Канбан-доска проекта: счетчики по статусам, приоритетам, просроченные задачи
+    и первые ?limit= задач каждого статуса (по дедлайну).
+    """
+    def get(self, request: Request, pk) -> Response:
+        serializer = BoardQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        project = get_object_or_404(Project.objects.only('id', 'name'), pk=pk)
+        board = build_board(project, serializer.validated_data['limit'])
+
+        return Response(board, status=HTTP_200_OK)
@@ -0,0 +1,17 @@
+from rest_framework.generics import get_object_or_404
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import HTTP_200_OK
+from rest_framework.views import APIView
+
+from apps.projects.models import ProjectDeletion
+from apps.projects.serializers.project_deletion_serializers import ProjectDeletionSerializer
+
+
+class ProjectDeletionDetailAPIView(APIView):
+    """
+    Прогресс фонового удаления проекта (см. DELETE /api/v1/projects/<id>/ -> 202).
+    """
+    def get(self, request: Request, pk) -> Response:
+        deletion = get_object_or_404(ProjectDeletion, pk=pk)
+        return Response(ProjectDeletionSerializer(deletion).data, status=HTTP_200_OK)
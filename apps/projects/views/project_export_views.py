@@ -0,0 +1,25 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from agile_projects.exports import EXPORT_FORMATS, streaming_export_response
+from apps.projects.models import Project
+
+
+# Колонки экспорта проектов
+PROJECT_EXPORT_FIELDS = ['id', 'name', 'description', 'created_at']
+
+
+class ProjectExportAPIView(APIView):
+    """
+    Потоковый экспорт всех проектов в NDJSON (по умолчанию) или CSV: ?file_format=csv.
+    """
+    def get(self, request: Request):
+        export_format = request.query_params.get('file_format', 'ndjson')
+
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({'file_format': f'Must be one of: {list(EXPORT_FORMATS)}.'})
+
+        rows = Project.objects.order_by('id').values_list(*PROJECT_EXPORT_FIELDS).iterator(chunk_size=2000)
+
+        return streaming_export_response(rows, PROJECT_EXPORT_FIELDS, export_format, filename='projects')
@@ -1,37 +1,50 @@
+import mimetypes
+import os
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, quote_etag
 from rest_framework.generics import get_object_or_404
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.status import HTTP_204_NO_CONTENT, HTTP_200_OK
+from rest_framework.status import HTTP_200_OK
 from rest_framework.views import APIView
 
+from agile_projects.views import MaterializedListAPIView
 from apps.projects.models import ProjectFile, Project
 from apps.projects.serializers.project_file_serializers import ListProjectFileSerializer, CreateProjectFileSerializer
+from apps.projects.utils.download_helper import (
+    RangeFileWrapper,
+    RangeNotSatisfiable,
+    get_file_etag,
+    if_range_matches,
+    parse_range,
+)
+
 
+class ListCreateProjectFileAPIView(MaterializedListAPIView):
+    serializer_class = ListProjectFileSerializer
 
-class ListCreateProjectFileAPIView(APIView):
     # Вспомогательный метод для получения файлов, с возможностью фильтрации по имени проекта
     def get_objects(self, project_name=None):
+        # ID связанных проектов загружаем одним запросом на страницу
+        project_files = ProjectFile.objects.prefetch_related('projects')
+
         if project_name: # Если имя проекта передано...
             # Фильтруем ProjectFile по имени связанного проекта
-            project_files = ProjectFile.objects.filter(projects__name=project_name)
-            return project_files
+            project_files = project_files.filter(projects__name=project_name)
 
-        return ProjectFile.objects.all()
+        return project_files
 
+    def get_queryset(self):
+        # Получаем имя проекта из query параметров
+        return self.get_objects(self.request.query_params.get('project_name'))
 
-    # Метод GET для получения списка всех файлов
-    def get(self, request: Request) -> Response:
-        project_name = request.query_params.get('project_name') # Получаем имя проекта из query параметров
-
-        project_files = self.get_objects(project_name) # Получаем файлы
 
-        if not project_files.exists(): # Если файлов нет, возвращаем 204 No Content
-            return Response(data=[], status=HTTP_204_NO_CONTENT)
-
-        # Сериализуем список файлов с помощью ListProjectFileSerializer
-        serializer = ListProjectFileSerializer(project_files, many=True)
-
-        return Response(data=serializer.data, status=HTTP_200_OK) # Возвращаем данные и статус 200 OK
+    # Метод GET для получения списка файлов (постранично)
+    def get(self, request: Request) -> Response:
+        return self.list(request)
 
     # Метод POST для создания нового файла и привязки его к проекту
     def post(self, request: Request) -> Response:
@@ -63,8 +76,88 @@ class ListCreateProjectFileAPIView(APIView):
 
         return Response(  # Возвращаем сообщение об успехе и статус 200 OK
             data={
-                "message": "File uploaded successfully"
+                "message": "File uploaded successfully",
+                "id": project_file.id,
+                # Обработка файла (хеш, текст, количество строк) выполняется в фоне
+                "processing_status": project_file.processing_status,
             },
             status=HTTP_200_OK
         )
 
+
+class ProjectFileDownloadAPIView(APIView):
+    """
+    Скачивание файла проекта с поддержкой Range (докачка, частичный просмотр PDF),
+    ETag/Last-Modified и ответов 304 Not Modified.
+    Если задан FILE_DOWNLOAD_OFFLOAD ('x-accel-redirect' или 'x-sendfile'),
+    передачу байтов выполняет reverse proxy, а не Python процесс.
+    """
+    def get(self, request: Request, pk: int):
+        project_file = get_object_or_404(ProjectFile.objects.select_related('blob'), pk=pk)
+        file_path = project_file.file_path.name
+
+        if not os.path.isfile(file_path):
+            raise Http404("File not found on disk")
+
+        etag = get_file_etag(project_file, file_path)
+        last_modified = int(project_file.created_at.timestamp()) # HTTP даты - с точностью до секунды
+
+        # If-None-Match / If-Modified-Since -> 304 Not Modified
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        offload = getattr(settings, 'FILE_DOWNLOAD_OFFLOAD', None)
+        if offload:
+            response = self.offload_response(offload, file_path)
+        else:
+            response = self.file_response(request, file_path, etag, last_modified)
+
+        content_type, _ = mimetypes.guess_type(project_file.file_name)
+        response['Content-Type'] = content_type or 'application/octet-stream'
+        # Кавычки и не-ASCII символы в имени экранируются (filename*=utf-8''...)
+        response['Content-Disposition'] = content_disposition_header(True, project_file.file_name)
+        response['ETag'] = quote_etag(etag)
+        response['Last-Modified'] = http_date(last_modified)
+
+        return response
+
+    def file_response(self, request: Request, file_path: str, etag: str, last_modified: int):
+        size = os.path.getsize(file_path)
+        range_header = request.headers.get('Range')
+
+        # If-Range (ETag или дата): файл изменился - отдаем его целиком
+        if not if_range_matches(request.headers.get('If-Range'), etag, last_modified):
+            range_header = None
+
+        try:
+            byte_range = parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+        if byte_range is None:
+            # Файл целиком: FileResponse использует wsgi.file_wrapper (sendfile), если сервер его поддерживает
+            response = FileResponse(open(file_path, 'rb'))
+        else:
+            start, end = byte_range
+            response = FileResponse(RangeFileWrapper(open(file_path, 'rb'), start, end), status=206)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = str(end - start + 1)
+
+        response['Accept-Ranges'] = 'bytes'
+        return response
+
+    def offload_response(self, offload: str, file_path: str):
+        response = HttpResponse()
+
+        if offload == 'x-accel-redirect':
+            # nginx: internal location, например /protected/ -> alias <BASE_DIR>/
+            prefix = getattr(settings, 'FILE_DOWNLOAD_ACCEL_PREFIX', '/protected/')
+            response['X-Accel-Redirect'] = prefix + file_path.replace(os.sep, '/')
+        else:
+            # Apache mod_xsendfile / lighttpd: абсолютный путь к файлу
+            response['X-Sendfile'] = os.path.abspath(file_path)
+
+        return response
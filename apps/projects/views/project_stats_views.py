@@ -0,0 +1,18 @@
+from rest_framework.generics import get_object_or_404
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import HTTP_200_OK
+from rest_framework.views import APIView
+
+from apps.projects.models import Project
+from apps.projects.utils.project_stats import get_project_stats
+
+
+class ProjectStatsAPIView(APIView):
+    """
+    Счетчики проекта для дашборда из материализованной таблицы ProjectStats:
+    задачи по статусам и приоритетам, файлы, просроченные задачи.
+    """
+    def get(self, request: Request, pk) -> Response:
+        project = get_object_or_404(Project.objects.only('id'), pk=pk)
+        return Response(get_project_stats(project), status=HTTP_200_OK)
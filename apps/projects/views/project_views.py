@@ -8,13 +8,30 @@ from rest_framework import status
 from rest_framework.views import APIView
 from django.utils import timezone # Для работы с часовыми поясами
 
+from agile_projects.renderers import FAST_RENDERER_CLASSES
+from agile_projects.response_cache import cached_response
+from agile_projects.views import FieldSelectionViewMixin, MaterializedListAPIView, ReplicaReadMixin
+
 from apps.projects.models.project import Project # Импортируем модель Project
 from apps.projects.serializers.project_serializers import (  # Импортируем наши сериализаторы
     ListProjectsSerializer,
+    ListProjectsWithCountsSerializer,
     CreateProjectSerializer, DetailProjectSerializer
 )
+from apps.projects.serializers.project_deletion_serializers import ProjectDeletionSerializer
+from apps.projects.utils.project_delete import (  # Удаление проекта пачками
+    delete_project_in_batches,
+    queue_project_deletion,
+    should_queue_deletion,
+)
+from apps.projects.serializers.fast_serializers import (  # Быстрые сериализаторы списка (values())
+    FastListProjectsSerializer,
+    FastListProjectsWithCountsSerializer,
+)
+
+class ProjectListCreateAPIView(ReplicaReadMixin, MaterializedListAPIView):
+    renderer_classes = FAST_RENDERER_CLASSES # Рендерер на orjson для списка
 
-class ProjectListCreateAPIView(APIView):
     # Вспомогательный метод для получения объектов Project с возможностью фильтрации по датам
     def get_objects(self, date_from=None, date_to=None):
         if date_from and date_to: # Если обе даты переданы...
@@ -35,27 +52,29 @@ class ProjectListCreateAPIView(APIView):
         return Project.objects.all()
 
 
-    # Метод GET для получения списка всех проектов
-    def get(self, request: Request) -> Response:
-        # Получаем даты из query параметров 'date_from' и 'date_to'
-        date_from = request.query_params.get('date_from')
-        date_to = request.query_params.get('date_to')
+    # ?with_counts=true - добавляем счетчики файлов и задач (в том же SQL запросе)
+    def with_counts(self) -> bool:
+        return self.request.query_params.get('with_counts') in ('true', '1')
 
-        projects = self.get_objects(date_from, date_to) # Получаем проекты с учетом фильтрации
+    def get_queryset(self):
+        # Получаем даты из query параметров 'date_from' и 'date_to'
+        projects = self.get_objects(
+            self.request.query_params.get('date_from'),
+            self.request.query_params.get('date_to'),
+        )
+        return projects.with_counts() if self.with_counts() else projects
 
-        if not projects.exists(): # Если проектов нет, возвращаем 204 No Content
-            return Response(
-                data=[],
-                status=status.HTTP_204_NO_CONTENT
-            )
+    def get_serializer_class(self):
+        return ListProjectsWithCountsSerializer if self.with_counts() else ListProjectsSerializer
 
-        # Сериализуем список проектов с помощью AllProjectsSerializer
-        serializer = ListProjectsSerializer(projects, many=True)
+    def get_fast_serializer_class(self):
+        return FastListProjectsWithCountsSerializer if self.with_counts() else FastListProjectsSerializer
 
-        return Response( # Возвращаем данные и статус 200 OK
-            serializer.data,
-            status=status.HTTP_200_OK,
-        )
+    # Метод GET для получения списка проектов (постранично, один запрос к БД)
+    def get(self, request: Request) -> Response:
+        # Ответ кэшируется; счетчики задач зависят еще и от изменений задач
+        namespaces = ('projects', 'tasks') if self.with_counts() else ('projects',)
+        return cached_response(request, namespaces, lambda: self.list(request))
 
 
     # Метод POST для создания нового проекта
@@ -78,23 +97,32 @@ class ProjectListCreateAPIView(APIView):
         )
 
 
-class ProjectDetailUpdateDeleteAPIView(APIView):
+class ProjectDetailUpdateDeleteAPIView(FieldSelectionViewMixin, APIView):
     """
     Отображение для получения, обновления и удаления ОДНОГО проекта.
     """
-    def get_object(self, pk):
+    def get_object(self, pk, with_files_count=False):
         """
         Вспомогательный метод для получения одного объекта Project по его pk (primary key).
         Если объект не найден, вернет ошибку 404 Not Found.
+        with_files_count=True - count_of_files вычисляется в том же запросе.
         """
-        return get_object_or_404(Project, pk=pk)
+        queryset = Project.objects.with_files_count() if with_files_count else Project.objects.all()
+        if self.request.method == 'GET':
+            queryset = self.select_fields(queryset, DetailProjectSerializer)
+        return get_object_or_404(queryset, pk=pk)
 
     def get(self, request: Request, pk) -> Response:
         """
         Обрабатывает GET-запрос. Получает один проект по pk.
         """
-        project = self.get_object(pk=pk) # 1. Находим проект
-        serializer = DetailProjectSerializer(project) # 2. Передаем его в сериализатор
+        # ?fields= / ?exclude= сокращают и ответ, и колонки в SELECT
+        selection = self.get_field_selection()
+        fields = DetailProjectSerializer(context=selection).fields
+
+        # 1. Находим проект (счетчик файлов считаем, только если он запрошен)
+        project = self.get_object(pk=pk, with_files_count='count_of_files' in fields)
+        serializer = DetailProjectSerializer(project, context=selection) # 2. Передаем его в сериализатор
         return Response(serializer.data, status=status.HTTP_200_OK) # 3. Возвращаем данные
 
     def put(self, request: Request, pk) -> Response:
@@ -120,8 +148,17 @@ class ProjectDetailUpdateDeleteAPIView(APIView):
         """
         Обрабатывает DELETE-запрос для удаления проекта.
         """
-        project = self.get_object(pk=pk)# 1. Находим проект
-        project.delete() # 2. Удаляем его из базы данных
+        # 1. Находим проект (и уже удаляемый: повторный DELETE вернет его задание)
+        project = get_object_or_404(Project.all_objects.all(), pk=pk)
+
+        # 2. Большой проект удаляется в фоне (run_project_deletions):
+        # возвращаем 202 и задание, по которому можно следить за прогрессом
+        if project.deleting_at is not None or should_queue_deletion(project):
+            deletion = queue_project_deletion(project)
+            return Response(ProjectDeletionSerializer(deletion).data, status=status.HTTP_202_ACCEPTED)
+
+        # 2. Небольшой проект удаляем сразу, но тоже пачками короткими транзакциями
+        delete_project_in_batches(project)
         # 3. Возвращаем успешный ответ без данных
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -0,0 +1,162 @@
+import io
+import os
+
+from django.db.models import F
+from rest_framework import status
+from rest_framework.generics import get_object_or_404
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.projects.models import ProjectFile, UploadPart, UploadSession
+from apps.projects.serializers.upload_serializers import CreateUploadSessionSerializer, UploadSessionSerializer
+from apps.projects.utils.chunked_upload import (
+    PartSizeMismatch,
+    combine_part_hashes,
+    create_temp_file,
+    delete_temp_file,
+    get_temp_path,
+    write_part,
+)
+from apps.projects.utils.blob_storage import blob_reference, copy_local_file
+
+
+class UploadSessionCreateAPIView(APIView):
+    # Метод POST для начала загрузки файла по частям (init)
+    def post(self, request: Request) -> Response:
+        serializer = CreateUploadSessionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        session = serializer.save()
+        create_temp_file(session.id, session.size) # Создаем временный файл нужного размера
+
+        return Response(UploadSessionSerializer(session).data, status=status.HTTP_201_CREATED)
+
+
+class UploadSessionDetailAPIView(APIView):
+    # Метод GET для получения состояния загрузки (какие части уже получены)
+    def get(self, request: Request, pk) -> Response:
+        session = get_object_or_404(UploadSession, pk=pk)
+        return Response(UploadSessionSerializer(session).data, status=status.HTTP_200_OK)
+
+
+class UploadPartAPIView(APIView):
+    # Метод PUT для загрузки одной части. Тело запроса - сырые байты части.
+    # Необязательный заголовок X-Part-SHA256 - хеш части для проверки целостности.
+    def put(self, request: Request, pk, number: int) -> Response:
+        session = get_object_or_404(UploadSession, pk=pk)
+
+        if not 1 <= number <= session.parts_count:
+            return Response(
+                {"message": f"Part number must be between 1 and {session.parts_count}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Забираем сессию на время записи условным UPDATE: части пишутся параллельно,
+        # а complete не начнется, пока хоть одна часть еще пишется
+        claimed = UploadSession.objects.filter(
+            pk=session.pk, status=UploadSession.STATUS_PENDING,
+        ).update(writing_parts=F('writing_parts') + 1)
+        if not claimed:
+            return Response({"message": "Upload is already completed"}, status=status.HTTP_409_CONFLICT)
+
+        try:
+            return self.receive_part(request, session, number)
+        finally:
+            UploadSession.objects.filter(pk=session.pk).update(writing_parts=F('writing_parts') - 1)
+
+    def receive_part(self, request: Request, session: UploadSession, number: int) -> Response:
+        # Читаем тело запроса потоково, не загружая его в память целиком
+        stream = request.stream or io.BytesIO()
+        expected_length = session.get_part_length(number)
+
+        try:
+            sha256 = write_part(session.id, (number - 1) * session.part_size, expected_length, stream)
+        except PartSizeMismatch:
+            return Response(
+                {"message": f"Part {number} must be exactly {expected_length} bytes"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        expected_sha256 = request.headers.get('X-Part-SHA256')
+        if expected_sha256 and expected_sha256.lower() != sha256:
+            return Response({"message": "Part checksum mismatch"}, status=status.HTTP_400_BAD_REQUEST)
+
+        UploadPart.objects.update_or_create(
+            session=session, number=number,
+            defaults={'size': expected_length, 'sha256': sha256},
+        )
+
+        return Response({"number": number, "sha256": sha256}, status=status.HTTP_200_OK)
+
+
+class UploadCompleteAPIView(APIView):
+    # Метод POST для завершения загрузки: проверка частей и хеша, перенос файла в хранилище.
+    # Хеширование и копирование файла (до 2 ГБ) идут вне транзакции, чтобы не держать
+    # блокировку записи базы; в транзакции создаются только строки ProjectFile и сессии.
+    def post(self, request: Request, pk) -> Response:
+        session = get_object_or_404(UploadSession, pk=pk)
+
+        if session.status != UploadSession.STATUS_PENDING:
+            return Response({"message": "Upload is already completed"}, status=status.HTTP_409_CONFLICT)
+
+        received = set(session.parts.values_list('number', flat=True))
+        missing = [number for number in range(1, session.parts_count + 1) if number not in received]
+        if missing:
+            return Response(
+                {"message": "Not all parts are uploaded", "missing_parts": missing},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Забираем сессию условным UPDATE: параллельный запрос complete получит 409,
+        # как и пока еще пишется какая-то часть (запрос можно повторить)
+        claimed = UploadSession.objects.filter(
+            pk=session.pk, status=UploadSession.STATUS_PENDING, writing_parts=0,
+        ).update(status=UploadSession.STATUS_COMPLETING)
+        if not claimed:
+            return Response(
+                {"message": "Upload is already completed or parts are still being written"},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        try:
+            return self.complete(session)
+        finally:
+            # При ошибке возвращаем сессию в PENDING - запрос можно повторить,
+            # временный файл остается на месте до успешного завершения
+            UploadSession.objects.filter(
+                pk=session.pk, status=UploadSession.STATUS_COMPLETING,
+            ).update(status=UploadSession.STATUS_PENDING)
+
+    def complete(self, session: UploadSession) -> Response:
+        temp_path = get_temp_path(session.id)
+        if not os.path.exists(temp_path):
+            return Response({"message": "Upload data has expired"}, status=status.HTTP_410_GONE)
+
+        # Хеш файла складывается из хешей частей, посчитанных при записи (UploadPart),
+        # без повторного чтения всего файла
+        sha256 = combine_part_hashes(session.parts.order_by('number').values_list('sha256', flat=True))
+        if session.sha256 and session.sha256 != sha256:
+            return Response({"message": "File checksum mismatch"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Копируем файл в контентно-адресуемое хранилище (если такого там еще нет)
+        with blob_reference(sha256, session.size, copy_local_file(temp_path)) as blob:
+            project_file = ProjectFile.objects.create(file_name=session.file_name, file_path=blob.path, blob=blob)
+            project_file.projects.set([session.project])
+
+            session.status = UploadSession.STATUS_COMPLETED
+            session.sha256 = sha256
+            session.project_file = project_file
+            session.save(update_fields=['status', 'sha256', 'project_file'])
+
+        delete_temp_file(session.id)
+
+        return Response(
+            data={
+                "message": "File uploaded successfully",
+                "id": project_file.id,
+                "sha256": sha256,
+                "processing_status": project_file.processing_status,
+            },
+            status=status.HTTP_200_OK,
+        )
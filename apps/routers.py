@@ -3,4 +3,5 @@ from django.urls import path, include
 urlpatterns = [
     path('tasks/', include('apps.tasks.urls')),
     path('projects/', include('apps.projects.urls')),
+    path('search/', include('apps.search.urls')),
 ]
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.search"
+
+    def ready(self):
+        # Подключаем обработчики сигналов, поддерживающие поисковый индекс актуальным
+        from apps.search import signals  # noqa: F401
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.projects.models import Project
+from apps.search.models import SearchTerm
+from apps.search.utils.search_backends import get_search_backend
+from apps.tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = 'Полностью перестраивает поисковый индекс задач и проектов.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        sources = [
+            (SearchTerm.KIND_PROJECT, Project.objects.all()),
+            (SearchTerm.KIND_TASK, Task.objects.all()),
+        ]
+
+        with transaction.atomic():
+            backend.clear()
+
+            for kind, queryset in sources:
+                rows = queryset.order_by().values_list('id', 'name', 'description')
+                chunk, count = [], 0
+
+                for row in rows.iterator(chunk_size=options['chunk_size']):
+                    chunk.append(row)
+                    if len(chunk) == options['chunk_size']:
+                        backend.index_many(kind, chunk)
+                        count += len(chunk)
+                        chunk = []
+
+                if chunk:
+                    backend.index_many(kind, chunk)
+                    count += len(chunk)
+
+                self.stdout.write(f'Indexed {count} {kind} objects')
+
+        self.stdout.write(self.style.SUCCESS(f'Search index rebuilt ({type(backend).__name__})'))
@@ -0,0 +1,34 @@
+from django.db import migrations
+
+
+FTS_TABLE = "search_fts"
+
+
+def create_fts_table(apps, schema_editor):
+    # Полнотекстовая таблица FTS5 создается только для SQLite.
+    # rowid кодирует тип и id объекта (см. apps.search.utils.search_backends).
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+        f"USING fts5(name, description, tokenize='unicode61')"
+    )
+
+
+def drop_fts_table(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
@@ -0,0 +1 @@
+from .search_term import *
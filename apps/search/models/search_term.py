@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class SearchTerm(models.Model):
+    """
+    Строка инвертированного индекса: терм -> объект (задача или проект).
+    Используется как переносимый вариант поиска, если база не поддерживает SQLite FTS5.
+    """
+    KIND_TASK = 'task'
+    KIND_PROJECT = 'project'
+    KIND_CHOICES = [
+        (KIND_TASK, 'Task'),
+        (KIND_PROJECT, 'Project'),
+    ]
+
+    # term: нормализованное слово (в нижнем регистре)
+    term = models.CharField(max_length=64)
+    # kind: тип проиндексированного объекта
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    # object_id: id задачи или проекта
+    object_id = models.BigIntegerField()
+    # weight: вес терма в документе (совпадения в названии весят больше, чем в описании)
+    weight = models.PositiveIntegerField(default=1)
+
+    def __str__(self):
+        return f"{self.term} -> {self.kind} {self.object_id}"
+
+    class Meta:
+        indexes = [
+            # Поиск документов по терму
+            models.Index(fields=['term', 'kind', 'object_id'], name='search_term_lookup_idx'),
+            # Удаление всех термов документа при его изменении/удалении
+            models.Index(fields=['kind', 'object_id'], name='search_term_document_idx'),
+        ]
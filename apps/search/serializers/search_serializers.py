@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """
+    Сериализатор для валидации query параметров поиска.
+    """
+    q = serializers.CharField(max_length=200)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
+class SearchHitSerializer(serializers.Serializer):
+    """
+    Сериализатор для отображения одного результата поиска.
+    """
+    type = serializers.CharField()
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    rank = serializers.FloatField()
@@ -0,0 +1,54 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.projects.models import Project
+from apps.search.models import SearchTerm
+from apps.search.utils.search_backends import get_search_backend
+from apps.tasks.models import Task
+from apps.tasks.signals import tasks_bulk_deleting, tasks_bulk_saved
+
+
+# Инкрементальное обновление поискового индекса при изменении задач и проектов
+
+@receiver(post_save, sender=Task, dispatch_uid='search_index_task')
+def index_task(sender, instance: Task, **kwargs):
+    # "Мягко" удаленная задача из поиска убирается, восстановленная - индексируется снова
+    if instance.deleted_at is not None:
+        get_search_backend().remove(SearchTerm.KIND_TASK, instance.pk)
+        return
+    get_search_backend().index(SearchTerm.KIND_TASK, instance.pk, instance.name, instance.description)
+
+
+@receiver(post_delete, sender=Task, dispatch_uid='search_remove_task')
+def remove_task(sender, instance: Task, **kwargs):
+    get_search_backend().remove(SearchTerm.KIND_TASK, instance.pk)
+
+
+@receiver(tasks_bulk_saved, sender=Task, dispatch_uid='search_index_tasks_bulk')
+def index_tasks_bulk(sender, ids, **kwargs):
+    backend = get_search_backend()
+    rows = list(Task.objects.filter(id__in=ids).values_list('id', 'name', 'description'))
+    backend.index_many(SearchTerm.KIND_TASK, rows)
+
+    # Задачи, которых нет среди не удаленных, - "мягко" удалены
+    for task_id in set(ids) - {row[0] for row in rows}:
+        backend.remove(SearchTerm.KIND_TASK, task_id)
+
+
+@receiver(tasks_bulk_deleting, sender=Task, dispatch_uid='search_remove_tasks_bulk')
+def remove_tasks_bulk(sender, ids, **kwargs):
+    get_search_backend().remove_many(SearchTerm.KIND_TASK, ids)
+
+
+@receiver(post_save, sender=Project, dispatch_uid='search_index_project')
+def index_project(sender, instance: Project, **kwargs):
+    # Проект в очереди на удаление из поиска убирается сразу
+    if instance.deleting_at is not None:
+        get_search_backend().remove(SearchTerm.KIND_PROJECT, instance.pk)
+        return
+    get_search_backend().index(SearchTerm.KIND_PROJECT, instance.pk, instance.name, instance.description)
+
+
+@receiver(post_delete, sender=Project, dispatch_uid='search_remove_project')
+def remove_project(sender, instance: Project, **kwargs):
+    get_search_backend().remove(SearchTerm.KIND_PROJECT, instance.pk)
@@ -0,0 +1,93 @@
+from unittest import mock
+
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.projects.models import Project
+from apps.search.models import SearchTerm
+from apps.search.utils import search_backends
+from apps.search.utils.search_backends import Fts5Backend, InvertedIndexBackend, get_search_backend
+from apps.tasks.models import Task
+
+
+class SearchBackendTestMixin:
+    """
+    Общие проверки обоих бэкендов: индексация по сигналам, удаление из индекса
+    и порядок результатов (совпадение в названии выше, чем в описании).
+    """
+    backend_class = None
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Apollo', description='Lunar landing program ' * 3)
+
+    def create_task(self, name, description='Routine maintenance work ' * 3):
+        return Task.objects.create(name=name, description=description, project=self.project)
+
+    def search(self, query):
+        response = self.client.get(reverse('search'), {'q': query})
+        self.assertEqual(response.status_code, 200)
+        return [(hit['type'], hit['id']) for hit in response.data]
+
+    def test_backend_selected(self):
+        self.assertIsInstance(get_search_backend(), self.backend_class)
+
+    def test_index_and_rank(self):
+        in_name = self.create_task('Telemetry dashboard')
+        in_description = self.create_task('Ground station', 'Collect telemetry from the ground station ' * 2)
+
+        self.assertEqual(
+            self.search('telemetry'),
+            [(SearchTerm.KIND_TASK, in_name.pk), (SearchTerm.KIND_TASK, in_description.pk)],
+        )
+        self.assertEqual(self.search('lunar'), [(SearchTerm.KIND_PROJECT, self.project.pk)])
+        self.assertEqual(self.search('telemetry dashboard'), [(SearchTerm.KIND_TASK, in_name.pk)])
+
+    def test_reindex_on_update(self):
+        task = self.create_task('Telemetry dashboard')
+
+        task.name = 'Navigation console'
+        task.save()
+
+        self.assertEqual(self.search('telemetry'), [])
+        self.assertEqual(self.search('navigation'), [(SearchTerm.KIND_TASK, task.pk)])
+
+    def test_removal(self):
+        task = self.create_task('Telemetry dashboard')
+
+        response = self.client.delete(reverse('task-detail-update-delete', args=[task.pk]))
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.search('telemetry'), []) # "Мягко" удаленная задача
+
+        self.client.post(reverse('task-restore', args=[task.pk]))
+        self.assertEqual(self.search('telemetry'), [(SearchTerm.KIND_TASK, task.pk)])
+
+        self.project.delete()
+        self.assertEqual(self.search('telemetry'), [])
+        self.assertEqual(self.search('lunar'), [])
+
+
+@override_settings(SEARCH_BACKEND='inverted')
+class InvertedIndexBackendTestCase(SearchBackendTestMixin, TestCase):
+    backend_class = InvertedIndexBackend
+
+
+@override_settings(SEARCH_BACKEND='fts5')
+class Fts5BackendTestCase(SearchBackendTestMixin, TestCase):
+    backend_class = Fts5Backend
+
+
+    def test_uses_router_databases(self):
+        # SQL FTS5 идет через соединение, выбранное роутером, а не через django.db.connection
+        task = self.create_task('Telemetry dashboard')
+        routed = {'replica1': connections['default'], 'primary': connections['default']}
+
+        with mock.patch.object(search_backends, 'connections', routed), \
+                mock.patch.object(search_backends.router, 'db_for_read', return_value='replica1') as db_for_read, \
+                mock.patch.object(search_backends.router, 'db_for_write', return_value='primary') as db_for_write:
+            Fts5Backend().index(SearchTerm.KIND_TASK, task.pk, 'Navigation console', '')
+            hits = Fts5Backend().search('navigation', 10)
+
+        db_for_write.assert_called_with(SearchTerm)
+        db_for_read.assert_called_with(SearchTerm)
+        self.assertEqual([hit[:2] for hit in hits], [(SearchTerm.KIND_TASK, task.pk)])
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from apps.search.views.search_views import SearchAPIView
+
+urlpatterns = [
+    path('', SearchAPIView.as_view(), name='search'),  # api/v1/search/?q=
+]
@@ -0,0 +1,194 @@
+import re
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections, router
+from django.db.models import Count, Sum
+
+from apps.search.models import SearchTerm
+
+
+FTS_TABLE = 'search_fts'
+# rowid в FTS5 таблице = object_id * 2 + код типа объекта
+KIND_CODES = {
+    SearchTerm.KIND_TASK: 0,
+    SearchTerm.KIND_PROJECT: 1,
+}
+KINDS_BY_CODE = {code: kind for kind, code in KIND_CODES.items()}
+
+# Совпадение в названии весит больше, чем в описании
+NAME_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+MAX_TERM_LENGTH = 64
+
+
+def get_connection(write: bool):
+    """
+    Соединение той базы, которую роутер выбрал бы для SearchTerm
+    (запись - primary, чтение - реплика запроса), а не всегда 'default'.
+    """
+    alias = router.db_for_write(SearchTerm) if write else router.db_for_read(SearchTerm)
+    return connections[alias]
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Разбивает текст на нормализованные термы (нижний регистр, только буквы и цифры).
+    """
+    return [token[:MAX_TERM_LENGTH] for token in TOKEN_RE.findall(text.lower())]
+
+
+class InvertedIndexBackend:
+    """
+    Переносимый поиск на обычной таблице SearchTerm (работает на любой базе).
+    """
+    def get_terms(self, kind: str, object_id: int, name: str, description: str):
+        weights = Counter()
+        for term in tokenize(name):
+            weights[term] += NAME_WEIGHT
+        for term in tokenize(description):
+            weights[term] += DESCRIPTION_WEIGHT
+
+        return [
+            SearchTerm(term=term, kind=kind, object_id=object_id, weight=weight)
+            for term, weight in weights.items()
+        ]
+
+    def index(self, kind: str, object_id: int, name: str, description: str):
+        self.remove(kind, object_id)
+        SearchTerm.objects.bulk_create(self.get_terms(kind, object_id, name, description))
+
+    def index_many(self, kind: str, rows):
+        """
+        Индексирует пачку объектов: rows - список (id, name, description).
+        """
+        rows = list(rows)
+        SearchTerm.objects.filter(kind=kind, object_id__in=[row[0] for row in rows]).delete()
+        SearchTerm.objects.bulk_create(
+            [term for row in rows for term in self.get_terms(kind, *row)],
+            batch_size=1000,
+        )
+
+    def remove(self, kind: str, object_id: int):
+        SearchTerm.objects.filter(kind=kind, object_id=object_id).delete()
+
+    def remove_many(self, kind: str, object_ids):
+        SearchTerm.objects.filter(kind=kind, object_id__in=list(object_ids)).delete()
+
+    def clear(self):
+        SearchTerm.objects.all().delete()
+
+    def search(self, query: str, limit: int) -> list[tuple[str, int, float]]:
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        # Документ должен содержать все термы запроса; ранг - сумма весов
+        hits = (
+            SearchTerm.objects.filter(term__in=terms)
+            .values('kind', 'object_id')
+            .annotate(matched=Count('term', distinct=True), score=Sum('weight'))
+            .filter(matched=len(terms))
+            .order_by('-score', 'kind', 'object_id')[:limit]
+        )
+
+        return [(hit['kind'], hit['object_id'], float(hit['score'])) for hit in hits]
+
+
+class Fts5Backend:
+    """
+    Поиск на виртуальной таблице SQLite FTS5 с ранжированием bm25.
+    """
+    def index(self, kind: str, object_id: int, name: str, description: str):
+        rowid = object_id * 2 + KIND_CODES[kind]
+
+        with get_connection(write=True).cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [rowid])
+            cursor.execute(
+                f'INSERT INTO {FTS_TABLE} (rowid, name, description) VALUES (%s, %s, %s)',
+                [rowid, name, description],
+            )
+
+    def index_many(self, kind: str, rows):
+        """
+        Индексирует пачку объектов: rows - список (id, name, description).
+        """
+        rows = [(object_id * 2 + KIND_CODES[kind], name, description) for object_id, name, description in rows]
+
+        with get_connection(write=True).cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [row[:1] for row in rows])
+            cursor.executemany(
+                f'INSERT INTO {FTS_TABLE} (rowid, name, description) VALUES (%s, %s, %s)',
+                rows,
+            )
+
+    def remove(self, kind: str, object_id: int):
+        with get_connection(write=True).cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {FTS_TABLE} WHERE rowid = %s',
+                [object_id * 2 + KIND_CODES[kind]],
+            )
+
+    def remove_many(self, kind: str, object_ids):
+        with get_connection(write=True).cursor() as cursor:
+            cursor.executemany(
+                f'DELETE FROM {FTS_TABLE} WHERE rowid = %s',
+                [(object_id * 2 + KIND_CODES[kind],) for object_id in object_ids],
+            )
+
+    def clear(self):
+        with get_connection(write=True).cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE}')
+
+    def search(self, query: str, limit: int) -> list[tuple[str, int, float]]:
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        # Каждый терм берем в кавычки, чтобы пользовательский ввод
+        # не интерпретировался как синтаксис запроса FTS5
+        match = ' '.join(f'"{term}"' for term in terms)
+
+        with get_connection(write=False).cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid, bm25({FTS_TABLE}, %s, %s) AS rank FROM {FTS_TABLE} '
+                f'WHERE {FTS_TABLE} MATCH %s ORDER BY rank LIMIT %s',
+                [NAME_WEIGHT, DESCRIPTION_WEIGHT, match, limit],
+            )
+            rows = cursor.fetchall()
+
+        # bm25 возвращает отрицательные значения: чем меньше, тем релевантнее
+        return [(KINDS_BY_CODE[rowid % 2], rowid // 2, -rank) for rowid, rank in rows]
+
+
+# Результат проверки наличия FTS5 таблицы для каждой базы (по имени файла базы)
+_fts5_tables = {}
+
+
+def fts5_available() -> bool:
+    # Проверяем базу чтения: схема реплик совпадает с primary, а db_for_write
+    # прикрепил бы к primary весь запрос (в том числе GET поиска)
+    connection = get_connection(write=False)
+    if connection.vendor != 'sqlite':
+        return False
+
+    database = str(connection.settings_dict['NAME'])
+    if database not in _fts5_tables:
+        _fts5_tables[database] = FTS_TABLE in connection.introspection.table_names()
+
+    return _fts5_tables[database]
+
+
+def get_search_backend():
+    """
+    Возвращает бэкенд поиска по настройке SEARCH_BACKEND:
+    'fts5', 'inverted' или 'auto' (FTS5, если доступен, иначе инвертированный индекс).
+    """
+    backend = getattr(settings, 'SEARCH_BACKEND', 'auto')
+
+    if backend == 'fts5' or (backend == 'auto' and fts5_available()):
+        return Fts5Backend()
+
+    return InvertedIndexBackend()
@@ -0,0 +1,47 @@
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.projects.models import Project
+from apps.search.models import SearchTerm
+from apps.search.serializers.search_serializers import SearchHitSerializer, SearchQuerySerializer
+from apps.search.utils.search_backends import get_search_backend
+from apps.tasks.models import Task
+
+
+class SearchAPIView(APIView):
+    """
+    Полнотекстовый поиск по названиям и описаниям задач и проектов.
+    Результаты отсортированы по релевантности.
+    """
+    models = {
+        SearchTerm.KIND_TASK: Task,
+        SearchTerm.KIND_PROJECT: Project,
+    }
+
+    def get(self, request: Request) -> Response:
+        query_serializer = SearchQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        hits = get_search_backend().search(
+            query_serializer.validated_data['q'],
+            query_serializer.validated_data['limit'],
+        )
+
+        # Имена подгружаем одним запросом на каждый тип объекта
+        names = {}
+        for kind, model in self.models.items():
+            ids = [object_id for hit_kind, object_id, _ in hits if hit_kind == kind]
+            if ids:
+                names[kind] = dict(model.objects.filter(pk__in=ids).values_list('pk', 'name'))
+
+        results = [
+            {'type': kind, 'id': object_id, 'name': names[kind][object_id], 'rank': rank}
+            for kind, object_id, rank in hits
+            if object_id in names.get(kind, {})
+        ]
+
+        serializer = SearchHitSerializer(results, many=True)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
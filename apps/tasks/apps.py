@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.tasks"
+
+    def ready(self):
+        # Подключаем обработчики сигналов (сброс кэша имен проектов и тегов)
+        from apps.tasks import receivers  # noqa: F401
@@ -0,0 +1,118 @@
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+
+from apps.tasks.choices.priorities import Priorities
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.models import Task
+
+
+# Разрешенные варианты сортировки. Каждый вариант опирается на индекс из Task.Meta.indexes,
+# поэтому клиент не может запросить сортировку без индекса. Все поля варианта сортируются
+# в одном направлении: убывающий вариант - обратный проход того же индекса, а не отдельная сортировка.
+ORDERING_CHOICES = {
+    'deadline': ('deadline', 'id'),
+    '-deadline': ('-deadline', '-id'),
+    'priority': ('priority', 'deadline', 'id'),
+    '-priority': ('-priority', '-deadline', '-id'),
+    'status': ('status', 'deadline', 'id'),
+    '-status': ('-status', '-deadline', '-id'),
+}
+
+
+class TaskFilterSerializer(serializers.Serializer):
+    """
+    Сериализатор для валидации query параметров списка задач.
+    """
+    # status: один или несколько статусов через запятую (?status=NEW,BLOCKED)
+    status = serializers.CharField(required=False)
+    priority_min = serializers.ChoiceField(choices=Priorities.choices(), required=False)
+    priority_max = serializers.ChoiceField(choices=Priorities.choices(), required=False)
+    # project: имя проекта
+    project = serializers.CharField(required=False)
+    # assignee: email исполнителя
+    assignee = serializers.EmailField(required=False)
+    # tag: имя тега
+    tag = serializers.CharField(required=False)
+    deadline_from = serializers.DateTimeField(required=False)
+    deadline_to = serializers.DateTimeField(required=False)
+    # overdue: только просроченные и не закрытые задачи
+    overdue = serializers.BooleanField(required=False, default=False)
+    ordering = serializers.ChoiceField(choices=list(ORDERING_CHOICES), required=False)
+
+    def validate_status(self, value: str):
+        statuses = [status.strip() for status in value.split(',') if status.strip()]
+        allowed = [status.value for status in Statuses]
+
+        for status in statuses:
+            if status not in allowed:
+                raise serializers.ValidationError(
+                    f'The status must be one of the choices: {allowed}.'
+                )
+
+        return statuses
+
+    def validate(self, attrs):
+        if attrs.get('priority_min', 0) > attrs.get('priority_max', Priorities.CRITICAL[0]):
+            raise serializers.ValidationError(
+                'priority_min must be less than or equal to priority_max.'
+            )
+
+        deadline_from = attrs.get('deadline_from')
+        deadline_to = attrs.get('deadline_to')
+        if deadline_from and deadline_to and deadline_from > deadline_to:
+            raise serializers.ValidationError(
+                'deadline_from must be earlier than deadline_to.'
+            )
+
+        return attrs
+
+
+class TaskFilterBackend(BaseFilterBackend):
+    """
+    Фильтрация и сортировка списка задач на стороне базы данных.
+    Некорректные параметры приводят к ответу 400 Bad Request.
+    """
+    def filter_queryset(self, request, queryset, view):
+        serializer = TaskFilterSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        if 'status' in params:
+            queryset = queryset.filter(status__in=params['status'])
+
+        if 'priority_min' in params:
+            queryset = queryset.filter(priority__gte=params['priority_min'])
+
+        if 'priority_max' in params:
+            queryset = queryset.filter(priority__lte=params['priority_max'])
+
+        if 'project' in params:
+            queryset = queryset.filter(project__name=params['project'])
+
+        if 'assignee' in params:
+            queryset = queryset.filter(assignee__email=params['assignee'])
+
+        if 'tag' in params:
+            # Подзапрос по связующей таблице вместо JOIN, чтобы не получать дубликаты задач
+            queryset = queryset.filter(
+                id__in=Task.tags.through.objects.filter(
+                    tag__name=params['tag']
+                ).values('task_id')
+            )
+
+        if 'deadline_from' in params:
+            queryset = queryset.filter(deadline__gte=params['deadline_from'])
+
+        if 'deadline_to' in params:
+            queryset = queryset.filter(deadline__lte=params['deadline_to'])
+
+        if params['overdue']:
+            queryset = queryset.filter(
+                deadline__lt=timezone.now()
+            ).exclude(status=Statuses.CLOSED.value)
+
+        if 'ordering' in params:
+            queryset = queryset.order_by(*ORDERING_CHOICES[params['ordering']])
+
+        return queryset
@@ -0,0 +1,125 @@
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from agile_projects.renderers import FastJSONRenderer, orjson
+from apps.projects.models import Project
+from apps.projects.serializers.fast_serializers import FastListProjectsSerializer
+from apps.projects.serializers.project_serializers import ListProjectsSerializer
+from apps.tasks.choices.priorities import Priorities
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.models import Tag, Task
+from apps.tasks.serializers.fast_serializers import FastListTaskSerializer, FastTagSerializer
+from apps.tasks.serializers.tag_serializers import TagSerializer
+from apps.tasks.serializers.task_serializers import ListTaskSerializer
+
+
+BENCHMARK_ALIAS = 'benchmark'
+
+
+class Command(BaseCommand):
+    help = (
+        'Сравнивает ModelSerializer + JSONRenderer с быстрым путем '
+        '(values() + ValuesSerializer + FastJSONRenderer) на временной SQLite базе '
+        'и проверяет, что ответы совпадают.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10_000, help='Количество задач, проектов и тегов')
+        parser.add_argument('--repeat', type=int, default=5, help='Повторов каждого замера')
+
+    def handle(self, *args, **options):
+        fd, path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(fd)
+
+        # Отдельное подключение к временной базе, чтобы не трогать рабочую
+        connections.settings[BENCHMARK_ALIAS] = {
+            **connections['default'].settings_dict,
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': path,
+        }
+
+        try:
+            call_command('migrate', database=BENCHMARK_ALIAS, verbosity=0)
+            self.seed(options['rows'])
+
+            self.stdout.write(f'JSON: {"orjson " + orjson.__version__ if orjson else "stdlib json"}')
+
+            tasks = Task.objects.using(BENCHMARK_ALIAS)
+            projects = Project.objects.using(BENCHMARK_ALIAS)
+            tags = Tag.objects.using(BENCHMARK_ALIAS)
+
+            self.compare('tasks', ListTaskSerializer, tasks.for_list(), FastListTaskSerializer, tasks, options['repeat'])
+            self.compare('projects', ListProjectsSerializer, projects, FastListProjectsSerializer, projects, options['repeat'])
+            self.compare('tags', TagSerializer, tags, FastTagSerializer, tags, options['repeat'])
+        finally:
+            connections[BENCHMARK_ALIAS].close()
+            del connections.settings[BENCHMARK_ALIAS]
+            os.remove(path)
+
+    def seed(self, rows):
+        User.objects.using(BENCHMARK_ALIAS).bulk_create(
+            User(username=f'user{i}', email=f'user{i}@example.com') for i in range(100)
+        )
+        Project.objects.using(BENCHMARK_ALIAS).bulk_create(
+            Project(name=f'Project {i}', description='Benchmark project') for i in range(rows)
+        )
+        Tag.objects.using(BENCHMARK_ALIAS).bulk_create(Tag(name=f'tag{i}') for i in range(rows))
+
+        user_ids = list(User.objects.using(BENCHMARK_ALIAS).values_list('id', flat=True))
+        project_ids = list(Project.objects.using(BENCHMARK_ALIAS).values_list('id', flat=True))
+        statuses = [status.value for status in Statuses]
+        priorities = [priority[0] for priority in Priorities]
+        now = timezone.now()
+
+        Task.objects.using(BENCHMARK_ALIAS).bulk_create([
+            Task(
+                name=f'Task {i}',
+                description='Benchmark task',
+                status=random.choice(statuses),
+                priority=random.choice(priorities),
+                project_id=random.choice(project_ids),
+                # ~10% задач без исполнителя
+                assignee_id=random.choice(user_ids) if random.random() > 0.1 else None,
+                deadline=now + timedelta(minutes=random.randint(-100_000, 100_000)),
+            )
+            for i in range(rows)
+        ], batch_size=1000)
+
+    def measure(self, function, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = function()
+            timings.append(time.perf_counter() - started)
+        return min(timings), result
+
+    def compare(self, title, serializer_class, queryset, fast_serializer_class, fast_queryset, repeat):
+        def slow():
+            return JSONRenderer().render(serializer_class(queryset.all(), many=True).data)
+
+        def fast():
+            serializer = fast_serializer_class()
+            return FastJSONRenderer().render(serializer.serialize(serializer.values(fast_queryset.all())))
+
+        slow_time, slow_output = self.measure(slow, repeat)
+        fast_time, fast_output = self.measure(fast, repeat)
+
+        if json.loads(slow_output) != json.loads(fast_output):
+            raise CommandError(f'{title}: fast serializer output differs from {serializer_class.__name__}')
+
+        self.stdout.write(
+            f'{title}: {serializer_class.__name__} {slow_time * 1000:.1f} ms, '
+            f'{fast_serializer_class.__name__} {fast_time * 1000:.1f} ms '
+            f'(x{slow_time / fast_time:.1f})'
+        )
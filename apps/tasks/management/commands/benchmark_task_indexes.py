@@ -0,0 +1,140 @@
+import os
+import random
+import tempfile
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.utils import timezone
+
+from apps.projects.models import Project
+from apps.tasks.choices.priorities import Priorities
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.models import Task
+
+
+BENCHMARK_ALIAS = 'benchmark'
+
+
+class Command(BaseCommand):
+    help = (
+        'Заполняет временную SQLite базу задачами и показывает планы запросов '
+        'и время выполнения горячих фильтров без индексов, с индексами 0003_task_indexes '
+        'и с частичными индексами последней схемы (0004_task_soft_delete и далее).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000, help='Количество задач')
+        parser.add_argument('--projects', type=int, default=100, help='Количество проектов')
+        parser.add_argument('--users', type=int, default=500, help='Количество исполнителей')
+        parser.add_argument('--batch-size', type=int, default=10_000)
+        parser.add_argument('--repeat', type=int, default=5, help='Повторов каждого запроса')
+
+    def handle(self, *args, **options):
+        fd, path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(fd)
+
+        # Отдельное подключение к временной базе, чтобы не трогать рабочую
+        connections.settings[BENCHMARK_ALIAS] = {
+            **connections['default'].settings_dict,
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': path,
+        }
+
+        try:
+            # Полная схема, затем откат миграций с индексами (и зависящих от них миграций projects)
+            call_command('migrate', database=BENCHMARK_ALIAS, verbosity=0)
+            call_command('migrate', 'tasks', '0002_task', database=BENCHMARK_ALIAS, verbosity=0)
+            self.seed(options)
+
+            self.stdout.write(self.style.MIGRATE_HEADING('Before indexes'))
+            self.report(options['repeat'])
+
+            started = time.perf_counter()
+            call_command('migrate', 'tasks', '0003_task_indexes', database=BENCHMARK_ALIAS, verbosity=0)
+            self.stdout.write(f'Index build: {time.perf_counter() - started:.1f}s')
+
+            self.stdout.write(self.style.MIGRATE_HEADING('After indexes (0003_task_indexes)'))
+            self.report(options['repeat'])
+
+            # Последняя схема: индексы 0003 заменены частичными (WHERE deleted_at IS NULL)
+            started = time.perf_counter()
+            call_command('migrate', database=BENCHMARK_ALIAS, verbosity=0)
+            self.stdout.write(f'Index rebuild: {time.perf_counter() - started:.1f}s')
+
+            self.stdout.write(self.style.MIGRATE_HEADING('After partial indexes (latest migrations)'))
+            self.report(options['repeat'])
+        finally:
+            connections[BENCHMARK_ALIAS].close()
+            del connections.settings[BENCHMARK_ALIAS]
+            os.remove(path)
+
+    def seed(self, options):
+        started = time.perf_counter()
+
+        User.objects.using(BENCHMARK_ALIAS).bulk_create(
+            User(username=f'user{i}', email=f'user{i}@example.com')
+            for i in range(options['users'])
+        )
+        Project.objects.using(BENCHMARK_ALIAS).bulk_create(
+            Project(name=f'Project {i}', description='Benchmark project')
+            for i in range(options['projects'])
+        )
+        user_ids = list(User.objects.using(BENCHMARK_ALIAS).values_list('id', flat=True))
+        project_ids = list(Project.objects.using(BENCHMARK_ALIAS).values_list('id', flat=True))
+
+        statuses = [status.value for status in Statuses]
+        priorities = [priority[0] for priority in Priorities]
+        now = timezone.now()
+        batch_size = options['batch_size']
+
+        for offset in range(0, options['rows'], batch_size):
+            Task.objects.using(BENCHMARK_ALIAS).bulk_create([
+                Task(
+                    name=f'Task {i}',
+                    description='Benchmark task',
+                    status=random.choice(statuses),
+                    priority=random.choice(priorities),
+                    project_id=random.choice(project_ids),
+                    assignee_id=random.choice(user_ids),
+                    deadline=now + timedelta(minutes=random.randint(-100_000, 100_000)),
+                    # ~5% задач "мягко" удалены
+                    deleted_at=now if random.random() < 0.05 else None,
+                )
+                for i in range(offset, min(offset + batch_size, options['rows']))
+            ])
+
+        self.stdout.write(f'Seeded {options["rows"]} tasks in {time.perf_counter() - started:.1f}s')
+
+    def get_queries(self):
+        # Менеджер по умолчанию добавляет deleted_at IS NULL - как запросы приложения
+        tasks = Task.objects.using(BENCHMARK_ALIAS)
+        project_id = Project.objects.using(BENCHMARK_ALIAS).values_list('id', flat=True).first()
+        user_id = User.objects.using(BENCHMARK_ALIAS).values_list('id', flat=True).first()
+
+        return {
+            'default ordering (-deadline)': tasks.order_by('-deadline', '-id')[:100],
+            'project + status': tasks.filter(
+                project_id=project_id, status=Statuses.BLOCKED.value,
+            ).order_by('deadline')[:100],
+            'status': tasks.filter(status=Statuses.TESTING.value).order_by('deadline')[:100],
+            'priority': tasks.filter(priority=Priorities.CRITICAL[0]).order_by('deadline')[:100],
+            'assignee (live only)': tasks.filter(
+                assignee_id=user_id, deleted_at__isnull=True,
+            ).order_by('deadline')[:100],
+        }
+
+    def report(self, repeat):
+        for title, queryset in self.get_queries().items():
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(queryset.all())
+                timings.append(time.perf_counter() - started)
+
+            self.stdout.write(f'{title}: best {min(timings) * 1000:.2f} ms')
+            for line in queryset.explain().splitlines():
+                self.stdout.write(f'    {line}')
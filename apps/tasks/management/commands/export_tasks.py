@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from agile_projects.exports import EXPORT_FORMATS, iter_export
+from apps.tasks.utils.export_tasks import EXPORT_CHUNK_SIZE, TASK_EXPORT_FIELDS, iter_task_rows
+
+
+class Command(BaseCommand):
+    help = 'Потоковый экспорт всех задач (с именем проекта, email исполнителя и тегами) в NDJSON или CSV.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=list(EXPORT_FORMATS), default='ndjson')
+        parser.add_argument('--output', help='Путь к файлу (по умолчанию - stdout)')
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        lines = iter_export(
+            iter_task_rows(chunk_size=options['chunk_size']), TASK_EXPORT_FIELDS, options['format'],
+        )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+                output.writelines(lines)
+        else:
+            # Через self.stdout: работает call_command(..., stdout=...) и перенаправление вывода
+            for line in lines:
+                self.stdout.write(line, ending='')
@@ -0,0 +1,91 @@
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tasks.utils.bulk_tasks import BATCH_SIZE, BulkTaskError, bulk_create_tasks
+from apps.tasks.utils.import_tasks import batched, read_csv, read_ndjson, validate_batch
+
+
+class Command(BaseCommand):
+    help = (
+        'Потоковый импорт задач из CSV или NDJSON файла. Строки валидируются пачками '
+        '(по правилам CreateUpdateTaskSerializer) и записываются через bulk_create.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', help='Путь к .csv или .ndjson файлу')
+        parser.add_argument('--format', choices=['csv', 'ndjson'], help='Формат файла (по умолчанию - по расширению)')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='Строк в одной пачке')
+        parser.add_argument('--workers', type=int, default=0, help='Процессов для валидации (0 - без пула)')
+        parser.add_argument('--max-errors', type=int, default=20, help='Сколько ошибок вывести')
+
+    def handle(self, *args, **options):
+        file_format = options['format'] or ('csv' if options['file'].endswith('.csv') else 'ndjson')
+        reader = read_csv if file_format == 'csv' else read_ndjson
+        self.max_errors = options['max_errors']
+        self.errors = 0
+        imported = 0
+        started = time.perf_counter()
+
+        try:
+            stream = open(options['file'], encoding='utf-8', newline='')
+        except OSError as exc:
+            raise CommandError(exc)
+
+        with stream:
+            batches = batched(reader(stream), options['batch_size'])
+
+            for start, valid, errors in self.validate(batches, options['workers']):
+                for index, row_errors in errors:
+                    self.report_error(index, row_errors)
+                imported += self.write(valid, options['batch_size'])
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {imported} tasks, skipped {self.errors} rows in {elapsed:.1f}s '
+            f'({(imported + self.errors) / max(elapsed, 1e-9):.0f} rows/s)'
+        ))
+
+    def validate(self, batches, workers):
+        if not workers:
+            yield from map(validate_batch, batches)
+            return
+
+        # Держим в работе не больше workers * 2 пачек, чтобы не читать весь файл в память
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+            pending = deque()
+
+            for batch in batches:
+                pending.append(executor.submit(validate_batch, batch))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+
+    def write(self, valid, batch_size) -> int:
+        indexes = [index for index, _ in valid]
+        rows = [row for _, row in valid]
+
+        # Строки с несуществующими проектами/тегами или дубликатами имен
+        # отбрасываются, остальная пачка записывается повторно
+        while rows:
+            try:
+                return len(bulk_create_tasks(rows, batch_size=batch_size))
+            except BulkTaskError as exc:
+                failed = {error['row'] for error in exc.errors}
+                for error in exc.errors:
+                    self.report_error(indexes[error['row']], error['errors'])
+
+                indexes = [index for position, index in enumerate(indexes) if position not in failed]
+                rows = [row for position, row in enumerate(rows) if position not in failed]
+
+        return 0
+
+    def report_error(self, index, errors):
+        self.errors += 1
+        if self.errors <= self.max_errors:
+            self.stderr.write(f'Row {index + 1}: {errors}')
@@ -0,0 +1,36 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tasks.models import Task
+from apps.tasks.utils.purge_tasks import delete_in_batches, delete_tasks
+
+
+class Command(BaseCommand):
+    help = (
+        'Окончательно удаляет "мягко" удаленные задачи старше --older-than дней '
+        'пачками с паузами между ними.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than', type=int, default=30, help='Возраст удаления, дней')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Строк в одной транзакции')
+        parser.add_argument('--sleep', type=float, default=0.1, help='Пауза между пачками, сек.')
+        parser.add_argument('--dry-run', action='store_true', help='Только посчитать задачи')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['older_than'])
+        tasks = Task.all_objects.filter(deleted_at__lt=cutoff)
+
+        if options['dry_run']:
+            self.stdout.write(f'{tasks.count()} tasks would be purged')
+            return
+
+        # delete_tasks: пачка удаляется без загрузки экземпляров и сигналов на каждую строку
+        purged = 0
+        for deleted in delete_in_batches(tasks, options['batch_size'], options['sleep'], delete=delete_tasks):
+            purged += deleted
+            self.stdout.write(f'Purged {purged} tasks', ending='\r')
+
+        self.stdout.write(self.style.SUCCESS(f'Purged {purged} tasks'))
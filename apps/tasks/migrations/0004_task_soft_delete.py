@@ -0,0 +1,81 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0003_task_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_deadline_id_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_project_status_dl_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_status_deadline_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_priority_deadline_idx",
+        ),
+        migrations.AlterUniqueTogether(
+            name="task",
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["deadline", "id"],
+                name="task_deadline_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["project", "status", "deadline"],
+                name="task_project_status_dl_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["status", "deadline"],
+                name="task_status_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["priority", "deadline"],
+                name="task_priority_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="task_deleted_at_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="task",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("name", "project"),
+                name="task_name_project_live_uniq",
+            ),
+        ),
+    ]
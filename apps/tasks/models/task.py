@@ -1,5 +1,5 @@
 from django.contrib.auth.models import User # Импортируем встроенную модель User Django
-from django.db import models
+from django.db import models, router, transaction
 
 # Импортируем наши модели из других приложений и утилиты
 from apps.projects.models.project import Project
@@ -7,6 +7,7 @@ from apps.tasks.choices.statuses import Statuses
 from apps.tasks.choices.priorities import Priorities
 from apps.tasks.utils.set_end_of_the_month import calculate_end_of_month
 from apps.tasks.models.tag import Tag # Импортируем Tag
+from apps.tasks.querysets.task_queryset import TaskManager, TaskQuerySet
 
 
 class Task(models.Model):
@@ -54,13 +55,72 @@ class Task(models.Model):
         blank=True # Может быть пустым в формах Django Admin
     )
 
+    # Менеджер по умолчанию: только не удаленные задачи,
+    # с планами запросов для сериализаторов (for_list, for_detail, for_write)
+    objects = TaskManager()
+    # Все задачи, включая "мягко" удаленные (очистка, восстановление)
+    all_objects = TaskQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        # Сохранение вместе с обновлением счетчиков ProjectStats (pre_save/post_save) - одна
+        # транзакция: старое состояние задачи читается под блокировкой строки до конца сохранения
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
+
 
     class Meta:
         # Сортировка по дедлайн дате в порядке убывания
         ordering = ['-deadline']
-        # Уникальность по комбинации полей name и project
-        # Это означает, что в одном проекте не может быть двух задач с одинаковым именем.
-        unique_together = ('name', 'project')
+        # Уникальность по комбинации полей name и project среди не удаленных задач.
+        # Это означает, что в одном проекте не может быть двух задач с одинаковым именем,
+        # а имя "мягко" удаленной задачи можно использовать снова.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['name', 'project'],
+                name='task_name_project_live_uniq',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
+        # Индексы под основные сценарии чтения: сортировка по дедлайну
+        # и фильтры по проекту, статусу, приоритету и исполнителю.
+        # Менеджер по умолчанию всегда добавляет deleted_at IS NULL, поэтому индексы
+        # частичные - удаленные задачи в них не попадают
+        indexes = [
+            # Сортировка по умолчанию (-deadline) и keyset пагинация по (deadline, id)
+            models.Index(
+                fields=['deadline', 'id'],
+                name='task_deadline_id_idx',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # Доска проекта: задачи проекта в статусе X, по дедлайну
+            models.Index(
+                fields=['project', 'status', 'deadline'],
+                name='task_project_status_dl_idx',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=['status', 'deadline'],
+                name='task_status_deadline_idx',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=['priority', 'deadline'],
+                name='task_priority_deadline_idx',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            models.Index(
+                fields=['assignee', 'deadline'],
+                name='task_assignee_dl_live_idx',
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # Очистка удаленных задач (purge_deleted_tasks): только удаленные
+            models.Index(
+                fields=['deleted_at'],
+                name='task_deleted_at_idx',
+                condition=models.Q(deleted_at__isnull=False),
+            ),
+        ]
 
 
     def __str__(self):
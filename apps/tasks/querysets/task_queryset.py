@@ -0,0 +1,80 @@
+from django.db import models
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from apps.tasks.choices.statuses import Statuses
+
+
+class TaskQuerySet(models.QuerySet):
+    """
+    QuerySet задач с "планами запросов" под каждый сериализатор.
+    Каждый план заранее подтягивает связанные объекты (select_related /
+    prefetch_related) и ограничивает колонки (only / defer), чтобы
+    сериализация списка не порождала запрос на каждую строку (N+1).
+    """
+
+    def alive(self):
+        # Не удаленные задачи ("мягкое" удаление через deleted_at)
+        return self.filter(deleted_at__isnull=True)
+
+    def deleted(self):
+        return self.filter(deleted_at__isnull=False)
+
+    def soft_delete(self) -> int:
+        # Массовое "мягкое" удаление одним UPDATE (без post_save -
+        # вызывающий код отправляет tasks_bulk_saved сам)
+        now = timezone.now()
+        return self.filter(deleted_at__isnull=True).update(deleted_at=now, updated_at=now)
+
+    def for_list(self):
+        # План для ListTaskSerializer:
+        # project -> __str__ (имя проекта), assignee -> email
+        return self.select_related('project', 'assignee').only(
+            'id', 'name', 'status', 'priority', 'deadline',
+            'project__id', 'project__name',
+            'assignee__id', 'assignee__email',
+        )
+
+    def for_detail(self):
+        # План для DetailTaskSerializer:
+        # вложенный project (id, name) через JOIN, tags - одним дополнительным запросом
+        return self.select_related('project').prefetch_related('tags').defer(
+            'updated_at', 'deleted_at', 'project__description', 'project__created_at',
+        )
+
+    def for_write(self):
+        # План для CreateUpdateTaskSerializer: в ответе project отображается по имени,
+        # а tags - списком имен
+        return self.select_related('project').prefetch_related('tags')
+
+    def status_priority_counts(self):
+        # Один GROUP BY (status, priority): из него собираются счетчики по статусам,
+        # по приоритетам и просроченные (открытые задачи с прошедшим дедлайном)
+        overdue = Q(deadline__lt=timezone.now()) & ~Q(status=Statuses.CLOSED.value)
+
+        return self.order_by().values('status', 'priority').annotate(
+            count=Count('id'),
+            overdue=Count('id', filter=overdue),
+        )
+
+    def top_per_status(self, limit: int):
+        # Первые limit задач каждого статуса по дедлайну:
+        # ROW_NUMBER() OVER (PARTITION BY status ORDER BY deadline, id) <= limit
+        return self.annotate(
+            row_number=Window(
+                RowNumber(),
+                partition_by=[F('status')],
+                order_by=[F('deadline').asc(), F('id').asc()],
+            ),
+        ).filter(row_number__lte=limit).order_by('status', 'row_number')
+
+
+class TaskManager(models.Manager.from_queryset(TaskQuerySet)):
+    """
+    Менеджер по умолчанию: "мягко" удаленные задачи не видны.
+    Все задачи, включая удаленные, - через Task.all_objects.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
@@ -0,0 +1,51 @@
+from django.core.signals import request_finished, request_started
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from agile_projects.response_cache import bump_generation
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task
+from apps.tasks.signals import tasks_bulk_deleting, tasks_bulk_saved
+from apps.tasks.utils import slug_cache
+from apps.tasks.utils.slug_cache import project_ids, tag_ids
+
+
+# Сброс кэша "имя -> id" при изменении или удалении проектов и тегов
+# (в этом процессе - сразу, в остальных - через общий счетчик поколения)
+
+@receiver(request_started, dispatch_uid='slug_cache_request_started')
+def start_slug_cache_request(sender, **kwargs):
+    # Поколения кэша "имя -> id" читаются из общего кэша один раз за запрос
+    slug_cache.start_request()
+
+
+@receiver(request_finished, dispatch_uid='slug_cache_request_finished')
+def finish_slug_cache_request(sender, **kwargs):
+    slug_cache.finish_request()
+
+
+@receiver([post_save, post_delete], sender=Project, dispatch_uid='slug_cache_project')
+def invalidate_project_slug(sender, instance: Project, **kwargs):
+    project_ids.invalidate(instance.pk)
+    bump_generation(project_ids.namespace)
+
+
+@receiver([post_save, post_delete], sender=Tag, dispatch_uid='slug_cache_tag')
+def invalidate_tag_slug(sender, instance: Tag, **kwargs):
+    tag_ids.invalidate(instance.pk)
+    bump_generation(tag_ids.namespace)
+
+
+# Сброс кэша ответов (agile_projects/response_cache.py)
+
+@receiver([post_save, post_delete], sender=Tag, dispatch_uid='response_cache_tag')
+def invalidate_tags_response_cache(sender, **kwargs):
+    bump_generation('tags')
+
+
+@receiver([post_save, post_delete], sender=Task, dispatch_uid='response_cache_task')
+@receiver(tasks_bulk_saved, sender=Task, dispatch_uid='response_cache_tasks_bulk')
+@receiver(tasks_bulk_deleting, sender=Task, dispatch_uid='response_cache_tasks_bulk_delete')
+def invalidate_tasks_response_cache(sender, **kwargs):
+    # Счетчики задач в списке проектов (?with_counts=true)
+    bump_generation('tasks')
@@ -0,0 +1,25 @@
+from rest_framework import serializers
+
+
+class CachedSlugRelatedField(serializers.SlugRelatedField):
+    """
+    SlugRelatedField, который разрешает имя в id через SlugCache, а не запросом в базу.
+    Возвращает "легкий" экземпляр модели только с pk и slug полем -
+    этого достаточно для записи ForeignKey и ManyToMany связей.
+    """
+    def __init__(self, slug_cache, **kwargs):
+        self.slug_cache = slug_cache
+        kwargs.setdefault('slug_field', slug_cache.slug_field)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            self.fail('invalid')
+
+        object_id = self.slug_cache.get(data)
+        if object_id is None:
+            self.fail('does_not_exist', slug_name=self.slug_field, value=data)
+
+        # from_db создает экземпляр "как из базы" (остальные поля отложены)
+        queryset = self.get_queryset()
+        return queryset.model.from_db(queryset.db, ['id', self.slug_field], [object_id, data])
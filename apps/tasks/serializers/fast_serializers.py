@@ -0,0 +1,27 @@
+from agile_projects.fast_serializers import ValuesSerializer, datetime_to_representation
+
+
+class FastListTaskSerializer(ValuesSerializer):
+    """
+    Быстрый аналог ListTaskSerializer для GET /api/v1/tasks/.
+    project -> __str__ проекта (его имя), assignee -> email.
+    """
+    fields = {
+        'id': ('id', None),
+        'name': ('name', None),
+        'status': ('status', None),
+        'priority': ('priority', None),
+        'project': ('project__name', None),
+        'assignee': ('assignee__email', None),
+        'deadline': ('deadline', datetime_to_representation),
+    }
+
+
+class FastTagSerializer(ValuesSerializer):
+    """
+    Быстрый аналог TagSerializer для списка тегов.
+    """
+    fields = {
+        'id': ('id', None),
+        'name': ('name', None),
+    }
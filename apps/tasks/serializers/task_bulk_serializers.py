@@ -0,0 +1,50 @@
+from rest_framework import serializers
+
+from apps.tasks.serializers.task_serializers import CreateUpdateTaskSerializer
+
+
+class BulkCreateTaskSerializer(CreateUpdateTaskSerializer):
+    """
+    Сериализатор одной строки массового создания задач.
+    Правила валидации те же, что у CreateUpdateTaskSerializer, но project и tags
+    принимаются как имена и разрешаются для всего пакета одним запросом.
+    """
+    project = serializers.CharField(max_length=100)
+
+    tags = serializers.ListField(
+        child=serializers.CharField(max_length=20),
+        required=False,
+    )
+
+    class Meta(CreateUpdateTaskSerializer.Meta):
+        # Уникальность (name, project) проверяется для всего пакета сразу
+        validators = []
+
+    def validate_project(self, value: str):
+        # Существование проекта проверяется для всего пакета сразу
+        return value
+
+
+class BulkUpdateTaskSerializer(BulkCreateTaskSerializer):
+    """
+    Сериализатор одной строки массового обновления задач (используется с partial=True).
+    """
+    id = serializers.IntegerField(min_value=1)
+
+    class Meta(BulkCreateTaskSerializer.Meta):
+        fields = ['id'] + BulkCreateTaskSerializer.Meta.fields
+
+    def validate(self, attrs):
+        if 'id' not in attrs:
+            raise serializers.ValidationError({'id': 'This field is required.'})
+        return attrs
+
+
+class BulkDeleteTaskSerializer(serializers.Serializer):
+    """
+    Сериализатор для массового удаления задач.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+    )
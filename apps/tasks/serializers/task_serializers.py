@@ -2,15 +2,19 @@ from datetime import datetime
 
 from django.utils import timezone
 from rest_framework import serializers
+from rest_framework.validators import UniqueTogetherValidator
 
+from agile_projects.serializers import FieldSelectionMixin
 from apps.projects.models import Project
 from apps.projects.serializers.project_serializers import ProjectShortInfoSerializer
 from apps.tasks.choices.priorities import Priorities
 from apps.tasks.models import Task, Tag
+from apps.tasks.serializers.cached_slug_field import CachedSlugRelatedField
 from apps.tasks.serializers.tag_serializers import TagSerializer
+from apps.tasks.utils.slug_cache import project_ids, tag_ids
 
 
-class ListTaskSerializer(serializers.ModelSerializer):
+class ListTaskSerializer(FieldSelectionMixin, serializers.ModelSerializer):
     """
     Сериализатор для отображения краткой информации о задачах.
     Поля project и assignee будут отображаться по их именам/email.
@@ -27,6 +31,8 @@ class ListTaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = ['id', 'name', 'status', 'priority', 'project', 'assignee', 'deadline']
+        # Для ?fields=: project отображается через __str__, которому нужно только имя
+        field_columns = {'project': ['project__name']}
 
 
 class CreateUpdateTaskSerializer(serializers.ModelSerializer):
@@ -36,13 +42,14 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
     """
     # Для поля project: мы ожидаем имя проекта (slug_field='name')
     # queryset указывает, какие объекты Project можно выбрать.
-    project = serializers.SlugRelatedField(
-        slug_field='name',
+    # Имя разрешается в id через кэш project_ids, без запроса в базу при попадании.
+    project = CachedSlugRelatedField(
+        slug_cache=project_ids,
         queryset=Project.objects.all(),
     )
 
-    tags = serializers.SlugRelatedField(
-        slug_field='name',
+    tags = CachedSlugRelatedField(
+        slug_cache=tag_ids,
         queryset=Tag.objects.all(),
         many=True,
         required=False,
@@ -51,6 +58,11 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = ['name', 'description', 'deadline', 'priority', 'project', 'tags']
+        # Уникальность (name, project) среди не удаленных задач: условный UniqueConstraint
+        # DRF сам не проверяет, а менеджер по умолчанию уже исключает удаленные задачи
+        validators = [
+            UniqueTogetherValidator(queryset=Task.objects.all(), fields=['name', 'project']),
+        ]
 
     def validate_name(self, value: str):
         if len(value) < 10:
@@ -73,14 +85,6 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
             )
         return value
 
-    # SlugRelatedField сам делает эту валидацию, если queryset указан.
-    def validate_project(self, value: str):
-        if not Project.objects.filter(name=value).exists():
-            raise serializers.ValidationError(
-                'The project does not exist.'
-            )
-        return value
-
     def validate_deadline(self, value: datetime):
         # Проверяем, что дедлайн не в прошлом
         if value < timezone.now():
@@ -102,8 +106,6 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
         # Метод .add() используется для ManyToManyField.
         task.tags.add(*tags)
 
-        task.save() # Сохраняем (хотя .add() обычно сам сохраняет связь, явное save() не повредит)
-
         return task
 
     # Метод update для обработки обновления существующей задачи
@@ -125,7 +127,7 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
 
 
 
-class DetailTaskSerializer(serializers.ModelSerializer):
+class DetailTaskSerializer(FieldSelectionMixin, serializers.ModelSerializer):
     """
         Сериализатор для получения подробной информации о задаче.
         Использует вложенные сериализаторы для project и tags.
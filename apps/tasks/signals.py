@@ -0,0 +1,12 @@
+from django.dispatch import Signal
+
+
+# Массовые операции (bulk_create / bulk_update) не вызывают post_save,
+# поэтому о них сообщаем отдельным сигналом. Аргументы: ids - список id задач,
+# project_ids - проекты, затронутые изменением (включая прежние проекты перенесенных задач).
+tasks_bulk_saved = Signal()
+
+# Пакетное удаление задач (apps/tasks/utils/purge_tasks.py) не загружает экземпляры
+# и не вызывает pre_delete/post_delete. Сигнал отправляется в транзакции удаления,
+# пока строки еще на месте. Аргументы: ids - список id задач, using - база.
+tasks_bulk_deleting = Signal()
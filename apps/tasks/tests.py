@@ -1,3 +1,785 @@
-from django.test import TestCase
+import io
+import json
+import os
+import tempfile
+from datetime import timedelta
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import IntegrityError, connections, router, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from agile_projects.paginations import KeysetPagination
+from agile_projects.response_cache import bump_generation, is_enabled
+from agile_projects.routers import ReplicaRouter, WeightedRoundRobin, replica_reads
+
+from apps.projects.models import Project
+from apps.projects.utils.project_stats import check_project_stats
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.filters.task_filters import ORDERING_CHOICES
+from apps.tasks.models import Task, Tag
+from apps.tasks.querysets.task_queryset import TaskManager
+from apps.tasks.utils import slug_cache
+from apps.tasks.utils.slug_cache import project_ids
+from apps.tasks.views.tag_views import TagListCreateAPIView
+from apps.tasks.views.task_bulk_views import TaskBulkAPIView
+from apps.tasks.views.task_views import TaskListCreateView
+
+
+class TaskQueryCountTestCase(TestCase):
+    """
+    Фиксирует количество SQL-запросов на эндпоинтах задач:
+    оно не должно зависеть от количества задач (нет N+1).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        tags = [Tag.objects.create(name=f'tag-{i}') for i in range(3)]
+        deadline = timezone.now() + timedelta(days=30)
+
+        for i in range(4):
+            project = Project.objects.create(name=f'Project {i}', description='d' * 40)
+            user = User.objects.create(username=f'user{i}', email=f'user{i}@example.com')
+
+            for j in range(25):
+                task = Task.objects.create(
+                    name=f'Task {i}-{j} name',
+                    description='d' * 60,
+                    project=project,
+                    assignee=user,
+                    deadline=deadline + timedelta(hours=j),
+                )
+                task.tags.set(tags)
+
+        cls.task = Task.objects.first()
+
+    def test_list_page_number_mode(self):
+        # COUNT(*) + выборка страницы
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('task-list-create'), {'page_size': 100})
+
+        self.assertEqual(len(response.data['results']), 100)
+        self.assertTrue(response.data['results'][0]['project'].startswith('Project'))
+        self.assertTrue(response.data['results'][0]['assignee'].endswith('@example.com'))
+
+    def test_list_cursor_mode(self):
+        # Только выборка страницы, без COUNT(*)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('task-list-create'), {'cursor': '', 'page_size': 100})
+
+        self.assertEqual(len(response.data['results']), 100)
+
+    def test_list_fields_with_ordering(self):
+        # ModelSerializer путь: only() строится после ?ordering=, колонка сортировки
+        # для курсора уже прочитана (без дозагрузки отложенного поля)
+        params = {'cursor': '', 'page_size': 10, 'fields': 'name', 'ordering': 'priority'}
+        with mock.patch.object(TaskListCreateView, 'fast_serializer_class', None):
+            with self.assertNumQueries(1):
+                response = self.client.get(reverse('task-list-create'), params)
+
+        self.assertEqual(list(response.data['results'][0]), ['name'])
+        self.assertIsNotNone(response.data['next'])
+
+    def test_detail(self):
+        # Задача вместе с проектом + prefetch тегов
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('task-detail-update-delete', args=[self.task.pk]))
+
+        self.assertEqual(len(response.data['tags']), 3)
+        self.assertEqual(response.data['project']['name'], self.task.project.name)
+
+
+class KeysetPaginationTestCase(TestCase):
+    """
+    Keyset пагинация (?cursor=): курсор переживает кодирование без потери точности,
+    записи с одинаковым дедлайном не теряются и не повторяются между страницами,
+    а подмененный курсор отклоняется.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        project = Project.objects.create(name='Keyset project', description='d' * 40)
+        deadline = timezone.now() + timedelta(days=10)
+
+        # По 4 задачи на каждый из трех дедлайнов: страницы режут группы с равным ключом
+        for i in range(12):
+            Task.objects.create(
+                name=f'Keyset task {i:02}',
+                description='d' * 60,
+                project=project,
+                priority=i % 3 + 1,
+                deadline=deadline + timedelta(microseconds=i // 4),
+            )
+
+    def walk(self, **params):
+        ids, cursor, pages = [], '', 0
+        while cursor is not None:
+            response = self.client.get(reverse('task-list-create'), {'cursor': cursor, 'page_size': 5, **params})
+            self.assertEqual(response.status_code, 200)
+            ids.extend(task['id'] for task in response.data['results'])
+            next_link = response.data['next']
+            cursor = next_link and parse_qs(urlsplit(next_link).query)['cursor'][0]
+            pages += 1
+
+        self.assertEqual(pages, 3)
+        return ids
+
+    def test_cursor_round_trip(self):
+        paginator = KeysetPagination()
+        deadline = timezone.now().replace(microsecond=123456)
+
+        cursor = paginator.encode_cursor([deadline, 7])
+
+        self.assertEqual(paginator.decode_cursor(cursor, Task, ['-deadline', '-id']), [deadline, 7])
+
+    def test_ties_on_equal_deadlines(self):
+        expected = list(Task.objects.order_by('-deadline', '-id').values_list('id', flat=True))
+        self.assertEqual(self.walk(), expected)
+
+    def test_tampered_cursor_rejected(self):
+        paginator = KeysetPagination()
+        cursors = [
+            'not-a-cursor',
+            paginator.encode_cursor([1]), # Неверное число значений
+            paginator.encode_cursor(['yesterday', 1]), # Не дата
+            paginator.encode_cursor({'deadline': 1}),
+        ]
+
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                response = self.client.get(reverse('task-list-create'), {'cursor': cursor})
+                self.assertEqual(response.status_code, 404)
+
+
+# Кэш ответов отключен (LocMem): оба пути списка должны выполняться, а не читаться из кэша
+PER_PROCESS_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'response': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+
+@override_settings(CACHES=PER_PROCESS_CACHES)
+class TaskFilterBackendTestCase(TestCase):
+    """
+    TaskFilterBackend: каждый фильтр сужает список в SQL, некорректные параметры дают 400,
+    каждый вариант ?ordering= проходится курсором без пропусков и повторов.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.now = timezone.now()
+        project = Project.objects.create(name='Filter project', description='d' * 40)
+        other = Project.objects.create(name='Other filter project', description='d' * 40)
+        user = User.objects.create(username='filter', email='filter@example.com')
+        tag = Tag.objects.create(name='filter-tag')
+
+        def create(name, **fields):
+            return Task.objects.create(name=name, description='d' * 60, project=project, **fields)
+
+        create('Overdue open', status=Statuses.BLOCKED.value, priority=4, deadline=cls.now - timedelta(days=1))
+        create('Overdue closed', status=Statuses.CLOSED.value, priority=1, deadline=cls.now - timedelta(days=2))
+        create('Assigned', status=Statuses.IN_PROGRESS.value, priority=2, assignee=user,
+               deadline=cls.now + timedelta(days=1))
+        create('Tagged', priority=3, deadline=cls.now + timedelta(days=2)).tags.add(tag)
+        Task.objects.create(name='Other project', description='d' * 60, project=other, priority=5,
+                            deadline=cls.now + timedelta(days=3))
+
+        # Равные значения полей сортировки: курсор должен различать их по id
+        for i in range(6):
+            create(f'Tie {i}', priority=i % 2 + 1, deadline=cls.now + timedelta(days=5))
+
+        deleted = create('Soft deleted', deadline=cls.now + timedelta(days=4))
+        Task.all_objects.filter(pk=deleted.pk).soft_delete()
+
+    def get_names(self, **params) -> set:
+        response = self.client.get(reverse('task-list-create'), {'page_size': 100, **params})
+        self.assertEqual(response.status_code, 200, response.data)
+        return {task['name'] for task in response.data['results']}
+
+    def test_filters(self):
+        ties = {f'Tie {i}' for i in range(6)}
+        cases = [
+            ({'status': 'BLOCKED,CLOSED'}, {'Overdue open', 'Overdue closed'}),
+            ({'priority_min': 3}, {'Overdue open', 'Tagged', 'Other project'}),
+            ({'priority_max': 1}, {'Overdue closed', 'Tie 0', 'Tie 2', 'Tie 4'}),
+            ({'priority_min': 2, 'priority_max': 2}, {'Assigned', 'Tie 1', 'Tie 3', 'Tie 5'}),
+            ({'project': 'Other filter project'}, {'Other project'}),
+            ({'assignee': 'filter@example.com'}, {'Assigned'}),
+            ({'tag': 'filter-tag'}, {'Tagged'}),
+            ({'deadline_from': (self.now + timedelta(days=4)).isoformat()}, ties),
+            ({'deadline_to': self.now.isoformat()}, {'Overdue open', 'Overdue closed'}),
+            ({'overdue': 'true'}, {'Overdue open'}),
+            ({'status': 'NEW', 'project': 'Filter project', 'priority_min': 2}, {'Tagged', 'Tie 1', 'Tie 3', 'Tie 5'}),
+        ]
+
+        for params, expected in cases:
+            with self.subTest(params=params):
+                self.assertEqual(self.get_names(**params), expected)
+
+    def test_invalid_params(self):
+        cases = [
+            {'status': 'DONE'},
+            {'priority_min': 9},
+            {'priority_min': 3, 'priority_max': 2},
+            {'assignee': 'not-an-email'},
+            {'deadline_from': 'yesterday'},
+            {'deadline_from': self.now.isoformat(), 'deadline_to': (self.now - timedelta(days=1)).isoformat()},
+            {'overdue': 'maybe'},
+            {'ordering': 'name'},
+        ]
+
+        for params in cases:
+            with self.subTest(params=params):
+                response = self.client.get(reverse('task-list-create'), params)
+                self.assertEqual(response.status_code, 400)
+
+    def test_ordering_directions_match_indexes(self):
+        # Поля варианта сортируются в одном направлении (прямой или обратный проход индекса)
+        for key, ordering in ORDERING_CHOICES.items():
+            with self.subTest(ordering=key):
+                self.assertEqual({field.startswith('-') for field in ordering}, {key.startswith('-')})
+
+    def test_each_ordering_walks_without_gaps(self):
+        for key, ordering in ORDERING_CHOICES.items():
+            with self.subTest(ordering=key):
+                expected = list(Task.objects.order_by(*ordering).values_list('id', flat=True))
+
+                ids, cursor = [], ''
+                while cursor is not None:
+                    response = self.client.get(
+                        reverse('task-list-create'), {'cursor': cursor, 'page_size': 3, 'ordering': key},
+                    )
+                    self.assertEqual(response.status_code, 200)
+                    ids.extend(task['id'] for task in response.data['results'])
+                    next_link = response.data['next']
+                    cursor = next_link and parse_qs(urlsplit(next_link).query)['cursor'][0]
+
+                self.assertEqual(ids, expected)
+
+
+@override_settings(CACHES=PER_PROCESS_CACHES)
+class FastSerializerParityTestCase(TestCase):
+    """
+    Быстрые сериализаторы списков (fast_serializers.py) дублируют поля ModelSerializer:
+    ответы обоих путей (разобранный JSON) должны совпадать.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        project = Project.objects.create(name='Parity', description='d' * 40)
+        user = User.objects.create(username='parity', email='parity@example.com')
+        deadline = timezone.now() + timedelta(days=3)
+
+        for i in range(3):
+            Tag.objects.create(name=f'parity-{i}')
+            Task.objects.create(
+                name=f'Parity task {i}',
+                description='d' * 60,
+                project=project,
+                assignee=user if i else None, # Задача без исполнителя -> null
+                deadline=deadline + timedelta(minutes=i, microseconds=i * 1500),
+            )
+
+    def assertSameOutput(self, url_name, params, view_class, attribute='fast_serializer_class'):
+        fast = self.client.get(reverse(url_name), params)
+        with mock.patch.object(view_class, attribute, None):
+            slow = self.client.get(reverse(url_name), params)
+
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(slow.status_code, 200)
+        self.assertEqual(json.loads(fast.content), json.loads(slow.content))
+
+    def test_task_list(self):
+        for params in ({}, {'cursor': ''}, {'fields': 'id,project,deadline'}, {'exclude': 'assignee'}):
+            with self.subTest(params=params):
+                self.assertSameOutput('task-list-create', params, TaskListCreateView)
+
+    def test_tag_list(self):
+        for params in ({}, {'fields': 'name'}):
+            with self.subTest(params=params):
+                self.assertSameOutput('tag-list-create', params, TagListCreateAPIView)
+
+
+class ResponseCacheTestCase(TestCase):
+    """
+    Кэш ответов списка тегов: сброс поколения после изменения данных,
+    ETag/304 и отдельные ключи для разных хостов (абсолютные ссылки next).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Tag.objects.create(name='first')
+        Tag.objects.create(name='second')
+
+    def get_names(self, **params):
+        response = self.client.get(reverse('tag-list-create'), params)
+        return [tag['name'] for tag in response.data['results']]
+
+    def test_invalidated_after_commit(self):
+        self.assertEqual(sorted(self.get_names()), ['first', 'second'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Tag.objects.create(name='third')
+
+        self.assertEqual(sorted(self.get_names()), ['first', 'second', 'third'])
+
+    def test_not_modified(self):
+        etag = self.client.get(reverse('tag-list-create'))['ETag']
+
+        response = self.client.get(reverse('tag-list-create'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    @override_settings(ALLOWED_HOSTS=['a.example', 'b.example'])
+    def test_key_includes_host(self):
+        first = self.client.get(reverse('tag-list-create'), {'page_size': 1}, HTTP_HOST='a.example')
+        second = self.client.get(reverse('tag-list-create'), {'page_size': 1}, HTTP_HOST='b.example')
+
+        self.assertTrue(first.data['next'].startswith('http://a.example/'))
+        self.assertTrue(second.data['next'].startswith('http://b.example/'))
+
+    def test_disabled_on_per_process_backend(self):
+        caches = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}, 'response': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }}
+        with override_settings(CACHES=caches):
+            self.assertFalse(is_enabled())
+            self.get_names()
+            Tag.objects.create(name='third') # Без сброса поколения (нет on_commit)
+            self.assertIn('third', self.get_names())
+
+
+@override_settings(DATABASE_REPLICAS={'replica1': 2, 'replica2': 1})
+class ReplicaRouterTestCase(TransactionTestCase):
+    """
+    Чтение с реплик (replica1/replica2 в тестах - зеркала 'default'):
+    GET списков идут на реплики по взвешенному round-robin, запись и чтение
+    после записи - в primary. TransactionTestCase: данные, созданные в
+    транзакции теста, соединения реплик бы не увидели.
+    """
+    databases = {'default', 'replica1', 'replica2'}
+    aliases = ('default', 'replica1', 'replica2')
+
+    def setUp(self):
+        project = Project.objects.create(name='Replica project', description='d' * 40)
+        Task.objects.create(name='Replica task', description='d' * 60, project=project)
+        Tag.objects.create(name='replica')
+        # Round-robin каждого теста начинается заново
+        for database_router in router.routers:
+            database_router.balancers.clear()
+
+    def count_queries(self, request):
+        contexts = {alias: CaptureQueriesContext(connections[alias]) for alias in self.aliases}
+        for context in contexts.values():
+            context.__enter__()
+        try:
+            response = request()
+        finally:
+            for context in contexts.values():
+                context.__exit__(None, None, None)
+
+        return response, {alias: len(context.captured_queries) for alias, context in contexts.items()}
+
+    def test_weighted_round_robin_order(self):
+        balancer = WeightedRoundRobin({'a': 2, 'b': 1})
+
+        self.assertEqual([balancer.next() for _ in range(6)], ['a', 'b', 'a', 'a', 'b', 'a'])
+
+    def test_list_reads_from_one_replica_per_request(self):
+        used = []
+        for _ in range(3):
+            response, queries = self.count_queries(lambda: self.client.get(reverse('task-list-create')))
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data['count'], 1)
+            self.assertEqual(queries['default'], 0)
+            # COUNT(*) и страница - с одной и той же реплики
+            used.append([alias for alias in ('replica1', 'replica2') if queries[alias]])
+
+        self.assertEqual(used, [['replica1'], ['replica2'], ['replica1']])
+
+    def test_write_goes_to_primary(self):
+        response, queries = self.count_queries(lambda: self.client.post(
+            reverse('tag-list-create'), {'name': 'replica-tag'}, content_type='application/json',
+        ))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertGreater(queries['default'], 0)
+        self.assertEqual(queries['replica1'] + queries['replica2'], 0)
+
+    def test_read_after_write_is_pinned_to_primary(self):
+        replica_router = ReplicaRouter()
+
+        self.assertIsNone(replica_router.db_for_read(Task)) # Вне GET списков - primary
+        with replica_reads():
+            self.assertIn(replica_router.db_for_read(Task), ('replica1', 'replica2'))
+            self.assertEqual(replica_router.db_for_write(Task), 'default')
+            self.assertIsNone(replica_router.db_for_read(Task))
+
+    def test_cache_miss_reads_from_primary(self):
+        # Список тегов кэшируется: промах собирается из primary, попадание не читает БД
+        for _ in range(2):
+            response, queries = self.count_queries(lambda: self.client.get(reverse('tag-list-create')))
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(queries['replica1'] + queries['replica2'], 0)
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(ReplicaRouter().allow_migrate('replica1', 'tasks'))
+        self.assertIsNone(ReplicaRouter().allow_migrate('default', 'tasks'))
+
+
+class SlugCacheTestCase(TestCase):
+    """
+    Кэш "имя -> id": изменения, сделанные другим воркером (без сигналов в этом
+    процессе), видны через общий счетчик поколения.
+    """
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Cached project', description='d' * 40)
+        project_ids.clear()
+
+    def rename_in_other_worker(self, name: str):
+        # UPDATE без сигналов - как будто проект переименовал другой процесс
+        Project.objects.filter(pk=self.project.pk).update(name=name)
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_generation(project_ids.namespace)
+
+    def test_hit_without_query(self):
+        project_ids.get('Cached project')
+
+        # В запросе поколения читаются один раз (одним get_many для всех namespace)
+        slug_cache.start_request()
+        self.addCleanup(slug_cache.finish_request)
+        with self.assertNumQueries(1):
+            project_ids.get('Cached project')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(project_ids.get('Cached project'), self.project.pk)
+
+    def test_create_task_query_count(self):
+        # Теплый кэш: одно чтение поколений, без запросов имен проекта и тегов
+        Tag.objects.create(name='first')
+        Tag.objects.create(name='second')
+
+        def create(name):
+            return self.client.post(reverse('task-list-create'), {
+                'name': name,
+                'description': 'd' * 60,
+                'project': 'Cached project',
+                'tags': ['first', 'second'],
+                'deadline': (timezone.now() + timedelta(days=1)).isoformat(),
+            }, content_type='application/json')
+
+        self.assertEqual(create('Warm up the slug cache').status_code, 201)
+
+        # Поколения (1), UniqueTogetherValidator (1), INSERT задачи, счетчики ProjectStats,
+        # поисковый индекс (2), связи с тегами, теги для ответа
+        with CaptureQueriesContext(connections['default']) as queries:
+            self.assertEqual(create('Created with a warm cache').status_code, 201)
+
+        sql = [query['sql'] for query in queries.captured_queries]
+        self.assertEqual(len(sql), 8)
+        self.assertEqual(sum('response_cache' in statement for statement in sql), 1)
+        self.assertFalse(any('FROM "projects_project"' in statement for statement in sql))
+        self.assertFalse(any('FROM "tasks_tag" WHERE' in statement for statement in sql))
+        self.assertEqual(sum(statement.startswith('UPDATE "tasks_task"') for statement in sql), 0)
+
+    def test_rename_in_other_worker(self):
+        self.assertEqual(project_ids.get('Cached project'), self.project.pk)
+
+        self.rename_in_other_worker('Renamed project')
+
+        self.assertIsNone(project_ids.get('Cached project'))
+        self.assertEqual(project_ids.get('Renamed project'), self.project.pk)
+
+    def test_stale_name_rejected_on_create(self):
+        project_ids.get('Cached project')
+        self.rename_in_other_worker('Renamed project')
+
+        response = self.client.post(reverse('task-list-create'), {
+            'name': 'Task for a renamed project',
+            'description': 'd' * 60,
+            'project': 'Cached project',
+            'deadline': (timezone.now() + timedelta(days=1)).isoformat(),
+        }, content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('project', response.data)
+
+    def test_without_shared_cache_always_queries(self):
+        caches = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}, 'response': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }}
+        with override_settings(CACHES=caches):
+            project_ids.get('Cached project')
+            Project.objects.filter(pk=self.project.pk).update(name='Renamed project')
+
+            self.assertIsNone(project_ids.get('Cached project'))
+
+
+class TaskBulkTestCase(TestCase):
+    """
+    Массовые операции с задачами: JSON и NDJSON, ошибки по номерам строк
+    и лимиты NDJSON, проверяемые во время чтения тела запроса.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(name='Bulk project', description='d' * 40)
+        Tag.objects.create(name='backend')
+
+    def make_row(self, i, **fields):
+        return {
+            'name': f'Bulk task {i:03}',
+            'description': 'd' * 60,
+            'deadline': (timezone.now() + timedelta(days=7)).isoformat(),
+            'project': self.project.name,
+            **fields,
+        }
+
+    def post_ndjson(self, rows):
+        body = '\n'.join(json.dumps(row) for row in rows) + '\n'
+        return self.client.post(reverse('task-bulk'), body, content_type='application/x-ndjson')
+
+    def test_create_json_and_ndjson(self):
+        response = self.client.post(
+            reverse('task-bulk'), [self.make_row(0, tags=['backend'])], content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 1)
+
+        response = self.post_ndjson([self.make_row(1), self.make_row(2)])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Task.objects.filter(project=self.project).count(), 3)
+        self.assertEqual(list(Task.objects.get(name='Bulk task 000').tags.values_list('name', flat=True)), ['backend'])
+
+    def test_errors_reported_per_row(self):
+        # Сначала валидация строк сериализатором, затем проверки всего пакета (проекты, уникальность)
+        response = self.post_ndjson([self.make_row(0), self.make_row(1, name='short')])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['errors'], [{'row': 1, 'errors': mock.ANY}])
+        self.assertIn('name', response.data['errors'][0]['errors'])
+
+        response = self.post_ndjson([self.make_row(0), self.make_row(1, project='Missing'), self.make_row(0)])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error['row'] for error in response.data['errors']], [1, 2])
+        self.assertIn('project', response.data['errors'][0]['errors'])
+        self.assertIn('name', response.data['errors'][1]['errors']) # Дубликат внутри пакета
+        self.assertFalse(Task.objects.exists()) # Пакет не записан частично
+
+    def test_update_and_delete(self):
+        ids = self.post_ndjson([self.make_row(0), self.make_row(1)]).data['ids']
+
+        response = self.client.patch(
+            reverse('task-bulk'), [{'id': ids[0], 'priority': 5}], content_type='application/json',
+        )
+        self.assertEqual((response.status_code, response.data['updated']), (200, 1))
+        self.assertEqual(Task.objects.get(pk=ids[0]).priority, 5)
+
+        response = self.client.delete(reverse('task-bulk'), {'ids': ids}, content_type='application/json')
+        self.assertEqual((response.status_code, response.data['deleted']), (200, 2))
+        self.assertFalse(Task.objects.filter(pk__in=ids).exists())
+
+    def test_ndjson_row_limit(self):
+        with mock.patch.object(TaskBulkAPIView, 'max_rows', 2):
+            response = self.post_ndjson([self.make_row(i) for i in range(3)])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('At most 2 rows', response.data['detail'])
+
+    def test_ndjson_byte_limit(self):
+        rows = [self.make_row(i) for i in range(3)]
+        limit = len(json.dumps(rows[0])) * 2
+
+        with mock.patch.object(TaskBulkAPIView, 'max_body_bytes', limit):
+            response = self.post_ndjson(rows)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(f'exceeds {limit} bytes', response.data['detail'])
+
+
+class SoftDeleteTestCase(TestCase):
+    """
+    "Мягкое" удаление задач: менеджер по умолчанию их скрывает, восстановление
+    проверяет имя, уникальность имени - только среди не удаленных, purge_deleted_tasks
+    удаляет окончательно только старые.
+    """
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Soft delete', description='d' * 40)
+        self.task = self.create_task()
+
+    def create_task(self, name='Soft deleted task'):
+        return Task.objects.create(name=name, description='d' * 60, project=self.project)
+
+    def soft_delete(self, task):
+        response = self.client.delete(reverse('task-detail-update-delete', args=[task.pk]))
+        self.assertEqual(response.status_code, 204)
+
+    def restore(self, task):
+        return self.client.post(reverse('task-restore', args=[task.pk]))
+
+    def test_soft_delete_hides_task(self):
+        self.soft_delete(self.task)
+
+        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
+        self.assertIsNotNone(Task.all_objects.get(pk=self.task.pk).deleted_at)
+        self.assertEqual(Task.all_objects.deleted().count(), 1)
+        response = self.client.get(reverse('task-detail-update-delete', args=[self.task.pk]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_restore(self):
+        self.soft_delete(self.task)
+
+        response = self.restore(self.task)
+
+        self.assertEqual((response.status_code, response.data['id']), (200, self.task.pk))
+        self.assertTrue(Task.objects.filter(pk=self.task.pk).exists())
+        self.assertEqual(self.restore(self.task).status_code, 404) # Уже не удалена
+
+    def test_conditional_uniqueness(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.create_task()
+
+        self.soft_delete(self.task)
+        replacement = self.create_task() # Имя удаленной задачи снова свободно
+
+        response = self.restore(self.task)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('name', response.data)
+        self.assertTrue(Task.objects.filter(pk=replacement.pk).exists())
+
+    def test_restore_race_returns_400(self):
+        # Имя заняли между exists() и save(): IntegrityError превращается в тот же 400
+        self.soft_delete(self.task)
+        self.create_task()
+
+        with mock.patch.object(TaskManager, 'filter', return_value=mock.Mock(exists=lambda: False)):
+            response = self.restore(self.task)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('name', response.data)
+        self.assertIsNotNone(Task.all_objects.get(pk=self.task.pk).deleted_at)
+
+    def test_purge_deleted_tasks(self):
+        old = self.create_task('Deleted long ago')
+        recent = self.create_task('Deleted recently')
+        old.tags.add(Tag.objects.create(name='purged'))
+        for task in (old, recent):
+            self.soft_delete(task)
+        Task.all_objects.filter(pk=old.pk).update(deleted_at=timezone.now() - timedelta(days=31))
+
+        call_command('purge_deleted_tasks', '--dry-run', stdout=io.StringIO())
+        self.assertTrue(Task.all_objects.filter(pk=old.pk).exists())
+
+        # Пачка удаляется одним DELETE, без загрузки задач и сигналов на каждую строку
+        with CaptureQueriesContext(connections['default']) as queries:
+            call_command('purge_deleted_tasks', '--sleep', '0', stdout=io.StringIO())
+        self.assertEqual(
+            sum(query['sql'].startswith('DELETE FROM "tasks_task"') for query in queries.captured_queries), 1,
+        )
+
+        self.assertFalse(Task.all_objects.filter(pk=old.pk).exists())
+        self.assertFalse(Task.tags.through.objects.filter(task_id=old.pk).exists())
+        self.assertTrue(Task.all_objects.filter(pk=recent.pk).exists())
+        self.assertTrue(Task.objects.filter(pk=self.task.pk).exists())
+        self.assertEqual(check_project_stats(), [])
+
+
+class TaskExportCommandTestCase(TestCase):
+    """
+    export_tasks пишет в stdout команды (call_command(..., stdout=...)), а не в sys.stdout.
+    """
+
+    def test_ndjson_and_csv_to_stdout(self):
+        project = Project.objects.create(name='Export project', description='d' * 40)
+        Task.objects.create(name='Exported task', description='d' * 60, project=project)
+
+        output = io.StringIO()
+        call_command('export_tasks', stdout=output)
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([(row['name'], row['project']) for row in rows], [('Exported task', 'Export project')])
+
+        output = io.StringIO()
+        call_command('export_tasks', '--format', 'csv', stdout=output)
+        self.assertEqual(len(output.getvalue().splitlines()), 2) # Заголовок и одна задача
+
+
+class TaskImportCommandTestCase(TestCase):
+    """
+    import_tasks: корректные строки импортируются вместе с тегами, ошибочные выводятся
+    в stderr и пропускаются, повторный импорт того же файла не создает дубликатов.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(name='Import project', description='d' * 40)
+        Tag.objects.create(name='imported')
+
+    def write_file(self, suffix: str, content: str) -> str:
+        with tempfile.NamedTemporaryFile('w', suffix=suffix, delete=False, encoding='utf-8') as f:
+            f.write(content)
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    def import_file(self, path: str):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command('import_tasks', path, '--batch-size', '2', stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_csv_import(self):
+        deadline = (timezone.now() + timedelta(days=7)).isoformat()
+        path = self.write_file('.csv', (
+            'name,description,deadline,priority,project,tags\n'
+            f'First imported task,{"d" * 60},{deadline},4,Import project,imported\n'
+            f'Second imported task,{"d" * 60},{deadline},2,Import project,\n'
+            f'Third imported task,{"d" * 60},{deadline},2,Missing project,\n'
+        ))
+
+        stdout, stderr = self.import_file(path)
+
+        self.assertIn('Imported 2 tasks, skipped 1 rows', stdout)
+        self.assertIn('Row 3:', stderr)
+        task = Task.objects.get(name='First imported task')
+        self.assertEqual((task.project, task.priority), (self.project, 4))
+        self.assertEqual([tag.name for tag in task.tags.all()], ['imported'])
+
+    def test_malformed_rows_are_skipped(self):
+        deadline = (timezone.now() + timedelta(days=7)).isoformat()
+        row = {'name': 'Valid imported task', 'description': 'd' * 60, 'deadline': deadline, 'project': 'Import project'}
+        path = self.write_file('.ndjson', '\n'.join([
+            json.dumps(row),
+            '{not json',
+            json.dumps({**row, 'name': 'Short'}),
+            json.dumps({**row, 'name': 'Wrong priority task', 'priority': 9}),
+        ]))
+
+        stdout, stderr = self.import_file(path)
+
+        self.assertIn('Imported 1 tasks, skipped 3 rows', stdout)
+        self.assertEqual([line.split(':')[0] for line in stderr.splitlines()], ['Row 2', 'Row 3', 'Row 4'])
+        self.assertEqual(list(Task.objects.values_list('name', flat=True)), ['Valid imported task'])
+
+    def test_rerun_is_idempotent(self):
+        deadline = (timezone.now() + timedelta(days=7)).isoformat()
+        path = self.write_file('.ndjson', '\n'.join(
+            json.dumps({
+                'name': f'Rerun imported task {i}', 'description': 'd' * 60,
+                'deadline': deadline, 'project': 'Import project', 'tags': ['imported'],
+            })
+            for i in range(3)
+        ))
+
+        self.import_file(path)
+        stdout, stderr = self.import_file(path)
+
+        # Повторные строки отклоняются уникальностью (name, project)
+        self.assertIn('Imported 0 tasks, skipped 3 rows', stdout)
+        self.assertEqual(Task.objects.count(), 3)
+        self.assertEqual(Task.tags.through.objects.count(), 3)
+        self.assertEqual(check_project_stats(), [])
@@ -1,10 +1,15 @@
 from django.urls import path
 from apps.tasks.views.tag_views import *
-from apps.tasks.views.task_views import TaskListCreateView, TaskDetailUpdateDeleteView
+from apps.tasks.views.task_bulk_views import TaskBulkAPIView
+from apps.tasks.views.task_export_views import TaskExportAPIView
+from apps.tasks.views.task_views import TaskListCreateView, TaskDetailUpdateDeleteView, TaskRestoreAPIView
 
 urlpatterns = [
     path('', TaskListCreateView.as_view(), name='task-list-create'),
+    path('bulk/', TaskBulkAPIView.as_view(), name='task-bulk'),
+    path('export/', TaskExportAPIView.as_view(), name='task-export'),
     path('<int:pk>/', TaskDetailUpdateDeleteView.as_view(), name='task-detail-update-delete'),
+    path('<int:pk>/restore/', TaskRestoreAPIView.as_view(), name='task-restore'),
     path('tags/', TagListCreateAPIView.as_view(), name='tag-list-create'),
     path('tags/<int:pk>/', TagDetailUpdateDeleteAPIView.as_view(), name='tag-detail-update-delete'),
 ]
@@ -0,0 +1,220 @@
+from django.db import transaction
+from django.utils import timezone
+
+from apps.tasks.models import Task
+from apps.tasks.signals import tasks_bulk_saved
+from apps.tasks.utils import slug_cache
+
+
+# Ограничение на количество строк в одном запросе, чтобы держать память в разумных пределах
+MAX_BULK_ROWS = 10_000
+# Ограничение на размер NDJSON тела запроса (проверяется во время чтения потока)
+MAX_BULK_BYTES = 10 * 1024 * 1024
+# Размер пачки для bulk_create / bulk_update
+BATCH_SIZE = 1000
+
+
+class BulkTaskError(Exception):
+    """
+    Ошибки валидации массовой операции.
+    errors - список словарей вида {'row': <номер строки>, 'errors': {...}}.
+    """
+    def __init__(self, errors: list[dict]):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def resolve_project_ids(names) -> dict[str, int]:
+    """
+    Возвращает {имя проекта: id}. Промахи кэша разрешаются одним запросом.
+    """
+    return slug_cache.project_ids.get_many(names)
+
+
+def resolve_tag_ids(names) -> dict[str, int]:
+    """
+    Возвращает {имя тега: id}. Промахи кэша разрешаются одним запросом.
+    Имена тегов не уникальны, поэтому при совпадении берется тег с наименьшим id.
+    """
+    return slug_cache.tag_ids.get_many(names)
+
+
+def collect_errors(rows: list[dict], project_ids: dict, tag_ids: dict) -> dict[int, dict]:
+    # Проверяем, что все проекты и теги из пакета существуют
+    errors = {}
+
+    for index, row in enumerate(rows):
+        if 'project' in row and row['project'] not in project_ids:
+            errors.setdefault(index, {})['project'] = ['The project does not exist.']
+
+        unknown_tags = [name for name in row.get('tags', []) if name not in tag_ids]
+        if unknown_tags:
+            errors.setdefault(index, {})['tags'] = [f'Tags do not exist: {unknown_tags}.']
+
+    return errors
+
+
+def check_unique_names(keys: list[tuple[int, str, int]], errors: dict, exclude_ids=()):
+    """
+    Проверяет уникальность (name, project) для строк пакета одним запросом.
+    :param keys: список (номер строки, имя задачи, id проекта)
+    """
+    existing = set(
+        Task.objects.filter(
+            name__in={name for _, name, _ in keys},
+            project_id__in={project_id for _, _, project_id in keys},
+        ).exclude(id__in=exclude_ids).values_list('name', 'project_id')
+    )
+
+    for index, name, project_id in keys:
+        if (name, project_id) in existing:
+            errors.setdefault(index, {})['name'] = ['A task with this name already exists in the project.']
+        existing.add((name, project_id))  # Дубликаты внутри самого пакета
+
+
+def raise_for_errors(errors: dict):
+    if errors:
+        raise BulkTaskError([
+            {'row': index, 'errors': row_errors} for index, row_errors in sorted(errors.items())
+        ])
+
+
+def set_tags(task_tags: dict[int, list[int]], replace=False):
+    """
+    Записывает связи задача-тег одним bulk_create в связующую таблицу.
+    :param task_tags: {id задачи: [id тегов]}
+    """
+    through = Task.tags.through
+
+    if replace:
+        through.objects.filter(task_id__in=task_tags).delete()
+
+    through.objects.bulk_create(
+        [
+            through(task_id=task_id, tag_id=tag_id)
+            for task_id, tag_ids in task_tags.items()
+            for tag_id in set(tag_ids)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+
+def bulk_create_tasks(rows: list[dict], batch_size=BATCH_SIZE) -> list[Task]:
+    """
+    Создает задачи из провалидированных строк BulkCreateTaskSerializer.
+    Проекты и теги разрешаются одним запросом каждый, запись - одной транзакцией.
+    """
+    project_ids = resolve_project_ids(row['project'] for row in rows)
+    tag_ids = resolve_tag_ids(name for row in rows for name in row.get('tags', []))
+
+    errors = collect_errors(rows, project_ids, tag_ids)
+    check_unique_names(
+        [
+            (index, row['name'], project_ids[row['project']])
+            for index, row in enumerate(rows) if row['project'] in project_ids
+        ],
+        errors,
+    )
+    raise_for_errors(errors)
+
+    tasks = []
+    for row in rows:
+        fields = {key: value for key, value in row.items() if key not in ('project', 'tags')}
+        tasks.append(Task(project_id=project_ids[row['project']], **fields))
+
+    with transaction.atomic():
+        tasks = Task.objects.bulk_create(tasks, batch_size=batch_size)
+
+        set_tags({
+            task.id: [tag_ids[name] for name in row['tags']]
+            for task, row in zip(tasks, rows) if row.get('tags')
+        })
+
+        tasks_bulk_saved.send(
+            sender=Task,
+            ids=[task.id for task in tasks],
+            project_ids={task.project_id for task in tasks},
+        )
+
+    return tasks
+
+
+def bulk_update_tasks(rows: list[dict], batch_size=BATCH_SIZE) -> list[Task]:
+    """
+    Обновляет задачи из провалидированных строк BulkUpdateTaskSerializer.
+    Переданные tags полностью заменяют теги задачи.
+    """
+    errors = {}
+
+    tasks = Task.objects.in_bulk([row['id'] for row in rows])
+    seen_ids = set()
+    for index, row in enumerate(rows):
+        if row['id'] not in tasks:
+            errors.setdefault(index, {})['id'] = ['Task not found.']
+        elif row['id'] in seen_ids:
+            errors.setdefault(index, {})['id'] = ['Duplicate task id in the request.']
+        seen_ids.add(row['id'])
+
+    project_ids = resolve_project_ids(row['project'] for row in rows if 'project' in row)
+    tag_ids = resolve_tag_ids(name for row in rows for name in row.get('tags', []))
+    errors.update({
+        index: {**errors.get(index, {}), **row_errors}
+        for index, row_errors in collect_errors(rows, project_ids, tag_ids).items()
+    })
+    raise_for_errors(errors)
+
+    # Проекты до изменения: задачи могут быть перенесены в другой проект
+    old_project_ids = {task.project_id for task in tasks.values()}
+
+    fields = {'updated_at'}  # bulk_update не обновляет auto_now поля сам
+    now = timezone.now()
+    keys = []
+
+    for index, row in enumerate(rows):
+        task = tasks[row['id']]
+        for key, value in row.items():
+            if key in ('id', 'tags'):
+                continue
+            if key == 'project':
+                task.project_id = project_ids[value]
+            else:
+                setattr(task, key, value)
+            fields.add(key)
+
+        task.updated_at = now
+        keys.append((index, task.name, task.project_id))
+
+    check_unique_names(keys, errors, exclude_ids=list(tasks))
+    raise_for_errors(errors)
+
+    updated = [tasks[row['id']] for row in rows]
+
+    with transaction.atomic():
+        Task.objects.bulk_update(updated, sorted(fields), batch_size=batch_size)
+
+        task_tags = {row['id']: [tag_ids[name] for name in row['tags']] for row in rows if 'tags' in row}
+        if task_tags:
+            set_tags(task_tags, replace=True)
+
+        tasks_bulk_saved.send(
+            sender=Task,
+            ids=[task.id for task in updated],
+            project_ids=old_project_ids | {task.project_id for task in updated},
+        )
+
+    return updated
+
+
+def bulk_delete_tasks(ids: list[int]) -> int:
+    """
+    "Мягко" удаляет задачи по списку id одним UPDATE. Возвращает количество удаленных задач.
+    Окончательно строки удаляет purge_deleted_tasks.
+    """
+    with transaction.atomic():
+        tasks = Task.objects.filter(id__in=ids)
+        project_ids = set(tasks.values_list('project_id', flat=True))
+        deleted = tasks.soft_delete()
+
+        tasks_bulk_saved.send(sender=Task, ids=list(ids), project_ids=project_ids)
+
+    return deleted
@@ -0,0 +1,54 @@
+from collections import defaultdict
+
+from apps.tasks.models import Task
+
+
+# Колонки экспорта задач
+TASK_EXPORT_FIELDS = ['id', 'name', 'status', 'priority', 'deadline', 'project', 'assignee', 'tags']
+
+# Размер пачки строк, читаемых из базы за один раз
+EXPORT_CHUNK_SIZE = 2000
+
+
+def get_tags(task_ids) -> dict[int, list[str]]:
+    """
+    Возвращает {id задачи: [имена тегов]} одним запросом для пачки задач.
+    """
+    tags = defaultdict(list)
+    rows = Task.tags.through.objects.filter(task_id__in=task_ids).values_list('task_id', 'tag__name')
+
+    for task_id, tag_name in rows:
+        tags[task_id].append(tag_name)
+
+    return tags
+
+
+def iter_task_rows(queryset=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Генератор кортежей задач в порядке TASK_EXPORT_FIELDS.
+    Задачи читаются через values_list().iterator() без создания экземпляров моделей,
+    теги подгружаются одним запросом на каждую пачку.
+    """
+    if queryset is None:
+        queryset = Task.objects.all()
+
+    rows = queryset.order_by('id').values_list(
+        'id', 'name', 'status', 'priority', 'deadline', 'project__name', 'assignee__email',
+    ).iterator(chunk_size=chunk_size)
+
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield from attach_tags(chunk)
+            chunk = []
+
+    if chunk:
+        yield from attach_tags(chunk)
+
+
+def attach_tags(chunk):
+    tags = get_tags([row[0] for row in chunk])
+
+    for row in chunk:
+        yield (*row, tags.get(row[0], []))
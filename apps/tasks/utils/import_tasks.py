@@ -0,0 +1,77 @@
+import csv
+import json
+from itertools import islice
+
+from apps.tasks.serializers.task_bulk_serializers import BulkCreateTaskSerializer
+
+
+# Колонки, которые читаются из файла импорта (остальные игнорируются)
+TASK_IMPORT_FIELDS = ['name', 'description', 'deadline', 'priority', 'project', 'tags']
+
+
+def read_ndjson(stream):
+    """
+    Генератор строк из NDJSON файла. Некорректный JSON возвращается как есть (строкой),
+    чтобы он попал в отчет об ошибках валидации, а не прервал импорт.
+    """
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield line
+
+
+def read_csv(stream):
+    """
+    Генератор строк из CSV файла с заголовком. Теги разделяются через ';'
+    (тот же формат, что и у export_tasks).
+    """
+    for row in csv.DictReader(stream):
+        row = {key: value for key, value in row.items() if key in TASK_IMPORT_FIELDS and value not in (None, '')}
+        if 'tags' in row:
+            row['tags'] = [tag for tag in row['tags'].split(';') if tag]
+        yield row
+
+
+def batched(rows, batch_size):
+    """
+    Разбивает генератор на пачки: (номер первой строки, [строки]).
+    """
+    rows = iter(rows)
+    start = 0
+
+    while batch := list(islice(rows, batch_size)):
+        yield start, batch
+        start += len(batch)
+
+
+def validate_batch(batch):
+    """
+    Валидирует пачку строк по правилам CreateUpdateTaskSerializer (без запросов в базу).
+    Функция не зависит от состояния процесса, поэтому может выполняться в пуле процессов.
+    :return: (номер первой строки, [(номер строки, данные)], [(номер строки, ошибки)])
+    """
+    start, rows = batch
+
+    # Один сериализатор на всю пачку: поля строятся один раз, а не для каждой строки
+    serializer = BulkCreateTaskSerializer(data=rows, many=True)
+    if serializer.is_valid():
+        return start, list(enumerate(map(dict, serializer.validated_data), start=start)), []
+
+    valid, errors = [], []
+    for index, (row, row_errors) in enumerate(zip(rows, serializer.errors), start=start):
+        if row_errors:
+            errors.append((index, json.loads(json.dumps(row_errors))))
+        else:
+            valid.append((index, row))
+
+    # Строки без ошибок валидируются повторно, чтобы получить validated_data
+    if valid:
+        serializer = BulkCreateTaskSerializer(data=[row for _, row in valid], many=True)
+        serializer.is_valid()
+        valid = [(index, dict(data)) for (index, _), data in zip(valid, serializer.validated_data)]
+
+    return start, valid, errors
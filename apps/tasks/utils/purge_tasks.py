@@ -0,0 +1,60 @@
+import time
+
+from django.db import router, transaction
+
+from apps.tasks.models import Task
+from apps.tasks.signals import tasks_bulk_deleting
+
+
+def delete_tasks(ids) -> int:
+    """
+    Удаляет задачи по id без загрузки экземпляров и сигналов на каждую строку:
+    получатели tasks_bulk_deleting обновляют поисковый индекс, счетчики и кэш
+    ответов один раз на всю пачку, связи с тегами удаляются одним DELETE,
+    сами задачи - _raw_delete. Вызывать внутри транзакции.
+    """
+    using = router.db_for_write(Task)
+    tasks = Task.all_objects.using(using).filter(pk__in=ids)
+
+    tasks_bulk_deleting.send(sender=Task, ids=ids, using=using)
+    Task.tags.through.objects.using(using).filter(task_id__in=ids)._raw_delete(using)
+    return tasks._raw_delete(using)
+
+
+def delete_in_batches(queryset, batch_size: int = 1000, pause: float = 0.1, delete=None):
+    """
+    Удаляет строки queryset пачками по batch_size, каждая пачка - отдельная
+    короткая транзакция, между пачками - пауза pause секунд. Так удаление сотен
+    тысяч строк не держит блокировку базы (в SQLite - всю базу) на секунды
+    и оставляет окно для других запросов. Генератор: отдает количество строк в каждой пачке.
+    delete(ids) - удаление пачки вместо QuerySet.delete() (для задач - delete_tasks).
+    """
+    model = queryset.model
+    last_pk = None
+
+    while True:
+        # Keyset по pk: каждая пачка начинается после последней, без повторного
+        # просмотра уже удаленных строк
+        batch = queryset.order_by('pk')
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+
+        ids = list(batch.values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return
+        last_pk = ids[-1]
+
+        with transaction.atomic():
+            if delete is not None:
+                deleted = delete(ids)
+            else:
+                # Через _base_manager: удаляем и "мягко" удаленные строки, сигналы и каскады сохраняются
+                _, counts = model._base_manager.filter(pk__in=ids).delete()
+                deleted = counts.get(model._meta.label, 0)
+
+        yield deleted
+
+        if len(ids) < batch_size:
+            return
+
+        time.sleep(pause)
@@ -0,0 +1,130 @@
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+
+from django.conf import settings
+
+from agile_projects import response_cache
+from apps.projects.models import Project
+from apps.tasks.models import Tag
+
+
+# Поколения namespace всех SlugCache, прочитанные в текущем запросе: общий кэш
+# читается не больше одного раза за запрос (одним get_many), а не на каждое имя.
+# None - вне запроса (команды, shell): поколения читаются при каждой проверке
+_request_generations = ContextVar('slug_cache_request_generations', default=None)
+
+_namespaces = []
+
+
+def start_request():
+    # request_started (apps/tasks/receivers.py): поколения еще не прочитаны
+    _request_generations.set({})
+
+
+def finish_request():
+    _request_generations.set(None)
+
+
+def get_generations() -> dict:
+    generations = _request_generations.get()
+    if generations: # Уже прочитаны в этом запросе
+        return generations
+
+    fetched = response_cache.get_generations(_namespaces)
+    if generations is not None: # В запросе - запоминаем до его конца
+        _request_generations.set(fetched)
+    return fetched
+
+
+class SlugCache:
+    """
+    Локальный для процесса LRU кэш "имя -> id" с ограниченным размером.
+    Кэшируются только найденные имена. Изменение или удаление объекта в этом
+    процессе сбрасывает запись сразу, а в других воркерах - через счетчик поколения
+    namespace в общем кэше (agile_projects/response_cache.py), который сверяется
+    один раз за запрос: при его изменении локальные записи очищаются.
+    Без общего кэша имена всегда разрешаются запросом.
+    """
+    def __init__(self, model, namespace: str, slug_field='name', maxsize=1024):
+        self.model = model
+        self.namespace = namespace
+        self.slug_field = slug_field
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._generation = None
+        self._lock = threading.Lock()
+        _namespaces.append(namespace)
+
+    def sync(self) -> bool:
+        """
+        Сверяет поколение с общим кэшем. False - общего кэша нет, локальным записям верить нельзя.
+        """
+        if not response_cache.is_enabled():
+            return False
+
+        generation = get_generations()[self.namespace]
+        with self._lock:
+            if generation != self._generation:
+                self._data.clear()
+                self._generation = generation
+
+        return True
+
+    def __deepcopy__(self, memo):
+        # DRF копирует аргументы полей сериализатора при каждом создании сериализатора,
+        # а кэш должен оставаться общим для процесса
+        return self
+
+    def get_many(self, names) -> dict:
+        """
+        Возвращает {имя: id} для найденных имен. Промахи разрешаются одним запросом.
+        """
+        names = set(names)
+        found = {}
+        shared = self.sync()
+
+        with self._lock:
+            for name in names if shared else ():
+                if name in self._data:
+                    self._data.move_to_end(name)
+                    found[name] = self._data[name]
+
+        missing = names - found.keys()
+        if missing:
+            # Имена тегов не уникальны: при совпадении берем объект с наименьшим id
+            rows = (
+                self.model.objects.filter(**{f'{self.slug_field}__in': missing})
+                .order_by('-id')
+                .values_list(self.slug_field, 'id')
+            )
+            loaded = dict(rows)
+            found.update(loaded)
+
+            with self._lock:
+                for name, object_id in loaded.items() if shared else ():
+                    self._data[name] = object_id
+                    self._data.move_to_end(name)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+        return found
+
+    def get(self, name):
+        return self.get_many([name]).get(name)
+
+    def invalidate(self, object_id):
+        # Имя объекта могло измениться, поэтому ищем запись по id
+        with self._lock:
+            for name in [name for name, cached_id in self._data.items() if cached_id == object_id]:
+                del self._data[name]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+SLUG_CACHE_SIZE = getattr(settings, 'SLUG_CACHE_SIZE', 1024)
+
+project_ids = SlugCache(Project, 'slugs:projects', maxsize=SLUG_CACHE_SIZE)
+tag_ids = SlugCache(Tag, 'slugs:tags', maxsize=SLUG_CACHE_SIZE)
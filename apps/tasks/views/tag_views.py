@@ -4,34 +4,28 @@ from rest_framework import status # Для использования HTTP-ко
 from rest_framework.views import APIView # Базовый класс для наших API-представлений
 from rest_framework.generics import get_object_or_404
 
+from agile_projects.renderers import FAST_RENDERER_CLASSES # Рендерер на orjson для списка
+from agile_projects.response_cache import cached_response # Кэш ответов списка
+from agile_projects.views import MaterializedListAPIView, ReplicaReadMixin # Базовый класс списков, чтение с реплик
+
 from apps.tasks.models.tag import Tag # Импортируем модель Tag
 from apps.tasks.serializers.tag_serializers import TagSerializer # Импортируем наш сериализатор
+from apps.tasks.serializers.fast_serializers import FastTagSerializer # Быстрый сериализатор списка
+
 
+class TagListCreateAPIView(ReplicaReadMixin, MaterializedListAPIView):
+    serializer_class = TagSerializer
+    fast_serializer_class = FastTagSerializer
+    renderer_classes = FAST_RENDERER_CLASSES
 
-class TagListCreateAPIView(APIView):
     # Вспомогательный метод для получения всех объектов Tag
-    def get_objects(self):
+    def get_queryset(self):
         return Tag.objects.all()
 
 
-    # Метод GET для получения списка всех тегов
+    # Метод GET для получения списка всех тегов (ответ кэшируется до изменения тегов)
     def get(self, request: Request) -> Response:
-        tags = self.get_objects() # Получаем все теги
-
-        if not tags.exists(): # Если тегов нет, возвращаем пустой список и статус 204 No Content
-            return Response(
-                data=[],
-                status=status.HTTP_204_NO_CONTENT
-            )
-
-        # Сериализуем полученные теги. many=True указывает, что это список объектов.
-        serializer = TagSerializer(tags, many=True)
-
-        # Возвращаем сериализованные данные с HTTP-статусом 200 OK
-        return Response(
-            serializer.data,
-            status=status.HTTP_200_OK,
-        )
+        return cached_response(request, ('tags',), lambda: self.list(request))
 
     # Метод POST для создания нового тега
     def post(self, request: Request) -> Response:
@@ -55,7 +49,7 @@ class TagListCreateAPIView(APIView):
         )
 
 
-class TagDetailUpdateDeleteAPIView(APIView):
+class TagDetailUpdateDeleteAPIView(ReplicaReadMixin, APIView):
     # Вспомогательный метод для получения конкретного объекта Tag по его ID (pk)
     def get_object(self, pk: int) -> Tag:
         return get_object_or_404(Tag, pk=pk) # Используем get_object_or_404
@@ -0,0 +1,86 @@
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from agile_projects.parsers import NDJSONParser
+from apps.tasks.serializers.task_bulk_serializers import (
+    BulkCreateTaskSerializer,
+    BulkUpdateTaskSerializer,
+    BulkDeleteTaskSerializer,
+)
+from apps.tasks.utils.bulk_tasks import (
+    MAX_BULK_BYTES,
+    MAX_BULK_ROWS,
+    BulkTaskError,
+    bulk_create_tasks,
+    bulk_update_tasks,
+    bulk_delete_tasks,
+)
+
+
+class TaskBulkAPIView(APIView):
+    """
+    Массовое создание (POST), обновление (PATCH) и удаление (DELETE) задач.
+    Принимает JSON массив или NDJSON поток. Сначала валидируется весь пакет,
+    и только если ошибок нет - все строки записываются одной транзакцией.
+    """
+    parser_classes = [JSONParser, NDJSONParser]
+    # Лимиты NDJSONParser: превышение - 400 еще до чтения всего тела
+    max_rows = MAX_BULK_ROWS
+    max_body_bytes = MAX_BULK_BYTES
+
+    def get_rows(self, request: Request, serializer_class, partial=False) -> list[dict]:
+        rows = request.data
+
+        if not isinstance(rows, list):
+            raise ValidationError('Expected a list of tasks.')
+
+        if len(rows) > self.max_rows:
+            raise ValidationError(f'At most {self.max_rows} tasks per request.')
+
+        validated, errors = [], []
+        for index, row in enumerate(rows):
+            serializer = serializer_class(data=row, partial=partial)
+
+            if serializer.is_valid():
+                validated.append(serializer.validated_data)
+            else:
+                errors.append({'row': index, 'errors': serializer.errors})
+
+        if errors:
+            raise BulkTaskError(errors)
+
+        return validated
+
+    # Метод POST для массового создания задач
+    def post(self, request: Request) -> Response:
+        try:
+            tasks = bulk_create_tasks(self.get_rows(request, BulkCreateTaskSerializer))
+        except BulkTaskError as exc:
+            return Response({'errors': exc.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {'created': len(tasks), 'ids': [task.id for task in tasks]},
+            status=status.HTTP_201_CREATED,
+        )
+
+    # Метод PATCH для массового (частичного) обновления задач
+    def patch(self, request: Request) -> Response:
+        try:
+            tasks = bulk_update_tasks(self.get_rows(request, BulkUpdateTaskSerializer, partial=True))
+        except BulkTaskError as exc:
+            return Response({'errors': exc.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({'updated': len(tasks)}, status=status.HTTP_200_OK)
+
+    # Метод DELETE для массового удаления задач по списку id: {"ids": [1, 2, 3]}
+    def delete(self, request: Request) -> Response:
+        serializer = BulkDeleteTaskSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        deleted = bulk_delete_tasks(serializer.validated_data['ids'])
+
+        return Response({'deleted': deleted}, status=status.HTTP_200_OK)
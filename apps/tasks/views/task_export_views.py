@@ -0,0 +1,26 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from agile_projects.exports import EXPORT_FORMATS, streaming_export_response
+from apps.tasks.filters.task_filters import TaskFilterBackend
+from apps.tasks.models import Task
+from apps.tasks.utils.export_tasks import TASK_EXPORT_FIELDS, iter_task_rows
+
+
+class TaskExportAPIView(APIView):
+    """
+    Потоковый экспорт всех задач в NDJSON (по умолчанию) или CSV: ?file_format=csv.
+    Поддерживает те же фильтры, что и список задач.
+    """
+    def get(self, request: Request):
+        export_format = request.query_params.get('file_format', 'ndjson')
+
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({'file_format': f'Must be one of: {list(EXPORT_FORMATS)}.'})
+
+        queryset = TaskFilterBackend().filter_queryset(request, Task.objects.all(), self)
+
+        return streaming_export_response(
+            iter_task_rows(queryset), TASK_EXPORT_FIELDS, export_format, filename='tasks',
+        )
@@ -1,25 +1,103 @@
-from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView, get_object_or_404
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from agile_projects.paginations import TasksPagination
+from agile_projects.renderers import FAST_RENDERER_CLASSES
+from agile_projects.views import FieldSelectionViewMixin, ReplicaReadMixin
+from apps.tasks.filters.task_filters import TaskFilterBackend
 from apps.tasks.models import Task
+from apps.tasks.serializers.fast_serializers import FastListTaskSerializer
 from apps.tasks.serializers.task_serializers import CreateUpdateTaskSerializer, ListTaskSerializer, DetailTaskSerializer
 
 
-class TaskListCreateView(ListCreateAPIView):
+class TaskListCreateView(ReplicaReadMixin, FieldSelectionViewMixin, ListCreateAPIView):
     pagination_class = TasksPagination
+    renderer_classes = FAST_RENDERER_CLASSES
+    # Быстрый путь списка (вывод совпадает с ListTaskSerializer, см. тесты); None - ListTaskSerializer
+    fast_serializer_class = FastListTaskSerializer
+    # Фильтры и сортировка (?status=, ?priority_min=, ?ordering= и т.д.) выполняются в SQL
+    filter_backends = [TaskFilterBackend]
 
     queryset = Task.objects.all()
 
+    def get_queryset(self):
+        # План запроса выбирается под сериализатор, чтобы избежать N+1
+        if self.request.method == 'GET':
+            return Task.objects.for_list()
+        return Task.objects.for_write()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        # ?fields= / ?exclude= сужают план только после фильтров и ?ordering=: only() должен
+        # включать колонки сортировки для курсора. Быстрый путь сам выбирает колонки через values()
+        if self.request.method == 'GET' and self.fast_serializer_class is None:
+            return self.select_fields(queryset, ListTaskSerializer)
+        return queryset
+
     def get_serializer_class(self):
         if self.request.method == 'GET':
             return ListTaskSerializer
         return CreateUpdateTaskSerializer
 
+    def list(self, request, *args, **kwargs):
+        if self.fast_serializer_class is None:
+            return super().list(request, *args, **kwargs)
+
+        # Быстрый путь: values() и скомпилированная функция строки вместо ListTaskSerializer
+        # (вывод тот же, см. benchmark_serializers)
+        serializer = self.fast_serializer_class(**self.get_field_selection())
+        queryset = serializer.values(self.filter_queryset(self.get_queryset()))
 
-class TaskDetailUpdateDeleteView(RetrieveUpdateDestroyAPIView):
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(serializer.serialize(page))
+
+
+class TaskDetailUpdateDeleteView(FieldSelectionViewMixin, RetrieveUpdateDestroyAPIView):
     queryset = Task.objects.all()
 
+    def get_queryset(self):
+        if self.request.method == 'GET':
+            return self.select_fields(Task.objects.for_detail(), DetailTaskSerializer)
+        if self.request.method == 'DELETE':
+            return Task.objects.all()
+        return Task.objects.for_write()
+
     def get_serializer_class(self):
         if self.request.method == 'GET':
             return DetailTaskSerializer
         return CreateUpdateTaskSerializer
+
+    def perform_destroy(self, instance: Task):
+        # "Мягкое" удаление: задача скрывается менеджером по умолчанию,
+        # строка удаляется позже пачками (purge_deleted_tasks)
+        instance.deleted_at = timezone.now()
+        instance.save(update_fields=['deleted_at', 'updated_at'])
+
+
+class TaskRestoreAPIView(APIView):
+    """
+    Восстановление "мягко" удаленной задачи (пока ее не удалил purge_deleted_tasks).
+    """
+    def post(self, request: Request, pk) -> Response:
+        task = get_object_or_404(Task.all_objects.deleted(), pk=pk)
+
+        # Имя могло быть занято новой задачей проекта, пока эта была удалена
+        name_taken = ValidationError({'name': ['A task with this name already exists in the project.']})
+        if Task.objects.filter(project_id=task.project_id, name=task.name).exists():
+            raise name_taken
+
+        task.deleted_at = None
+        try:
+            # Между проверкой и сохранением имя может занять параллельный запрос:
+            # окончательно решает условный UniqueConstraint (task_name_project_live_uniq)
+            with transaction.atomic():
+                task.save(update_fields=['deleted_at', 'updated_at'])
+        except IntegrityError:
+            raise name_taken
+
+        return Response(DetailTaskSerializer(Task.objects.for_detail().get(pk=task.pk)).data)